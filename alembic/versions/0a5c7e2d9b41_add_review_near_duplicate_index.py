@@ -0,0 +1,54 @@
+"""add review near-duplicate index
+
+Revision ID: 0a5c7e2d9b41
+Revises: f6a1d3b8e924
+Create Date: 2025-11-18 10:15:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0a5c7e2d9b41"
+down_revision: str | Sequence[str] | None = "f6a1d3b8e924"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("reviews", sa.Column("minhash", postgresql.ARRAY(sa.BigInteger()), nullable=True))
+    op.add_column("reviews", sa.Column("duplicate_of", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "reviews_duplicate_of_fkey",
+        "reviews",
+        "reviews",
+        ["duplicate_of"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(op.f("ix_reviews_duplicate_of"), "reviews", ["duplicate_of"], unique=False)
+
+    op.create_table(
+        "review_lsh_bands",
+        sa.Column("app_id", sa.String(length=255), nullable=False),
+        sa.Column("band", sa.Integer(), nullable=False),
+        sa.Column("band_hash", sa.BigInteger(), nullable=False),
+        sa.Column("review_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["review_id"], ["reviews.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("app_id", "band", "band_hash", "review_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("review_lsh_bands")
+    op.drop_index(op.f("ix_reviews_duplicate_of"), table_name="reviews")
+    op.drop_constraint("reviews_duplicate_of_fkey", "reviews", type_="foreignkey")
+    op.drop_column("reviews", "duplicate_of")
+    op.drop_column("reviews", "minhash")
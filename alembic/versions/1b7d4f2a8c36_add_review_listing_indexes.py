@@ -0,0 +1,44 @@
+"""add review listing indexes
+
+Revision ID: 1b7d4f2a8c36
+Revises: 0a5c7e2d9b41
+Create Date: 2025-11-19 09:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1b7d4f2a8c36"
+down_revision: str | Sequence[str] | None = "0a5c7e2d9b41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (app_id, date, id) covers everything (app_id, date) did, plus the keyset tiebreaker
+    op.create_index("ix_reviews_app_id_date_id", "reviews", ["app_id", "date", "id"], unique=False)
+    op.drop_index("ix_reviews_app_id_date", table_name="reviews")
+    op.create_index(
+        "ix_reviews_app_id_rating_date_id",
+        "reviews",
+        ["app_id", "rating", "date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_reviews_app_id_is_analyzed_date_id",
+        "reviews",
+        ["app_id", "is_analyzed", "date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_app_id_is_analyzed_date_id", table_name="reviews")
+    op.drop_index("ix_reviews_app_id_rating_date_id", table_name="reviews")
+    op.create_index("ix_reviews_app_id_date", "reviews", ["app_id", "date"], unique=False)
+    op.drop_index("ix_reviews_app_id_date_id", table_name="reviews")
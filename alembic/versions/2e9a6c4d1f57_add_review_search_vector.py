@@ -0,0 +1,51 @@
+"""add review search vector
+
+Revision ID: 2e9a6c4d1f57
+Revises: 1b7d4f2a8c36
+Create Date: 2025-11-20 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2e9a6c4d1f57"
+down_revision: str | Sequence[str] | None = "1b7d4f2a8c36"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: existing rows are computed once, here
+    op.add_column(
+        "reviews",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(text, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_reviews_search_vector",
+        "reviews",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_search_vector", table_name="reviews")
+    op.drop_column("reviews", "search_vector")
@@ -0,0 +1,51 @@
+"""add analysis jobs table
+
+Revision ID: 3a7c91d2b5f0
+Revises: ff9349e35b20
+Create Date: 2025-11-02 10:15:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3a7c91d2b5f0"
+down_revision: str | Sequence[str] | None = "ff9349e35b20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "analysis_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("app_id", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("total_reviews", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("processed_reviews", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_analysis_jobs_app_id"), "analysis_jobs", ["app_id"], unique=False)
+    op.create_index(op.f("ix_analysis_jobs_status"), "analysis_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_analysis_jobs_status"), table_name="analysis_jobs")
+    op.drop_index(op.f("ix_analysis_jobs_app_id"), table_name="analysis_jobs")
+    op.drop_table("analysis_jobs")
@@ -0,0 +1,41 @@
+"""add review claims
+
+Revision ID: 4d8b2f6e1a93
+Revises: 2e9a6c4d1f57
+Create Date: 2025-11-21 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d8b2f6e1a93"
+down_revision: str | Sequence[str] | None = "2e9a6c4d1f57"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("reviews", sa.Column("claimed_by", sa.String(length=64), nullable=True))
+    op.add_column(
+        "reviews", sa.Column("claim_expires_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index(
+        "ix_reviews_app_id_id_unanalyzed",
+        "reviews",
+        ["app_id", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_analyzed IS false AND duplicate_of IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_app_id_id_unanalyzed", table_name="reviews")
+    op.drop_column("reviews", "claim_expires_at")
+    op.drop_column("reviews", "claimed_by")
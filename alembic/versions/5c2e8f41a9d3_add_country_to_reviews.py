@@ -0,0 +1,32 @@
+"""add country to reviews
+
+Revision ID: 5c2e8f41a9d3
+Revises: 3a7c91d2b5f0
+Create Date: 2025-11-04 09:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e8f41a9d3"
+down_revision: str | Sequence[str] | None = "3a7c91d2b5f0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "reviews",
+        sa.Column("country", sa.String(length=2), nullable=False, server_default="us"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("reviews", "country")
@@ -0,0 +1,81 @@
+"""add app term counts table
+
+Revision ID: 5e1c9a7b3d28
+Revises: 4d8b2f6e1a93
+Create Date: 2025-11-22 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1c9a7b3d28"
+down_revision: str | Sequence[str] | None = "4d8b2f6e1a93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "app_term_counts",
+        sa.Column("app_id", sa.String(length=255), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("term", sa.Text(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("app_id", "kind", "term"),
+    )
+    op.create_index(
+        "ix_app_term_counts_app_id_kind_count",
+        "app_term_counts",
+        ["app_id", "kind", "count"],
+        unique=False,
+    )
+    # Carry the JSONB maps over, then drop them
+    op.execute(
+        """
+        INSERT INTO app_term_counts (app_id, kind, term, count)
+        SELECT app_id, 'keyword', key, value::bigint
+        FROM app_metrics, jsonb_each_text(keyword_counts)
+        UNION ALL
+        SELECT app_id, 'insight', key, value::bigint
+        FROM app_metrics, jsonb_each_text(insight_counts)
+        """
+    )
+    op.drop_column("app_metrics", "keyword_counts")
+    op.drop_column("app_metrics", "insight_counts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    empty = sa.text("'{}'::jsonb")
+    op.add_column(
+        "app_metrics",
+        sa.Column("insight_counts", postgresql.JSONB(), nullable=False, server_default=empty),
+    )
+    op.add_column(
+        "app_metrics",
+        sa.Column("keyword_counts", postgresql.JSONB(), nullable=False, server_default=empty),
+    )
+    op.execute(
+        """
+        UPDATE app_metrics SET
+            keyword_counts = coalesce(
+                (SELECT jsonb_object_agg(term, count) FROM app_term_counts t
+                 WHERE t.app_id = app_metrics.app_id AND t.kind = 'keyword'),
+                '{}'::jsonb
+            ),
+            insight_counts = coalesce(
+                (SELECT jsonb_object_agg(term, count) FROM app_term_counts t
+                 WHERE t.app_id = app_metrics.app_id AND t.kind = 'insight'),
+                '{}'::jsonb
+            )
+        """
+    )
+    op.drop_index("ix_app_term_counts_app_id_kind_count", table_name="app_term_counts")
+    op.drop_table("app_term_counts")
@@ -0,0 +1,29 @@
+"""add language to reviews
+
+Revision ID: 6a2d4c8e0b15
+Revises: 5e1c9a7b3d28
+Create Date: 2025-11-23 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6a2d4c8e0b15"
+down_revision: str | Sequence[str] | None = "5e1c9a7b3d28"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("reviews", sa.Column("language", sa.String(length=8), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("reviews", "language")
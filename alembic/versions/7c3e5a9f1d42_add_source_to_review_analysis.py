@@ -0,0 +1,30 @@
+"""add source to review analysis
+
+Revision ID: 7c3e5a9f1d42
+Revises: 6a2d4c8e0b15
+Create Date: 2025-11-24 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e5a9f1d42"
+down_revision: str | Sequence[str] | None = "6a2d4c8e0b15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows stay NULL: whether the LLM or the fast path labeled them is unknown
+    op.add_column("review_analysis", sa.Column("source", sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("review_analysis", "source")
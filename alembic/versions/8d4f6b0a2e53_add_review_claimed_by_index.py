@@ -0,0 +1,35 @@
+"""add review claimed_by index
+
+Revision ID: 8d4f6b0a2e53
+Revises: 7c3e5a9f1d42
+Create Date: 2025-11-25 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4f6b0a2e53"
+down_revision: str | Sequence[str] | None = "7c3e5a9f1d42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_reviews_claimed_by",
+        "reviews",
+        ["claimed_by"],
+        unique=False,
+        postgresql_where=sa.text("claimed_by IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_claimed_by", table_name="reviews")
@@ -0,0 +1,45 @@
+"""add collection cursors table
+
+Revision ID: 9b4d7e2c6a18
+Revises: 5c2e8f41a9d3
+Create Date: 2025-11-05 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4d7e2c6a18"
+down_revision: str | Sequence[str] | None = "5c2e8f41a9d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "collection_cursors",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("source", sa.String(length=50), nullable=False),
+        sa.Column("app_id", sa.String(length=255), nullable=False),
+        sa.Column("country", sa.String(length=2), nullable=False),
+        sa.Column("last_review_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_external_id", sa.String(length=255), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("source", "app_id", "country"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("collection_cursors")
@@ -0,0 +1,48 @@
+"""add active analysis job unique index
+
+Revision ID: 9e5b7d1c3f60
+Revises: 8d4f6b0a2e53
+Create Date: 2025-11-26 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e5b7d1c3f60"
+down_revision: str | Sequence[str] | None = "8d4f6b0a2e53"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the oldest active job per app; the reviews of the others are still unanalyzed
+    op.execute(
+        """
+        UPDATE analysis_jobs
+        SET status = 'failed', error = 'Superseded by an earlier job', finished_at = now()
+        WHERE status IN ('queued', 'running')
+          AND id NOT IN (
+            SELECT min(id) FROM analysis_jobs
+            WHERE status IN ('queued', 'running')
+            GROUP BY app_id
+          )
+        """
+    )
+    op.create_index(
+        "uq_analysis_jobs_app_id_active",
+        "analysis_jobs",
+        ["app_id"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_analysis_jobs_app_id_active", table_name="analysis_jobs")
@@ -0,0 +1,34 @@
+"""drop lsh bands of duplicate reviews
+
+Revision ID: a3c6e8f0b2d4
+Revises: 9e5b7d1c3f60
+Create Date: 2025-11-27 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c6e8f0b2d4"
+down_revision: str | Sequence[str] | None = "9e5b7d1c3f60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Candidate lookups only ever match representatives
+    op.execute(
+        """
+        DELETE FROM review_lsh_bands AS b
+        USING reviews AS r
+        WHERE r.id = b.review_id AND r.duplicate_of IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The deleted rows were never read; nothing to restore
@@ -0,0 +1,48 @@
+"""add app metrics table
+
+Revision ID: c81f5a3e7d20
+Revises: 9b4d7e2c6a18
+Create Date: 2025-11-07 14:20:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c81f5a3e7d20"
+down_revision: str | Sequence[str] | None = "9b4d7e2c6a18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    empty = sa.text("'{}'::jsonb")
+    op.create_table(
+        "app_metrics",
+        sa.Column("app_id", sa.String(length=255), nullable=False),
+        sa.Column("review_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rating_sum", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("rating_histogram", postgresql.JSONB(), nullable=False, server_default=empty),
+        sa.Column("analyzed_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sentiment_counts", postgresql.JSONB(), nullable=False, server_default=empty),
+        sa.Column("keyword_counts", postgresql.JSONB(), nullable=False, server_default=empty),
+        sa.Column("insight_counts", postgresql.JSONB(), nullable=False, server_default=empty),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("app_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("app_metrics")
@@ -0,0 +1,42 @@
+"""add keyword indexes
+
+Revision ID: d4e7a9c2f613
+Revises: c81f5a3e7d20
+Create Date: 2025-11-10 09:45:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e7a9c2f613"
+down_revision: str | Sequence[str] | None = "c81f5a3e7d20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_review_analysis_keywords",
+        "review_analysis",
+        ["keywords"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_review_analysis_sentiment_review_id",
+        "review_analysis",
+        ["sentiment", "review_id"],
+        unique=False,
+    )
+    op.create_index("ix_reviews_app_id_id", "reviews", ["app_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_app_id_id", table_name="reviews")
+    op.drop_index("ix_review_analysis_sentiment_review_id", table_name="review_analysis")
+    op.drop_index("ix_review_analysis_keywords", table_name="review_analysis")
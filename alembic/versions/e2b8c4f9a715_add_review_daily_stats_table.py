@@ -0,0 +1,39 @@
+"""add review daily stats table
+
+Revision ID: e2b8c4f9a715
+Revises: d4e7a9c2f613
+Create Date: 2025-11-12 11:05:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b8c4f9a715"
+down_revision: str | Sequence[str] | None = "d4e7a9c2f613"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "review_daily_stats",
+        sa.Column("app_id", sa.String(length=255), nullable=False),
+        sa.Column("bucket", sa.Date(), nullable=False),
+        sa.Column("rating", sa.Integer(), nullable=False),
+        sa.Column("sentiment", sa.String(length=50), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("app_id", "bucket", "rating", "sentiment"),
+    )
+    op.create_index("ix_reviews_app_id_date", "reviews", ["app_id", "date"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_app_id_date", table_name="reviews")
+    op.drop_table("review_daily_stats")
@@ -0,0 +1,71 @@
+"""add insight clusters
+
+Revision ID: f6a1d3b8e924
+Revises: e2b8c4f9a715
+Create Date: 2025-11-14 16:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a1d3b8e924"
+down_revision: str | Sequence[str] | None = "e2b8c4f9a715"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "insight_clusters",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("app_id", sa.String(length=255), nullable=False),
+        sa.Column("label", sa.Text(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "centroid",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_insight_clusters_app_id_size", "insight_clusters", ["app_id", "size"], unique=False
+    )
+
+    op.add_column("insights", sa.Column("cluster_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "insights_cluster_id_fkey",
+        "insights",
+        "insight_clusters",
+        ["cluster_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(op.f("ix_insights_cluster_id"), "insights", ["cluster_id"], unique=False)
+    op.create_index(
+        "ix_insights_app_id_id_unclustered",
+        "insights",
+        ["app_id", "id"],
+        unique=False,
+        postgresql_where=sa.text("cluster_id IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_insights_app_id_id_unclustered", table_name="insights")
+    op.drop_index(op.f("ix_insights_cluster_id"), table_name="insights")
+    op.drop_constraint("insights_cluster_id_fkey", "insights", type_="foreignkey")
+    op.drop_column("insights", "cluster_id")
+    op.drop_index("ix_insight_clusters_app_id_size", table_name="insight_clusters")
+    op.drop_table("insight_clusters")
@@ -1,3 +1,21 @@
+from src.application.services.analysis_worker import AnalysisWorker
+from src.application.services.collection_orchestrator import (
+    CollectionOrchestrator,
+    CollectionTarget,
+    TargetSummary,
+)
+from src.application.services.insight_clustering_service import InsightClusteringService
+from src.application.services.metrics_trend_service import MetricsTrendService
 from src.application.services.review_analysis_service import ReviewAnalysisService
+from src.application.services.sentiment_evaluation_service import SentimentEvaluationService
 
-__all__ = ["ReviewAnalysisService"]
+__all__ = [
+    "AnalysisWorker",
+    "CollectionOrchestrator",
+    "CollectionTarget",
+    "InsightClusteringService",
+    "MetricsTrendService",
+    "ReviewAnalysisService",
+    "SentimentEvaluationService",
+    "TargetSummary",
+]
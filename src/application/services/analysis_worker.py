@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.services.insight_clustering_service import InsightClusteringService
+from src.application.services.review_analysis_service import (
+    ReviewAnalysisService,
+    new_claim_owner,
+)
+from src.config.settings import settings
+from src.infrastructure.database.base import async_session_maker
+from src.infrastructure.database.models import AnalysisJob
+from src.infrastructure.llm.base import LLMService
+from src.infrastructure.repositories import AnalysisRepository, JobRepository, ReviewRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisWorker:
+    """Processes queued analysis jobs"""
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        poll_interval: float | None = None,
+        stale_after: timedelta | None = None,
+    ):
+        self.llm_service = llm_service
+        self.poll_interval = poll_interval or settings.worker_poll_interval
+        self.stale_after = stale_after or timedelta(seconds=settings.job_stale_after_seconds)
+
+    async def run_forever(self) -> None:
+        while True:
+            if not await self.run_once():
+                await asyncio.sleep(self.poll_interval)
+
+    async def run_once(self) -> bool:
+        """Claim (or join) and process a single job; returns False when there is no work"""
+        async with async_session_maker() as session:
+            job = await JobRepository(session).claim_next(self.stale_after)
+            if job is None:
+                job = await self._find_shared_job(session)
+        if job is None:
+            return False
+
+        owner = new_claim_owner()
+        logger.info("Processing analysis job %s for app %s as %s", job.id, job.app_id, owner)
+        try:
+            await self.process_job(job, owner)
+        except Exception as e:
+            logger.exception("Analysis job %s failed", job.id)
+            await self._settle(job, owner, "failed", error=str(e))
+            return True
+
+        # Only the worker closing the job clusters, once the app's insights are all in;
+        # new insights only become top themes once clustered, the analysis itself stands
+        if await self._settle(job, owner, "completed"):
+            try:
+                await InsightClusteringService().cluster_app(job.app_id)
+            except Exception:
+                logger.exception("Insight clustering failed for app %s", job.app_id)
+        return True
+
+    async def _find_shared_job(self, session: AsyncSession) -> AnalysisJob | None:
+        """A running job whose app still has unclaimed reviews, to work on alongside its owner"""
+        review_repo = ReviewRepository(session)
+        for job in await JobRepository(session).get_running(self.stale_after):
+            if await review_repo.has_claimable(job.app_id):
+                return job
+        return None
+
+    async def _settle(
+        self, job: AnalysisJob, owner: str, status: str, error: str | None = None
+    ) -> bool:
+        """
+        Finish the job unless another worker still holds claims on the app's reviews
+
+        Returns True only for the worker that actually closed the job.
+        """
+        async with async_session_maker() as session:
+            if await ReviewRepository(session).has_live_claims(job.app_id, exclude_owner=owner):
+                logger.info("Analysis job %s: %s here, other workers still running", job.id, status)
+                return False
+            if not await JobRepository(session).finish(job.id, status, error=error):
+                return False
+        logger.info("Analysis job %s %s", job.id, status)
+        return True
+
+    async def process_job(self, job: AnalysisJob, owner: str | None = None) -> None:
+        """
+        Analyze the app's unanalyzed reviews through the bounded pipeline
+
+        Progress lives in reviews.is_analyzed, so a job reclaimed after a crash
+        resumes with whatever is still unanalyzed. Reviews are claimed under
+        ``owner``, so workers sharing the job never analyze the same review.
+        """
+
+        async def report_progress(analyzed: int) -> None:
+            async with async_session_maker() as session:
+                await JobRepository(session).add_progress(job.id, analyzed)
+
+        async with async_session_maker() as session:
+            service = ReviewAnalysisService(
+                self.llm_service,
+                AnalysisRepository(session),
+                ReviewRepository(session),
+                claim_owner=owner,
+            )
+            await service.analyze_app(job.app_id, on_commit=report_progress)
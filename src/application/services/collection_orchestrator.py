@@ -0,0 +1,146 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from src.config.settings import settings
+from src.infrastructure.collectors.base import CollectionResult, ReviewCollector
+from src.infrastructure.database.base import async_session_maker
+from src.infrastructure.repositories.cursor_repository import CursorRepository
+from src.infrastructure.repositories.review_repository import ReviewRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CollectionTarget:
+    """App and storefront to collect"""
+
+    app_id: str
+    country: str
+
+
+@dataclass
+class TargetSummary:
+    """Outcome of collecting a single target"""
+
+    app_id: str
+    country: str
+    collected: int = 0
+    duplicates: int = 0
+    saved: int = 0
+    pages: int = 0
+    page_errors: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "app_id": self.app_id,
+            "country": self.country,
+            "collected": self.collected,
+            "duplicates": self.duplicates,
+            "saved": self.saved,
+            "pages": self.pages,
+            "page_errors": self.page_errors,
+            "elapsed": round(self.elapsed, 3),
+            "error": self.error,
+        }
+
+
+class CollectionOrchestrator:
+    """
+    Collects many app x country targets through one collector
+
+    Targets run with bounded concurrency and share the collector's connection
+    pool (and, like every collector, the process-wide limiter of the feed host).
+    Results are de-duplicated across targets and saved as each target finishes,
+    so only review ids are held in memory between targets.
+    """
+
+    def __init__(
+        self,
+        collector: ReviewCollector,
+        source: str,
+        max_concurrent_targets: int | None = None,
+    ):
+        self.collector = collector
+        self.source = source
+        self.max_concurrent_targets = max(
+            1, max_concurrent_targets or settings.collect_max_concurrent_targets
+        )
+
+    async def run(
+        self, targets: list[CollectionTarget], limit: int, incremental: bool = True
+    ) -> list[TargetSummary]:
+        """
+        Collect all targets
+
+        With ``incremental`` each target stops paging at its stored high-water mark.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_targets)
+
+        async def collect(
+            target: CollectionTarget,
+        ) -> tuple[CollectionTarget, CollectionResult | None, str | None]:
+            async with semaphore:
+                try:
+                    since = None
+                    if incremental:
+                        async with async_session_maker() as session:
+                            since = await CursorRepository(session).get_high_water_mark(
+                                self.source, target.app_id, target.country
+                            )
+                    result = await self.collector.collect_with_stats(
+                        target.app_id, limit, target.country, since
+                    )
+                    return target, result, None
+                except Exception as e:
+                    logger.exception(
+                        "Collection failed for app %s (%s)", target.app_id, target.country
+                    )
+                    return target, None, str(e)
+
+        seen: set[str] = set()
+        summaries: dict[tuple[str, str], TargetSummary] = {}
+
+        async with self.collector:
+            tasks = [asyncio.create_task(collect(target)) for target in targets]
+            for finished in asyncio.as_completed(tasks):
+                target, result, error = await finished
+                summary = TargetSummary(app_id=target.app_id, country=target.country, error=error)
+                summaries[(target.app_id, target.country)] = summary
+                if result is None:
+                    continue
+
+                unique = [r for r in result.reviews if r.external_id not in seen]
+                seen.update(r.external_id for r in unique)
+
+                summary.collected = len(result.reviews)
+                summary.duplicates = len(result.reviews) - len(unique)
+                summary.pages = len(result.stats.pages)
+                summary.page_errors = result.stats.errors
+                summary.elapsed = result.stats.elapsed
+
+                try:
+                    async with async_session_maker() as session:
+                        summary.saved = await ReviewRepository(session).bulk_upsert(
+                            unique, source=self.source
+                        )
+                        # A failed page may hide reviews older than the newest one seen,
+                        # so the mark only moves after a complete run
+                        if not result.stats.errors:
+                            await CursorRepository(session).advance(
+                                self.source,
+                                target.app_id,
+                                target.country,
+                                result.reviews,
+                                exhausted=result.exhausted,
+                            )
+                except Exception as e:
+                    logger.exception(
+                        "Saving reviews failed for app %s (%s)", target.app_id, target.country
+                    )
+                    summary.error = str(e)
+
+        return [summaries[(t.app_id, t.country)] for t in targets]
@@ -0,0 +1,109 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import func, select
+
+from src.config.settings import settings
+from src.infrastructure.cache import get_metrics_cache
+from src.infrastructure.database.base import async_session_maker, engine
+from src.infrastructure.repositories.insight_cluster_repository import InsightClusterRepository
+from src.infrastructure.text_processing.insight_clustering import LeaderClusterer
+
+logger = logging.getLogger(__name__)
+
+# First key of the (namespace, app) advisory lock serializing clustering per app
+CLUSTER_LOCK_NAMESPACE = 7301
+
+
+@asynccontextmanager
+async def _app_lock(app_id: str) -> AsyncIterator[bool]:
+    """
+    Hold the app's clustering lock for the block; yields False if another run has it
+
+    A session-level advisory lock on a dedicated connection, so it spans the
+    per-chunk transactions and is released if the process dies.
+    """
+    key = (CLUSTER_LOCK_NAMESPACE, func.hashtext(app_id))
+    async with engine.connect() as conn:
+        acquired = await conn.scalar(select(func.pg_try_advisory_lock(*key)))
+        # Don't sit idle in a transaction while the chunks are clustered
+        await conn.commit()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                await conn.execute(select(func.pg_advisory_unlock(*key)))
+                await conn.commit()
+
+
+class InsightClusteringService:
+    """Groups an app's near-duplicate insights into clusters, incrementally"""
+
+    def __init__(self, threshold: float | None = None, chunk_size: int | None = None):
+        self.threshold = threshold or settings.insight_cluster_threshold
+        self.chunk_size = max(1, chunk_size or settings.insight_cluster_chunk_size)
+
+    async def cluster_app(self, app_id: str, rebuild: bool = False) -> int:
+        """
+        Assign every unclustered insight of an app to a cluster
+
+        Existing clusters are kept and extended; ``rebuild`` drops them first.
+        Each chunk commits on its own, so an interrupted run resumes where it
+        stopped. Runs on one app are serialized, since concurrent ones would each
+        extend their own copy of the clusters. A run finding the app locked leaves
+        its insights to the lock holder, which checks for unclustered insights
+        after unlocking and goes again if any arrived too late for its last read.
+        Returns the number of insights clustered.
+        """
+        clustered = 0
+        while True:
+            async with _app_lock(app_id) as acquired:
+                if not acquired:
+                    logger.info("Insights of app %s are already being clustered", app_id)
+                    return clustered
+                clustered += await self._cluster(app_id, rebuild)
+                rebuild = False
+
+            async with async_session_maker() as session:
+                if not await InsightClusterRepository(session).has_unclustered(app_id):
+                    return clustered
+
+    async def _cluster(self, app_id: str, rebuild: bool) -> int:
+        async with async_session_maker() as session:
+            repo = InsightClusterRepository(session)
+            if rebuild:
+                await repo.reset(app_id)
+                await session.commit()
+            clusters = await repo.get_clusters(app_id)
+
+        clusterer = LeaderClusterer(clusters, threshold=self.threshold)
+        clustered = 0
+        last_id = 0
+        while True:
+            async with async_session_maker() as session:
+                repo = InsightClusterRepository(session)
+                chunk = await repo.get_unclustered_chunk(app_id, last_id, self.chunk_size)
+                if not chunk:
+                    break
+
+                positions = clusterer.assign([content for _, content in chunk])
+                assignments = {
+                    insight_id: position
+                    for (insight_id, _), position in zip(chunk, positions, strict=True)
+                }
+                await repo.save(app_id, clusterer.clusters, assignments)
+                await session.commit()
+
+            clustered += len(chunk)
+            last_id = chunk[-1][0]
+
+        if clustered:
+            await get_metrics_cache().bump(app_id)
+            logger.info(
+                "Clustered %d insights of app %s into %d clusters",
+                clustered,
+                app_id,
+                len(clusterer.clusters),
+            )
+        return clustered
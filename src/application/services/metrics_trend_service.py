@@ -0,0 +1,104 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from src.infrastructure.database.models import UNANALYZED_SENTIMENT
+from src.infrastructure.repositories.daily_stats_repository import DailyStatsRepository
+
+DEFAULT_SERIES_DAYS = 90
+
+
+@dataclass
+class _Bucket:
+    ratings: Counter[int] = field(default_factory=Counter)
+    sentiments: Counter[str] = field(default_factory=Counter)
+
+    def add(self, rating: int, sentiment: str, count: int) -> None:
+        self.ratings[rating] += count
+        self.sentiments[sentiment] += count
+
+    @property
+    def review_count(self) -> int:
+        return sum(self.ratings.values())
+
+    @property
+    def average_rating(self) -> float | None:
+        total = self.review_count
+        if not total:
+            return None
+        return round(sum(r * c for r, c in self.ratings.items()) / total, 2)
+
+    def as_dict(self) -> dict[str, Any]:
+        sentiments = {s: c for s, c in self.sentiments.items() if s != UNANALYZED_SENTIMENT}
+        analyzed = sum(sentiments.values())
+        return {
+            "review_count": self.review_count,
+            "average_rating": self.average_rating,
+            "ratings": {str(r): c for r, c in sorted(self.ratings.items()) if c},
+            "sentiments": sentiments,
+            "sentiment_shares": {s: round(c / analyzed, 4) for s, c in sentiments.items()}
+            if analyzed
+            else {},
+            "unanalyzed": self.sentiments[UNANALYZED_SENTIMENT],
+        }
+
+
+class MetricsTrendService:
+    """Rating and sentiment trends from the date-bucketed review_daily_stats table"""
+
+    def __init__(self, stats_repo: DailyStatsRepository):
+        self.stats_repo = stats_repo
+
+    async def get_timeseries(
+        self,
+        app_id: str,
+        granularity: str = "day",
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[dict[str, Any]]:
+        """Per-day or per-week points (weeks start on Monday) between start and end"""
+        end = end or datetime.now(UTC).date()
+        start = start or end - timedelta(days=DEFAULT_SERIES_DAYS - 1)
+
+        buckets: dict[date, _Bucket] = {}
+        for bucket, rating, sentiment, count in await self.stats_repo.get_series(
+            app_id, start, end, granularity
+        ):
+            buckets.setdefault(bucket, _Bucket()).add(rating, sentiment, count)
+
+        return [
+            {"bucket": bucket, **stats.as_dict()}
+            for bucket, stats in sorted(buckets.items())
+            if stats.review_count
+        ]
+
+    async def compare_windows(
+        self, app_id: str, days: int = 30, end: date | None = None
+    ) -> dict[str, Any]:
+        """The last ``days`` days against the ``days`` before them"""
+        end = end or datetime.now(UTC).date()
+        current_start = end - timedelta(days=days - 1)
+        previous_start = current_start - timedelta(days=days)
+
+        current, previous = _Bucket(), _Bucket()
+        for bucket, rating, sentiment, count in await self.stats_repo.get_series(
+            app_id, previous_start, end
+        ):
+            window = current if bucket >= current_start else previous
+            window.add(rating, sentiment, count)
+
+        current_avg, previous_avg = current.average_rating, previous.average_rating
+        return {
+            "days": days,
+            "current": {"start": current_start, "end": end, **current.as_dict()},
+            "previous": {
+                "start": previous_start,
+                "end": current_start - timedelta(days=1),
+                **previous.as_dict(),
+            },
+            "review_count_change": current.review_count - previous.review_count,
+            "average_rating_change": round(current_avg - previous_avg, 2)
+            if current_avg is not None and previous_avg is not None
+            else None,
+        }
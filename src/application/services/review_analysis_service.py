@@ -1,11 +1,31 @@
 import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import timedelta
 
+from src.config.settings import settings
+from src.infrastructure.cache import get_metrics_cache
 from src.infrastructure.database.base import async_session_maker
 from src.infrastructure.database.models import Review
-from src.infrastructure.llm.base import LLMService
+from src.infrastructure.llm.base import LLMService, ReviewAnalysisResult, ReviewInput
 from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.repositories.daily_stats_repository import DailyStatsRepository
+from src.infrastructure.repositories.metrics_repository import MetricsDelta, MetricsRepository
 from src.infrastructure.repositories.review_repository import ReviewRepository
 
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int], Awaitable[None]]
+
+
+def new_claim_owner() -> str:
+    """Identifies one pipeline in reviews.claimed_by: host, process and a random suffix"""
+    return f"{socket.gethostname()[:40]}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
 
 class ReviewAnalysisService:
     def __init__(
@@ -13,75 +33,244 @@ class ReviewAnalysisService:
         llm_service: LLMService,
         analysis_repo: AnalysisRepository,
         review_repo: ReviewRepository,
+        batch_size: int | None = None,
+        workers: int | None = None,
+        queue_size: int | None = None,
+        write_batch_size: int | None = None,
+        chunk_size: int | None = None,
+        claim_owner: str | None = None,
+        claim_lease: timedelta | None = None,
     ):
         self.llm_service = llm_service
         self.analysis_repo = analysis_repo
         self.review_repo = review_repo
+        self.batch_size = max(1, batch_size or settings.llm_batch_size)
+        self.workers = max(1, workers or settings.llm_workers)
+        self.queue_size = max(1, queue_size or settings.pipeline_queue_size)
+        self.write_batch_size = max(1, write_batch_size or settings.write_batch_size)
+        self.chunk_size = max(1, chunk_size or settings.analysis_chunk_size)
+        self.claim_owner = claim_owner or new_claim_owner()
+        self.claim_lease = claim_lease or timedelta(seconds=settings.analysis_claim_lease_seconds)
+
+    async def analyze_app(self, app_id: str, on_commit: ProgressCallback | None = None) -> int:
+        """
+        Analyze every unanalyzed review of an app, streaming them from the database
+
+        Only near-duplicate representatives go to the LLM; their duplicates get a
+        copy of the result. Reviews are claimed chunk by chunk, so several pipelines
+        (processes or nodes) can work through the same app concurrently. Returns the
+        number of reviews analyzed.
+        """
+        written = await self._fan_out_analyzed(app_id, on_commit)
+        async with self._renewing_claims():
+            return written + await self._run_pipeline(
+                app_id, self._stream_unanalyzed(app_id), on_commit
+            )
+
+    @asynccontextmanager
+    async def _renewing_claims(self) -> AsyncIterator[None]:
+        """
+        Keep this pipeline's claims leased while it runs
 
-    async def analyze_reviews(self, app_id: str, reviews: list[Review]) -> None:
+        Queued batches and slow LLM calls (a Batch API job may take hours) would
+        otherwise outlive a fixed lease and be claimed, and paid for, again by
+        another worker. Renewal runs every third of the lease, so a missed beat
+        or two doesn't let claims lapse; a crashed worker's claims still expire.
+        """
+
+        async def renew() -> None:
+            interval = self.claim_lease.total_seconds() / 3
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    async with async_session_maker() as session:
+                        await ReviewRepository(session).renew_claims(
+                            self.claim_owner, self.claim_lease
+                        )
+                        await session.commit()
+                except Exception:
+                    logger.exception("Renewing review claims of %s failed", self.claim_owner)
+
+        task = asyncio.create_task(renew())
+        try:
+            yield
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def analyze_reviews(
+        self, app_id: str, reviews: list[Review], on_commit: ProgressCallback | None = None
+    ) -> int:
+        """Analyze reviews and persist results; returns the number of reviews analyzed"""
         if not reviews:
-            return
+            return 0
 
         # Extract review data to avoid session conflicts
         review_data = [
-            {
-                "id": review.id,
-                "text": review.text,
-                "rating": review.rating,
-            }
+            ReviewInput(review_id=review.id, text=review.text, rating=review.rating)
             for review in reviews
         ]
 
-        async def analyze_single_review(data: dict):
-            # Create a new session for each review to avoid conflicts
+        async def source() -> AsyncIterator[list[ReviewInput]]:
+            for i in range(0, len(review_data), self.batch_size):
+                yield review_data[i : i + self.batch_size]
+
+        return await self._run_pipeline(app_id, source(), on_commit)
+
+    async def _stream_unanalyzed(self, app_id: str) -> AsyncIterator[list[ReviewInput]]:
+        """
+        Claim and yield the app's unanalyzed representatives, one chunk at a time
+
+        Claims are taken only as the bounded queue drains and are renewed while the
+        pipeline runs. Writing a result releases its claim; the keyset keeps a
+        review released after a failure from coming back within the same run.
+        """
+        last_id = 0
+        while True:
+            # Short-lived session per chunk so the producer never pins a connection
             async with async_session_maker() as session:
-                analysis_repo = AnalysisRepository(session)
+                reviews = await ReviewRepository(session).claim_unanalyzed(
+                    app_id,
+                    self.claim_owner,
+                    self.claim_lease,
+                    after_id=last_id,
+                    limit=self.chunk_size,
+                )
+                page = [
+                    ReviewInput(review_id=review.id, text=review.text, rating=review.rating)
+                    for review in reviews
+                ]
+                await session.commit()
+            if not page:
+                return
 
-                sentiment = await self.llm_service.analyze_sentiment(data["text"], data["rating"])
+            last_id = page[-1].review_id
+            for i in range(0, len(page), self.batch_size):
+                yield page[i : i + self.batch_size]
 
-                keywords = []
-                insights = []
+    async def _run_pipeline(
+        self,
+        app_id: str,
+        source: AsyncIterator[list[ReviewInput]],
+        on_commit: ProgressCallback | None,
+    ) -> int:
+        """
+        Producer -> fixed pool of LLM workers -> single batching writer
 
-                if sentiment == "negative":
-                    keywords_result = await self.llm_service.extract_keywords(data["text"])
-                    insights_result = await self.llm_service.generate_insights(
-                        data["text"], data["rating"]
-                    )
-                    keywords = keywords_result if keywords_result else []
-                    insights = insights_result if insights_result else []
+        Both queues are bounded, so memory and open sessions stay flat no matter
+        how many reviews the source yields.
+        """
+        batches: asyncio.Queue[list[ReviewInput] | None] = asyncio.Queue(self.queue_size)
+        results: asyncio.Queue[dict[int, ReviewAnalysisResult] | None] = asyncio.Queue(
+            self.queue_size
+        )
+        written = 0
 
-                await analysis_repo.save_review_analysis(
-                    review_id=data["id"], sentiment=sentiment, keywords=keywords
-                )
+        async def produce() -> None:
+            async for batch in source:
+                await batches.put(batch)
+            for _ in range(self.workers):
+                await batches.put(None)
+
+        async def work() -> None:
+            while (batch := await batches.get()) is not None:
+                try:
+                    analyzed = await self.llm_service.analyze_batch(batch)
+                except Exception:
+                    # Reviews stay unanalyzed and are picked up by the next run
+                    logger.exception("LLM analysis failed for a batch of %d reviews", len(batch))
+                    analyzed = {}
+                missing = [r.review_id for r in batch if r.review_id not in analyzed]
+                if missing:
+                    await self._release_claims(missing)
+                if analyzed:
+                    await results.put(analyzed)
+            await results.put(None)
+
+        async def write() -> None:
+            nonlocal written
+            pending: dict[int, ReviewAnalysisResult] = {}
+            finished_workers = 0
+
+            async def flush() -> None:
+                nonlocal written
+                if not pending:
+                    return
+                saved = await self._write_results(app_id, pending)
+                written += saved
+                if on_commit is not None:
+                    await on_commit(saved)
+                pending.clear()
 
-                if insights:
-                    await analysis_repo.save_insights_batch(
-                        app_id=app_id, review_id=data["id"], insights=insights
-                    )
+            while finished_workers < self.workers:
+                item = await results.get()
+                if item is None:
+                    finished_workers += 1
+                    continue
+                pending.update(item)
+                if len(pending) >= self.write_batch_size:
+                    await flush()
+            await flush()
 
-                # Mark review as analyzed using UPDATE
-                from sqlalchemy import text
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            for _ in range(self.workers):
+                tg.create_task(work())
+            tg.create_task(write())
 
-                await session.execute(
-                    text("UPDATE reviews SET is_analyzed = true WHERE id = :review_id"),
-                    {"review_id": data["id"]},
+        return written
+
+    async def _release_claims(self, review_ids: list[int]) -> None:
+        async with async_session_maker() as session:
+            await ReviewRepository(session).release_claims(review_ids, self.claim_owner)
+            await session.commit()
+
+    async def _fan_out_analyzed(self, app_id: str, on_commit: ProgressCallback | None) -> int:
+        """Copy stored analyses to duplicates whose representative was analyzed earlier"""
+        written = 0
+        last_id = 0
+        while True:
+            async with async_session_maker() as session:
+                pending = await ReviewRepository(session).get_pending_duplicates(
+                    app_id, after_id=last_id, limit=settings.analysis_chunk_size
                 )
+                if not pending:
+                    return written
+                stored = await AnalysisRepository(session).get_results(list(set(pending.values())))
 
-                await session.commit()
+            last_id = max(pending)
+            results = {
+                review_id: stored[representative_id]
+                for review_id, representative_id in pending.items()
+                if representative_id in stored
+            }
+            if results:
+                saved = await self._write_results(app_id, results)
+                written += saved
+                if on_commit is not None:
+                    await on_commit(saved)
+
+    async def _write_results(self, app_id: str, results: dict[int, ReviewAnalysisResult]) -> int:
+        """
+        Persist a batch of results and its aggregate updates in one transaction
 
-        await asyncio.gather(*[analyze_single_review(data) for data in review_data])
-
-    async def get_app_metrics(self, app_id: str) -> dict:
-        avg_rating = await self.review_repo.get_average_rating(app_id)
-        ratings_summary = await self.review_repo.get_ratings_summary(app_id)
-        sentiments_summary = await self.analysis_repo.get_sentiments_summary(app_id)
-        top_keywords = await self.analysis_repo.get_top_keywords(app_id)
-        top_insights = await self.analysis_repo.get_top_insights(app_id)
-
-        return {
-            "average_rating": avg_rating,
-            "ratings_summary": ratings_summary,
-            "sentiments_summary": sentiments_summary,
-            "top_keywords": top_keywords,
-            "top_insights": top_insights,
-        }
+        Unanalyzed near-duplicates of the batch's reviews receive the same result.
+        Returns the number of reviews written.
+        """
+        async with async_session_maker() as session:
+            duplicates = await ReviewRepository(session).get_unanalyzed_duplicates(list(results))
+            results = results | {
+                review_id: results[representative_id]
+                for review_id, representative_id in duplicates.items()
+            }
+            inserted = await AnalysisRepository(session).save_results_bulk(app_id, results)
+            await MetricsRepository(session).apply(
+                app_id, MetricsDelta.for_analysis(results, inserted)
+            )
+            await DailyStatsRepository(session).move_analyzed(inserted)
+            await session.commit()
+        await get_metrics_cache().bump(app_id)
+        return len(results)
@@ -0,0 +1,53 @@
+from collections import Counter
+from typing import Any
+
+from src.infrastructure.llm.local_sentiment import LexiconSentimentClassifier, SentimentPrediction
+
+DEFAULT_THRESHOLDS = (0.6, 0.7, 0.8, 0.85, 0.9, 0.95)
+
+
+class SentimentEvaluationService:
+    """
+    Offline agreement of the local sentiment classifier with stored LLM labels
+
+    Reports, per confidence threshold, how many reviews the fast path would
+    settle (coverage) and how often it agrees with the stored label on those.
+    ``review_*`` figures mirror full analyses, where negatives always go to the LLM.
+    """
+
+    def __init__(self, classifier: LexiconSentimentClassifier | None = None):
+        self.classifier = classifier or LexiconSentimentClassifier()
+
+    def evaluate(
+        self,
+        samples: list[tuple[str, int, str]],
+        thresholds: tuple[float, ...] = DEFAULT_THRESHOLDS,
+    ) -> list[dict[str, Any]]:
+        predictions = [
+            (self.classifier.classify(text, rating), label) for text, rating, label in samples
+        ]
+        return [self._report(predictions, threshold) for threshold in sorted(thresholds)]
+
+    @staticmethod
+    def _report(
+        predictions: list[tuple[SentimentPrediction, str]], threshold: float
+    ) -> dict[str, Any]:
+        total = len(predictions)
+        settled = [(p, label) for p, label in predictions if p.confidence >= threshold]
+        review_settled = [(p, label) for p, label in settled if p.sentiment != "negative"]
+        agreed = sum(p.sentiment == label for p, label in settled)
+        review_agreed = sum(p.sentiment == label for p, label in review_settled)
+        disagreements = Counter(
+            f"{p.sentiment}->{label}" for p, label in settled if p.sentiment != label
+        )
+        return {
+            "threshold": threshold,
+            "samples": total,
+            "coverage": round(len(settled) / total, 4) if total else 0.0,
+            "agreement": round(agreed / len(settled), 4) if settled else None,
+            "review_coverage": round(len(review_settled) / total, 4) if total else 0.0,
+            "review_agreement": (
+                round(review_agreed / len(review_settled), 4) if review_settled else None
+            ),
+            "disagreements": dict(disagreements.most_common()),
+        }
@@ -11,12 +11,76 @@ class Settings(BaseSettings):
     )
 
     database_url: str
+    # Optional read replica for read-only endpoints; reads use the primary when unset
+    database_read_url: str | None = None
+
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_pre_ping: bool = True
+    db_pool_recycle_seconds: int = 1800
+    # Set to 0 when connecting through pgbouncer in transaction mode
+    db_statement_cache_size: int = 100
+    # 0 disables the server-side statement timeout
+    db_statement_timeout_ms: int = 30_000
     redis_url: str
 
     openai_api_key: str
     openai_model: str = "gpt-4o-mini"
+    openai_base_url: str | None = None
+
+    openai_batch_size: int = 5_000
+    openai_batch_concurrency: int = 2
+    openai_batch_poll_interval: float = 30.0
+    openai_batch_timeout_seconds: int = 24 * 3600
+
+    llm_batch_size: int = 20
+    llm_max_concurrency: int = 50
+    llm_min_concurrency: int = 2
+    llm_requests_per_minute: int = 5_000
+    llm_tokens_per_minute: int = 2_000_000
+    llm_max_retries: int = 5
+    llm_request_timeout_seconds: float = 60.0
+    llm_call_deadline_seconds: float = 300.0
+    llm_breaker_failure_threshold: int = 5
+    llm_breaker_reset_seconds: float = 30.0
+    llm_max_review_tokens: int = 512
+
+    fast_path_enabled: bool = True
+    fast_path_threshold: float = 0.85
+    # Reviews with id % 100 below this always go to the LLM: eval-sentiment's unbiased sample
+    fast_path_sample_percent: int = 2
+
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: int = 7 * 24 * 3600
+    llm_cache_memory_size: int = 10_000
+
+    metrics_cache_enabled: bool = True
+    metrics_cache_ttl_seconds: int = 24 * 3600
+    metrics_cache_memory_size: int = 1_000
+    # Entries computed from the replica may trail the primary; cap how long they live
+    metrics_cache_replica_ttl_seconds: int = 60
+
+    analysis_chunk_size: int = 200
+    llm_workers: int = 8
+    pipeline_queue_size: int = 16
+    write_batch_size: int = 200
+    worker_poll_interval: float = 2.0
+    job_stale_after_seconds: int = 600
+    # Reviews claimed by a pipeline are skipped by others until the lease runs out;
+    # running pipelines renew it every third of this, so it only bounds crash recovery
+    analysis_claim_lease_seconds: int = 600
+
+    insight_cluster_threshold: float = 0.45
+    insight_cluster_chunk_size: int = 1_000
+
+    dedup_enabled: bool = True
+    dedup_threshold: float = 0.8
+    dedup_num_perm: int = 64
+    dedup_bands: int = 16
 
     apple_collector_type: str = "apple_store"
+    collect_max_concurrent_targets: int = 8
 
 
 @lru_cache
@@ -0,0 +1,5 @@
+from .lru import TTLLRUCache
+from .metrics_cache import APPS_SCOPE, MetricsCache, get_metrics_cache
+from .redis_client import get_redis
+
+__all__ = ["TTLLRUCache", "get_redis", "MetricsCache", "get_metrics_cache", "APPS_SCOPE"]
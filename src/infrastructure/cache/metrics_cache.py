@@ -0,0 +1,144 @@
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.config.settings import settings
+
+from .lru import TTLLRUCache
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "metrics:v1:"
+APPS_SCOPE = "apps"
+
+
+@dataclass
+class MetricsCacheStats:
+    """Process-local cache counters"""
+
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        lookups = self.memory_hits + self.redis_hits + self.misses
+        hits = self.memory_hits + self.redis_hits
+        return {**asdict(self), "hit_rate": round(hits / lookups, 4) if lookups else 0.0}
+
+
+class MetricsCache:
+    """
+    Versioned cache for metrics responses
+
+    Each scope (an app id, or ``APPS_SCOPE`` for the app list) has a version
+    counter in Redis that writers bump after committing. Entries are keyed by
+    scope and version, so a bump invalidates them without deleting anything and
+    the version doubles as the ETag. Without Redis nothing is cached.
+    """
+
+    def __init__(self, redis: Redis | None, memory_size: int, ttl_seconds: int):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.memory = TTLLRUCache(memory_size, ttl_seconds)
+        self.stats = MetricsCacheStats()
+
+    @staticmethod
+    def _version_key(scope: str) -> str:
+        return f"{KEY_PREFIX}version:{scope}"
+
+    @staticmethod
+    def _value_key(scope: str, version: str) -> str:
+        return f"{KEY_PREFIX}{scope}:{version}"
+
+    @staticmethod
+    def etag(scope: str, version: str) -> str:
+        return f'"{scope}-{version}"'
+
+    async def get_version(self, scope: str) -> str | None:
+        """Current version of a scope, or None when Redis is unavailable"""
+        if self.redis is None:
+            return None
+        key = self._version_key(scope)
+        try:
+            version = await self.redis.get(key)
+            if version is None:
+                # Seed from the clock so an expired counter never reuses old versions
+                await self.redis.set(key, time.time_ns(), nx=True, ex=self.ttl_seconds)
+                version = await self.redis.get(key)
+        except (RedisError, OSError) as e:
+            logger.warning("Metrics cache version read failed: %s", e)
+            self.stats.errors += 1
+            return None
+        return version
+
+    async def get(self, scope: str, version: str) -> Any | None:
+        key = self._value_key(scope, version)
+        value = self.memory.get(key)
+        if value is not None:
+            self.stats.memory_hits += 1
+            return value
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(key)
+            except (RedisError, OSError) as e:
+                logger.warning("Metrics cache read failed: %s", e)
+                self.stats.errors += 1
+                raw = None
+            if raw is not None:
+                value = json.loads(raw)
+                self.memory.set(key, value)
+                self.stats.redis_hits += 1
+                return value
+
+        self.stats.misses += 1
+        return None
+
+    async def set(
+        self, scope: str, version: str, value: Any, ttl_seconds: int | None = None
+    ) -> None:
+        key = self._value_key(scope, version)
+        self.memory.set(key, value, ttl_seconds)
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(
+                key, json.dumps(value, ensure_ascii=False), ex=ttl_seconds or self.ttl_seconds
+            )
+        except (RedisError, OSError) as e:
+            logger.warning("Metrics cache write failed: %s", e)
+            self.stats.errors += 1
+
+    async def bump(self, *app_ids: str) -> None:
+        """Invalidate the given apps and the app list; call after the write commits"""
+        if self.redis is None or not app_ids:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for scope in (*app_ids, APPS_SCOPE):
+                    key = self._version_key(scope)
+                    pipe.set(key, time.time_ns(), nx=True, ex=self.ttl_seconds)
+                    pipe.incr(key)
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning("Metrics cache invalidation failed: %s", e)
+            self.stats.errors += 1
+
+
+@lru_cache
+def get_metrics_cache() -> MetricsCache:
+    """Process-wide metrics cache"""
+    return MetricsCache(
+        redis=get_redis() if settings.metrics_cache_enabled else None,
+        memory_size=settings.metrics_cache_memory_size if settings.metrics_cache_enabled else 0,
+        ttl_seconds=settings.metrics_cache_ttl_seconds,
+    )
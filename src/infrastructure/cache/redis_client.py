@@ -0,0 +1,11 @@
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from src.config.settings import settings
+
+
+@lru_cache
+def get_redis() -> Redis:
+    """Process-wide Redis client (shares one connection pool)"""
+    return Redis.from_url(settings.redis_url, decode_responses=True)
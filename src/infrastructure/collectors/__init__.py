@@ -0,0 +1,12 @@
+from .base import CollectedReview, CollectionResult, CollectionStats, PageFetch, ReviewCollector
+from .rate_limiter import TokenBucket, get_host_limiter
+
+__all__ = [
+    "CollectedReview",
+    "CollectionResult",
+    "CollectionStats",
+    "PageFetch",
+    "ReviewCollector",
+    "TokenBucket",
+    "get_host_limiter",
+]
@@ -1,13 +1,23 @@
 import asyncio
+import logging
+import math
+import random
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Self
+from urllib.parse import urlsplit
 
 import httpx
 
 from src.infrastructure.text_processing import TextProcessor
 
-from .base import CollectedReview, ReviewCollector
+from .base import CollectedReview, CollectionResult, CollectionStats, PageFetch, ReviewCollector
+from .rate_limiter import TokenBucket, get_host_limiter
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
 
 @dataclass
@@ -18,66 +28,230 @@ class AppleStoreConfig:
     endpoint: str = "/rss/customerreviews"
     sort_by: str = "mostrecent"
     format: str = "json"
-    rate_limit_delay: float = 0.5
     request_timeout: float = 30.0
     reviews_per_page: int = 50
+    max_pages: int = 10
+
+    requests_per_second: float = 2.0
+    burst: int = 4
+    max_concurrent_pages: int = 4
+    max_connections: int = 20
+
+    max_retries: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
 
-    def build_reviews_url(self, app_id: str, page: int) -> str:
+    def build_reviews_url(self, app_id: str, page: int, country: str = "us") -> str:
         """Build URL for reviews API"""
         return (
-            f"{self.base_url}{self.endpoint}/page={page}/id={app_id}"
+            f"{self.base_url}/{country}{self.endpoint}/page={page}/id={app_id}"
             f"/sortby={self.sort_by}/{self.format}"
         )
 
 
 class AppleStoreCollector(ReviewCollector):
-    """Apple App Store reviews collector"""
-
-    def __init__(self, config: AppleStoreConfig | None = None):
+    """
+    Apple App Store reviews collector
+
+    Pages are fetched in waves of up to ``max_concurrent_pages`` behind a token
+    bucket, and 429/5xx responses are retried with jittered exponential backoff.
+    All collectors in the process share one limiter per feed host, and collect
+    calls inside ``async with collector:`` also share one HTTP connection pool.
+    """
+
+    def __init__(
+        self,
+        config: AppleStoreConfig | None = None,
+        limiter: TokenBucket | None = None,
+    ):
         self.config = config or AppleStoreConfig()
-        self.rate_limit_delay = self.config.rate_limit_delay
+        self.limiter = limiter or get_host_limiter(
+            urlsplit(self.config.base_url).netloc,
+            self.config.requests_per_second,
+            self.config.burst,
+        )
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> Self:
+        self._client = self._create_client()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.config.request_timeout,
+            limits=httpx.Limits(max_connections=self.config.max_connections),
+        )
 
     @staticmethod
     def _parse_apple_date(date_str: str) -> datetime:
         return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
 
-    async def collect(self, app_id: str, limit: int = 100) -> list[CollectedReview]:
+    async def collect(
+        self,
+        app_id: str,
+        limit: int = 100,
+        country: str = "us",
+        since: datetime | None = None,
+    ) -> list[CollectedReview]:
+        result = await self.collect_with_stats(app_id, limit, country, since)
+        return result.reviews
+
+    async def collect_with_stats(
+        self,
+        app_id: str,
+        limit: int = 100,
+        country: str = "us",
+        since: datetime | None = None,
+    ) -> CollectionResult:
+        if self._client is not None:
+            return await self._collect(self._client, app_id, limit, country, since)
+
+        async with self._create_client() as client:
+            return await self._collect(client, app_id, limit, country, since)
+
+    async def _collect(
+        self,
+        client: httpx.AsyncClient,
+        app_id: str,
+        limit: int,
+        country: str,
+        since: datetime | None,
+    ) -> CollectionResult:
+        started = time.perf_counter()
+        stats = CollectionStats()
         reviews: list[CollectedReview] = []
-        page = 1
 
-        async with httpx.AsyncClient(timeout=self.config.request_timeout) as client:
-            while len(reviews) < limit:
-                try:
-                    page_reviews = await self._fetch_page(client, app_id, page)
+        last_page = min(math.ceil(limit / self.config.reviews_per_page), self.config.max_pages)
+        page = 1
+        done = False
+        # Incremental runs usually need one page, so start small and widen the waves
+        wave_size = 1 if since is not None else self.config.max_concurrent_pages
+
+        while not done and page <= last_page and len(reviews) < limit:
+            wave = range(page, min(page + wave_size, last_page + 1))
+            fetched = await asyncio.gather(
+                *[self._fetch_page_with_retry(client, app_id, country, p, stats) for p in wave]
+            )
 
-                    if not page_reviews:
+            # Pages arrive together; consume them in order and stop at the feed's end
+            for page_reviews in fetched:
+                if page_reviews is None:
+                    continue
+
+                if since is not None:
+                    # Feed is sorted newest first: an older review means the rest is stored
+                    new_reviews = [r for r in page_reviews if r.date >= since]
+                    reviews.extend(new_reviews)
+                    if len(new_reviews) < len(page_reviews):
+                        done = True
                         break
-
+                else:
                     reviews.extend(page_reviews)
 
-                    if len(page_reviews) < self.config.reviews_per_page:
-                        break
-
-                    page += 1
-                    await asyncio.sleep(self.rate_limit_delay)
-
-                except Exception as e:
-                    print(f"Error fetching page {page}: {e}")
+                if len(page_reviews) < self.config.reviews_per_page:
+                    done = True
                     break
 
-        return reviews[:limit]
+            page = wave.stop
+            wave_size = min(wave_size * 2, self.config.max_concurrent_pages)
+
+        stats.pages.sort(key=lambda p: p.page)
+        stats.elapsed = time.perf_counter() - started
+        if stats.errors:
+            logger.warning(
+                "Collected app %s with %d failed page(s) out of %d",
+                app_id,
+                stats.errors,
+                len(stats.pages),
+            )
 
-    async def _fetch_page(
-        self, client: httpx.AsyncClient, app_id: str, page: int
-    ) -> list[CollectedReview]:
-        """Fetch a single page of reviews"""
-        url = self.config.build_reviews_url(app_id, page)
+        # Stopping on the limit or the page cap leaves reviews older than the last one unseen
+        return CollectionResult(
+            reviews=reviews[:limit], stats=stats, exhausted=done and len(reviews) <= limit
+        )
 
-        response = await client.get(url)
-        response.raise_for_status()
+    async def _fetch_page_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        app_id: str,
+        country: str,
+        page: int,
+        stats: CollectionStats,
+    ) -> list[CollectedReview] | None:
+        """Fetch a page, retrying transient failures; returns None if it ultimately fails"""
+        started = time.perf_counter()
+        status_code: int | None = None
+        error: str | None = None
+
+        for attempt in range(1, self.config.max_retries + 2):
+            await self.limiter.acquire()
+            retry_after: float | None = None
+            try:
+                response = await client.get(self.config.build_reviews_url(app_id, page, country))
+                status_code = response.status_code
+
+                if status_code not in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                    reviews = self._parse_page(response.json(), app_id, country)
+                    stats.pages.append(
+                        PageFetch(
+                            app_id=app_id,
+                            page=page,
+                            elapsed=time.perf_counter() - started,
+                            attempts=attempt,
+                            reviews=len(reviews),
+                            status_code=status_code,
+                        )
+                    )
+                    return reviews
+
+                error = f"HTTP {status_code}"
+                retry_after = self._parse_retry_after(response.headers.get("retry-after"))
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+            except httpx.HTTPStatusError:
+                error = f"HTTP {status_code}"
+                break
+            except ValueError as e:
+                error = f"Invalid response body: {e}"
+                break
+
+            if attempt <= self.config.max_retries:
+                await asyncio.sleep(retry_after or self._backoff(attempt))
+
+        logger.warning("Failed to fetch page %d for app %s (%s): %s", page, app_id, country, error)
+        stats.pages.append(
+            PageFetch(
+                app_id=app_id,
+                page=page,
+                elapsed=time.perf_counter() - started,
+                attempts=attempt,
+                status_code=status_code,
+                error=error,
+            )
+        )
+        return None
 
-        data = response.json()
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        ceiling = min(self.config.backoff_max, self.config.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
 
+    def _parse_retry_after(self, value: str | None) -> float | None:
+        if not value:
+            return None
+        try:
+            return min(max(float(value), 0.0), self.config.backoff_max)
+        except ValueError:
+            return None
+
+    def _parse_page(self, data: dict[str, Any], app_id: str, country: str) -> list[CollectedReview]:
+        """Parse the review entries of a feed page"""
         entries = data.get("feed", {}).get("entry", [])
 
         if not entries:
@@ -89,16 +263,26 @@ class AppleStoreCollector(ReviewCollector):
         reviews = []
         for entry in entries:
             try:
-                review = self._parse_entry(entry, app_id)
+                review = self._parse_entry(entry, app_id, country)
                 if review:
                     reviews.append(review)
             except Exception as e:
-                print(f"Error parsing entry: {e}")
+                logger.warning("Error parsing entry: %s", e)
                 continue
 
+        # Normalize the whole page in one pass
+        titles = TextProcessor.prepare_batch([review.title for review in reviews])
+        texts = TextProcessor.prepare_batch([review.text for review in reviews])
+        for review, title, text in zip(reviews, titles, texts, strict=True):
+            review.title = title
+            review.text = text
+            review.language = TextProcessor.detect_language(f"{title}\n{text}")
+
         return reviews
 
-    def _parse_entry(self, entry: dict[str, Any], app_id: str) -> CollectedReview | None:
+    def _parse_entry(
+        self, entry: dict[str, Any], app_id: str, country: str
+    ) -> CollectedReview | None:
         """Parse a single review entry"""
         # skip metadata
         if "im:rating" not in entry:
@@ -117,9 +301,6 @@ class AppleStoreCollector(ReviewCollector):
 
             date = self._parse_apple_date(date_str)
 
-            title = TextProcessor.prepare(title)
-            text = TextProcessor.prepare(text)
-
             return CollectedReview(
                 external_id=review_id,
                 app_id=app_id,
@@ -128,7 +309,8 @@ class AppleStoreCollector(ReviewCollector):
                 rating=rating,
                 author=author,
                 date=date,
+                country=country,
             )
         except (KeyError, ValueError) as e:
-            print(f"Error parsing entry fields: {e}")
+            logger.warning("Error parsing entry fields: %s", e)
             return None
@@ -1,6 +1,8 @@
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Self
 
 
 @dataclass
@@ -14,21 +16,125 @@ class CollectedReview:
     rating: int
     author: str
     date: datetime
+    country: str = "us"
+    language: str | None = None
+
+
+@dataclass
+class PageFetch:
+    """Timing and outcome of a single page request"""
+
+    app_id: str
+    page: int
+    elapsed: float
+    attempts: int
+    reviews: int = 0
+    status_code: int | None = None
+    error: str | None = None
+
+
+@dataclass
+class CollectionStats:
+    """Per-page timings and error counts of a collection run"""
+
+    pages: list[PageFetch] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for page in self.pages if page.error)
+
+    @property
+    def retries(self) -> int:
+        return sum(page.attempts - 1 for page in self.pages)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "pages": len(self.pages),
+            "errors": self.errors,
+            "retries": self.retries,
+            "elapsed": round(self.elapsed, 3),
+            "page_timings": [
+                {
+                    "page": page.page,
+                    "elapsed": round(page.elapsed, 3),
+                    "attempts": page.attempts,
+                    "reviews": page.reviews,
+                    "status_code": page.status_code,
+                    "error": page.error,
+                }
+                for page in self.pages
+            ],
+        }
+
+
+@dataclass
+class CollectionResult:
+    """
+    Collected reviews together with run statistics
+
+    ``exhausted`` is False when the run stopped at ``limit`` (or a page cap) before
+    reaching ``since`` or the end of the feed, i.e. older reviews may be missing.
+    """
+
+    reviews: list[CollectedReview]
+    stats: CollectionStats
+    exhausted: bool = True
 
 
 class ReviewCollector(ABC):
-    """Base review collector"""
+    """
+    Base review collector
+
+    Collectors are async context managers so that several collect calls can
+    share resources such as an HTTP connection pool.
+    """
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
 
     @abstractmethod
-    async def collect(self, app_id: str, limit: int = 100) -> list[CollectedReview]:
+    async def collect(
+        self,
+        app_id: str,
+        limit: int = 100,
+        country: str = "us",
+        since: datetime | None = None,
+    ) -> list[CollectedReview]:
         """
         Collect reviews for a given app
 
         Args:
             app_id: App id
             limit: Maximum number of reviews to collect
+            country: Two-letter storefront code
+            since: High-water mark; stop once reviews older than this are reached
 
         Returns:
             List of collected reviews
         """
         pass
+
+    async def collect_with_stats(
+        self,
+        app_id: str,
+        limit: int = 100,
+        country: str = "us",
+        since: datetime | None = None,
+    ) -> CollectionResult:
+        """
+        Collect reviews and report run statistics
+
+        Collectors without page-level instrumentation only report total time, and
+        a run that filled ``limit`` counts as not exhausted.
+        """
+        started = time.perf_counter()
+        reviews = await self.collect(app_id, limit, country, since)
+        return CollectionResult(
+            reviews=reviews,
+            stats=CollectionStats(elapsed=time.perf_counter() - started),
+            exhausted=len(reviews) < limit,
+        )
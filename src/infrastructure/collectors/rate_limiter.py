@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` tokens (at most the capacity) are available and take them"""
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= amount
+
+    def charge(self, amount: float) -> None:
+        """Correct an earlier estimate; a negative amount refunds tokens"""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - amount)
+
+
+_host_limiters: dict[str, TokenBucket] = {}
+
+
+def get_host_limiter(host: str, rate: float, capacity: int) -> TokenBucket:
+    """
+    Process-wide limiter for one remote host
+
+    Collectors are created per request, so a per-instance bucket would let
+    concurrent requests each spend the full budget. The first caller's rate and
+    capacity apply to the host.
+    """
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        limiter = _host_limiters[host] = TokenBucket(rate, capacity)
+    return limiter
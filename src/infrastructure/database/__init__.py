@@ -1,4 +1,32 @@
-from .base import Base, engine, get_session
-from .models import Insight, Review, ReviewAnalysis
+from .base import Base, engine, get_pool_stats, get_read_session, get_session, read_engine
+from .models import (
+    AnalysisJob,
+    AppMetrics,
+    AppTermCount,
+    CollectionCursor,
+    Insight,
+    InsightCluster,
+    Review,
+    ReviewAnalysis,
+    ReviewDailyStats,
+    ReviewLshBand,
+)
 
-__all__ = ["Base", "engine", "get_session", "Review", "ReviewAnalysis", "Insight"]
+__all__ = [
+    "Base",
+    "engine",
+    "read_engine",
+    "get_session",
+    "get_read_session",
+    "get_pool_stats",
+    "Review",
+    "ReviewAnalysis",
+    "Insight",
+    "AnalysisJob",
+    "CollectionCursor",
+    "AppMetrics",
+    "AppTermCount",
+    "ReviewDailyStats",
+    "InsightCluster",
+    "ReviewLshBand",
+]
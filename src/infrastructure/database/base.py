@@ -1,13 +1,50 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from src.config.settings import settings
 
-engine = create_async_engine(settings.database_url)
+from .pool import TimedQueuePool
+
+
+def _create_engine(url: str, application_name: str) -> AsyncEngine:
+    server_settings = {"application_name": application_name}
+    if settings.db_statement_timeout_ms:
+        server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+    return create_async_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        connect_args={
+            # asyncpg's own cache and SQLAlchemy's; both must be 0 behind pgbouncer
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "server_settings": server_settings,
+        },
+    )
+
+
+engine = _create_engine(settings.database_url, "reviews-insights")
+# Without a replica, reads share the primary engine
+read_engine = (
+    _create_engine(settings.database_read_url, "reviews-insights-read")
+    if settings.database_read_url
+    else engine
+)
 
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+read_session_maker = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
@@ -17,3 +54,19 @@ class Base(DeclarativeBase):
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Session on the read replica, if configured; for endpoints that tolerate replica lag"""
+    async with read_session_maker() as session:
+        yield session
+
+
+def get_pool_stats() -> dict[str, Any]:
+    pools = {"primary": engine}
+    if read_engine is not engine:
+        pools["replica"] = read_engine
+    return {
+        name: pool.snapshot() if isinstance(pool := e.pool, TimedQueuePool) else {}
+        for name, e in pools.items()
+    }
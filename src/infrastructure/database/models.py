@@ -1,26 +1,94 @@
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import ARRAY, Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Boolean,
+    Computed,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy import text as sql_text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
 
+# Text search configuration of reviews.search_vector; queries must use the same one
+SEARCH_CONFIG = "english"
+
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index("ix_reviews_app_id_id", "app_id", "id"),
+        # Keyset listings order by (date, id) within an app, optionally per rating or state
+        Index("ix_reviews_app_id_date_id", "app_id", "date", "id"),
+        Index("ix_reviews_app_id_rating_date_id", "app_id", "rating", "date", "id"),
+        Index("ix_reviews_app_id_is_analyzed_date_id", "app_id", "is_analyzed", "date", "id"),
+        Index("ix_reviews_search_vector", "search_vector", postgresql_using="gin"),
+        # Claim scans walk only the app's unanalyzed representatives
+        Index(
+            "ix_reviews_app_id_id_unanalyzed",
+            "app_id",
+            "id",
+            postgresql_where=sql_text("is_analyzed IS false AND duplicate_of IS NULL"),
+        ),
+        # Lease renewal looks up a pipeline's open claims; analyzed rows drop out
+        Index(
+            "ix_reviews_claimed_by",
+            "claimed_by",
+            postgresql_where=sql_text("claimed_by IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     app_id: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
     source: Mapped[str] = mapped_column(String(50), nullable=False)
+    country: Mapped[str] = mapped_column(
+        String(2), nullable=False, default="us", server_default="us"
+    )
 
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     text: Mapped[str] = mapped_column(Text, nullable=False)
     rating: Mapped[int] = mapped_column(Integer, nullable=False)
     author: Mapped[str] = mapped_column(String(255), nullable=False)
     date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Detected at ingest (ISO 639-1 or "und"); NULL for reviews collected before detection
+    language: Mapped[str | None] = mapped_column(String(8), nullable=True)
 
     is_analyzed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, index=True)
+    # Lease held by an analysis pipeline; expired claims are free to take again
+    claimed_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    claim_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    # Near-duplicate detection: MinHash signature and the representative review, if any
+    minhash: Mapped[list[int] | None] = mapped_column(
+        ARRAY(BigInteger), nullable=True, deferred=True
+    )
+    duplicate_of: Mapped[int | None] = mapped_column(
+        ForeignKey("reviews.id", ondelete="SET NULL"), index=True, nullable=True
+    )
+
+    # Full-text search document: title weighted above body, maintained by Postgres
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(text, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=datetime.utcnow
@@ -29,6 +97,12 @@ class Review(Base):
 
 class ReviewAnalysis(Base):
     __tablename__ = "review_analysis"
+    __table_args__ = (
+        # keywords @> ARRAY[...] lookups of /keywords/reviews
+        Index("ix_review_analysis_keywords", "keywords", postgresql_using="gin"),
+        # Sentiment-filtered listings and the rollup rebuild's negative-keyword scan
+        Index("ix_review_analysis_sentiment_review_id", "sentiment", "review_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     review_id: Mapped[int] = mapped_column(
@@ -37,6 +111,8 @@ class ReviewAnalysis(Base):
 
     sentiment: Mapped[str] = mapped_column(String(50), nullable=False)
     keywords: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
+    # Who labeled it: "llm" or "fast_path"; NULL for analyses stored before this was recorded
+    source: Mapped[str | None] = mapped_column(String(16), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=datetime.utcnow
@@ -45,6 +121,14 @@ class ReviewAnalysis(Base):
 
 class Insight(Base):
     __tablename__ = "insights"
+    __table_args__ = (
+        Index(
+            "ix_insights_app_id_id_unclustered",
+            "app_id",
+            "id",
+            postgresql_where=sql_text("cluster_id IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     app_id: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
@@ -52,7 +136,153 @@ class Insight(Base):
         ForeignKey("reviews.id", ondelete="CASCADE"), index=True, nullable=False
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    cluster_id: Mapped[int | None] = mapped_column(
+        ForeignKey("insight_clusters.id", ondelete="SET NULL"), index=True, nullable=True
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=datetime.utcnow
     )
+
+
+class InsightCluster(Base):
+    """Near-duplicate insights of an app, represented by the text that founded the cluster"""
+
+    __tablename__ = "insight_clusters"
+    __table_args__ = (Index("ix_insight_clusters_app_id_size", "app_id", "size"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    app_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    label: Mapped[str] = mapped_column(Text, nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Sparse TF-IDF centroid {term: weight}, truncated to the heaviest terms
+    centroid: Mapped[dict[str, float]] = mapped_column(JSONB, nullable=False, default=dict)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+
+
+class AnalysisJob(Base):
+    __tablename__ = "analysis_jobs"
+    __table_args__ = (
+        # At most one queued or running job per app
+        Index(
+            "uq_analysis_jobs_app_id_active",
+            "app_id",
+            unique=True,
+            postgresql_where=sql_text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    app_id: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), index=True, nullable=False, default="queued")
+
+    total_reviews: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed_reviews: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class CollectionCursor(Base):
+    """Newest review seen per (source, app, country); incremental collection stops there"""
+
+    __tablename__ = "collection_cursors"
+    __table_args__ = (UniqueConstraint("source", "app_id", "country"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source: Mapped[str] = mapped_column(String(50), nullable=False)
+    app_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    country: Mapped[str] = mapped_column(String(2), nullable=False)
+
+    last_review_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_external_id: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+
+
+class AppMetrics(Base):
+    """Per-app metrics rollup, maintained incrementally on ingest and analysis"""
+
+    __tablename__ = "app_metrics"
+
+    app_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    rating_histogram: Mapped[dict[str, int]] = mapped_column(JSONB, nullable=False, default=dict)
+
+    analyzed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sentiment_counts: Mapped[dict[str, int]] = mapped_column(JSONB, nullable=False, default=dict)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+
+
+TERM_KEYWORD = "keyword"
+TERM_INSIGHT = "insight"
+
+
+class AppTermCount(Base):
+    """
+    Per-app keyword and insight counts, maintained alongside app_metrics
+
+    One narrow row per distinct term, so writes touch only the batch's terms and
+    top-N reads walk the (app_id, kind, count) index.
+    """
+
+    __tablename__ = "app_term_counts"
+    __table_args__ = (Index("ix_app_term_counts_app_id_kind_count", "app_id", "kind", "count"),)
+
+    app_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # TERM_KEYWORD or TERM_INSIGHT
+    kind: Mapped[str] = mapped_column(String(16), primary_key=True)
+    term: Mapped[str] = mapped_column(Text, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class ReviewLshBand(Base):
+    """LSH band hashes of review MinHash signatures, for near-duplicate candidate lookup"""
+
+    __tablename__ = "review_lsh_bands"
+
+    app_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    band: Mapped[int] = mapped_column(Integer, primary_key=True)
+    band_hash: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    review_id: Mapped[int] = mapped_column(
+        ForeignKey("reviews.id", ondelete="CASCADE"), primary_key=True
+    )
+
+
+UNANALYZED_SENTIMENT = "unanalyzed"
+
+
+class ReviewDailyStats(Base):
+    """
+    Review counts per app, UTC day, rating and sentiment
+
+    Reviews are counted under ``UNANALYZED_SENTIMENT`` on ingest and moved to
+    their sentiment once analyzed.
+    """
+
+    __tablename__ = "review_daily_stats"
+
+    app_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    bucket: Mapped[date] = mapped_column(Date, primary_key=True)
+    rating: Mapped[int] = mapped_column(Integer, primary_key=True)
+    sentiment: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,82 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Checkout waits kept for percentiles
+RECENT_WAITS = 1_000
+
+
+@dataclass
+class PoolCheckoutStats:
+    """Process-local connection checkout timings of one pool"""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=RECENT_WAITS))
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        self.recent.append(wait)
+
+    def as_dict(self) -> dict[str, Any]:
+        recent = sorted(self.recent)
+
+        def percentile(p: float) -> float:
+            return round(recent[min(len(recent) - 1, int(p * len(recent)))], 6) if recent else 0.0
+
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6)
+            if self.checkouts
+            else 0.0,
+            "wait_seconds_p50": percentile(0.5),
+            "wait_seconds_p95": percentile(0.95),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waits
+
+    The time covers waiting for a free connection and, when the pool grows,
+    opening a new one.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = PoolCheckoutStats()
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.checkout_stats.timeouts += 1
+            raise
+        self.checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "TimedQueuePool":
+        pool = super().recreate()
+        # Keep counters across engine.dispose()
+        pool.checkout_stats = self.checkout_stats
+        return pool
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "idle": self.checkedin(),
+            **self.checkout_stats.as_dict(),
+        }
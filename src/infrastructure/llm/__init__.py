@@ -1,5 +1,25 @@
-from src.infrastructure.llm.base import LLMService
+from src.infrastructure.llm.base import (
+    InvalidLLMResponseError,
+    LLMService,
+    ReviewAnalysisResult,
+    ReviewInput,
+)
+from src.infrastructure.llm.cache import CachedLLMService
 from src.infrastructure.llm.factory import LLMServiceFactory
+from src.infrastructure.llm.fast_path import FastPathLLMService
+from src.infrastructure.llm.local_sentiment import LexiconSentimentClassifier
+from src.infrastructure.llm.openai_batch_service import OpenAIBatchService
 from src.infrastructure.llm.openai_service import OpenAIService
 
-__all__ = ["LLMService", "LLMServiceFactory", "OpenAIService"]
+__all__ = [
+    "CachedLLMService",
+    "FastPathLLMService",
+    "InvalidLLMResponseError",
+    "LexiconSentimentClassifier",
+    "LLMService",
+    "LLMServiceFactory",
+    "OpenAIBatchService",
+    "OpenAIService",
+    "ReviewAnalysisResult",
+    "ReviewInput",
+]
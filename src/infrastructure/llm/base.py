@@ -1,7 +1,46 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+
+class InvalidLLMResponseError(ValueError):
+    """The model refused or returned output that doesn't match the expected schema"""
+
+
+@dataclass
+class ReviewInput:
+    """Review payload for batched analysis"""
+
+    review_id: int
+    text: str
+    rating: int
+
+
+# Provenance of a stored analysis, so local labels are never mistaken for model labels
+ANALYSIS_SOURCE_LLM = "llm"
+ANALYSIS_SOURCE_FAST_PATH = "fast_path"
+
+
+@dataclass
+class ReviewAnalysisResult:
+    """Sentiment, keywords and insights for a single review"""
+
+    sentiment: str
+    keywords: list[str] = field(default_factory=list)
+    insights: list[str] = field(default_factory=list)
+    # None for analyses stored before provenance was recorded
+    source: str | None = ANALYSIS_SOURCE_LLM
 
 
 class LLMService(ABC):
+    def cache_namespace(self, operation: str) -> str:
+        """
+        Identify the model, prompt template and system message behind an operation
+
+        Results are only reused across calls with the same namespace, so it must
+        change whenever any of them changes.
+        """
+        return f"{type(self).__name__}:{operation}"
+
     @abstractmethod
     async def analyze_sentiment(self, text: str, rating: int) -> str:
         pass
@@ -13,3 +52,34 @@ class LLMService(ABC):
     @abstractmethod
     async def generate_insights(self, text: str, rating: int) -> list[str]:
         pass
+
+    @abstractmethod
+    async def analyze_review(self, text: str, rating: int) -> ReviewAnalysisResult:
+        """
+        Analyze sentiment, keywords and insights of a review in a single call
+
+        Args:
+            text: Review text
+            rating: Review rating (1-5)
+
+        Returns:
+            Analysis result; keywords and insights are empty for non-negative reviews
+
+        Raises:
+            InvalidLLMResponseError: The model gave no usable analysis
+        """
+        pass
+
+    @abstractmethod
+    async def analyze_batch(self, reviews: list[ReviewInput]) -> dict[int, ReviewAnalysisResult]:
+        """
+        Analyze several reviews in a single request
+
+        Args:
+            reviews: Reviews to analyze
+
+        Returns:
+            Analysis results keyed by review id; reviews without a usable analysis
+            are left out
+        """
+        pass
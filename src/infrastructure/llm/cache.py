@@ -0,0 +1,190 @@
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.config.settings import settings
+from src.infrastructure.cache import TTLLRUCache, get_redis
+from src.infrastructure.llm.base import LLMService, ReviewAnalysisResult, ReviewInput
+from src.infrastructure.text_processing import TextProcessor
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm:v2:"
+
+
+@dataclass
+class LLMCacheStats:
+    """Process-local cache counters"""
+
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        lookups = self.memory_hits + self.redis_hits + self.misses
+        hits = self.memory_hits + self.redis_hits
+        return {
+            **asdict(self),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "saved_calls": hits,
+        }
+
+
+class LLMResultCache:
+    """Two-tier cache: in-process LRU in front of Redis, both with TTL"""
+
+    def __init__(self, redis: Redis | None, memory_size: int, ttl_seconds: int):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.memory = TTLLRUCache(memory_size, ttl_seconds)
+        self.stats = LLMCacheStats()
+
+    @staticmethod
+    def make_key(namespace: str, text: str, rating: int | None) -> str:
+        payload = json.dumps([namespace, TextProcessor.normalized_hash(text), rating])
+        return KEY_PREFIX + hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        found: dict[str, Any] = {}
+        remote: list[str] = []
+        for key in keys:
+            value = self.memory.get(key)
+            if value is None:
+                remote.append(key)
+            else:
+                found[key] = value
+                self.stats.memory_hits += 1
+
+        if remote and self.redis is not None:
+            try:
+                raw_values = await self.redis.mget(remote)
+            except (RedisError, OSError) as e:
+                logger.warning("LLM cache read failed: %s", e)
+                self.stats.errors += 1
+                raw_values = [None] * len(remote)
+
+            for key, raw in zip(remote, raw_values, strict=True):
+                if raw is None:
+                    continue
+                value = json.loads(raw)
+                found[key] = value
+                self.memory.set(key, value)
+                self.stats.redis_hits += 1
+
+        self.stats.misses += len(keys) - len(found)
+        return found
+
+    async def set_many(self, items: dict[str, Any]) -> None:
+        if not items:
+            return
+
+        for key, value in items.items():
+            self.memory.set(key, value)
+
+        if self.redis is None:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, json.dumps(value, ensure_ascii=False), ex=self.ttl_seconds)
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning("LLM cache write failed: %s", e)
+            self.stats.errors += 1
+
+
+@lru_cache
+def get_llm_result_cache() -> LLMResultCache:
+    """Process-wide LLM result cache shared by every CachedLLMService"""
+    return LLMResultCache(
+        redis=get_redis(),
+        memory_size=settings.llm_cache_memory_size,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+    )
+
+
+class CachedLLMService(LLMService):
+    """Content-addressed caching decorator around another LLMService"""
+
+    def __init__(self, inner: LLMService, cache: LLMResultCache | None = None):
+        self.inner = inner
+        self.cache = cache or get_llm_result_cache()
+
+    def cache_namespace(self, operation: str) -> str:
+        return self.inner.cache_namespace(operation)
+
+    async def _cached(
+        self,
+        operation: str,
+        text: str,
+        rating: int | None,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        key = self.cache.make_key(self.cache_namespace(operation), text, rating)
+        found = await self.cache.get_many([key])
+        if key in found:
+            return found[key]
+
+        value = await compute()
+        await self.cache.set_many({key: value})
+        return value
+
+    async def analyze_sentiment(self, text: str, rating: int) -> str:
+        return await self._cached(
+            "analyze_sentiment", text, rating, lambda: self.inner.analyze_sentiment(text, rating)
+        )
+
+    async def extract_keywords(self, text: str) -> list[str]:
+        return await self._cached(
+            "extract_keywords", text, None, lambda: self.inner.extract_keywords(text)
+        )
+
+    async def generate_insights(self, text: str, rating: int) -> list[str]:
+        return await self._cached(
+            "generate_insights", text, rating, lambda: self.inner.generate_insights(text, rating)
+        )
+
+    async def analyze_review(self, text: str, rating: int) -> ReviewAnalysisResult:
+        async def compute() -> dict[str, Any]:
+            return asdict(await self.inner.analyze_review(text, rating))
+
+        return ReviewAnalysisResult(**await self._cached("analyze_review", text, rating, compute))
+
+    async def analyze_batch(self, reviews: list[ReviewInput]) -> dict[int, ReviewAnalysisResult]:
+        if not reviews:
+            return {}
+
+        namespace = self.cache_namespace("analyze_batch")
+        keys = {r.review_id: self.cache.make_key(namespace, r.text, r.rating) for r in reviews}
+        found = await self.cache.get_many(list(dict.fromkeys(keys.values())))
+
+        # Identical texts within the batch are sent to the model only once
+        pending: dict[str, ReviewInput] = {}
+        for review in reviews:
+            key = keys[review.review_id]
+            if key not in found and key not in pending:
+                pending[key] = review
+
+        if pending:
+            computed = await self.inner.analyze_batch(list(pending.values()))
+            fresh = {
+                key: asdict(computed[review.review_id])
+                for key, review in pending.items()
+                if review.review_id in computed
+            }
+            await self.cache.set_many(fresh)
+            found.update(fresh)
+
+        return {
+            review_id: ReviewAnalysisResult(**found[key])
+            for review_id, key in keys.items()
+            if key in found
+        }
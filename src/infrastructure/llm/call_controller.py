@@ -0,0 +1,333 @@
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any
+
+import openai
+
+from src.config.settings import settings
+from src.infrastructure.collectors.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Buckets hold this share of the per-minute limits, as providers enforce them in sub-minute windows
+BURST_WINDOW_SECONDS = 10
+# Multiplicative decreases closer together than this count as one rate-limit event
+DECREASE_COOLDOWN_SECONDS = 2.0
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+# Errors that say nothing about the provider's health
+_CLIENT_ERRORS = (openai.BadRequestError, openai.AuthenticationError, openai.PermissionDeniedError)
+
+
+class CircuitOpenError(RuntimeError):
+    """The LLM provider is failing; calls are rejected until the breaker closes"""
+
+
+class AdmissionTimeoutError(TimeoutError):
+    """The call's deadline passed while it waited for capacity"""
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency limit
+
+    Each success raises the limit by ``1 / limit`` (about +1 per round of calls);
+    a rate-limit response halves it and pauses new calls for the retry-after time.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self.waiting = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        self.waiting += 1
+        try:
+            async with self._changed:
+                while True:
+                    pause = self._paused_until - time.monotonic()
+                    if pause <= 0 and self.in_flight < int(self.limit):
+                        self.in_flight += 1
+                        return
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), pause if pause > 0 else None)
+                    except TimeoutError:
+                        pass
+        finally:
+            self.waiting -= 1
+
+    async def release(self, succeeded: bool) -> None:
+        async with self._changed:
+            self.in_flight -= 1
+            if succeeded:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._changed.notify_all()
+
+    async def on_rate_limited(self, retry_after: float) -> None:
+        async with self._changed:
+            now = time.monotonic()
+            if now - self._last_decrease >= DECREASE_COOLDOWN_SECONDS:
+                self.limit = max(self.minimum, self.limit / 2)
+                self._last_decrease = now
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    Opens after ``failure_threshold`` failed calls in a row. Once ``reset_seconds``
+    have passed, one probe call is let through and the timer restarts; the probe's
+    outcome closes or reopens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "open":
+            raise CircuitOpenError("LLM circuit breaker is open")
+        if state == "half_open":
+            # Later calls see the circuit open again until the probe reports back
+            self._opened_at = time.monotonic()
+            self._probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning("LLM circuit breaker opened after %d failures", self.failures)
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+
+@dataclass
+class LLMCallStats:
+    """Process-local call counters"""
+
+    calls: int = 0
+    succeeded: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    rejected: int = 0
+
+
+class LLMCallController:
+    """
+    Admission, retry and failure handling for provider calls
+
+    A call waits for a concurrency slot and for request and token budget, then
+    runs under the per-attempt timeout. Rate limits, timeouts, connection errors
+    and 5xx responses are retried with full-jitter backoff (at least the
+    retry-after time) until the call's deadline.
+    """
+
+    def __init__(
+        self,
+        concurrency: AdaptiveConcurrency,
+        requests: TokenBucket,
+        tokens: TokenBucket,
+        breaker: CircuitBreaker,
+        max_retries: int,
+        deadline_seconds: float,
+        attempt_timeout: float,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        self.concurrency = concurrency
+        self.requests = requests
+        self.tokens = tokens
+        self.breaker = breaker
+        self.max_retries = max_retries
+        self.deadline_seconds = deadline_seconds
+        self.attempt_timeout = attempt_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = LLMCallStats()
+
+    async def run[T](
+        self,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int,
+        used_tokens: Callable[[T], int | None] | None = None,
+    ) -> T:
+        """Run ``call`` under the limits; ``used_tokens`` reports actual usage from its result"""
+        self.stats.calls += 1
+        deadline = time.monotonic() + self.deadline_seconds
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self.stats.rejected += 1
+                raise
+
+            try:
+                result = await self._attempt(call, estimated_tokens, used_tokens, deadline)
+            except Exception as e:
+                retry_after = await self._on_error(e)
+                remaining = deadline - time.monotonic()
+                if retry_after is None or attempt > self.max_retries or remaining <= 0:
+                    raise
+                delay = max(retry_after, self._backoff(attempt))
+                if delay >= remaining:
+                    raise
+                self.stats.retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            self.stats.succeeded += 1
+            return result
+
+    async def _attempt[T](
+        self,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int,
+        used_tokens: Callable[[T], int | None] | None,
+        deadline: float,
+    ) -> T:
+        try:
+            async with asyncio.timeout_at(_loop_time(deadline)):
+                await self.concurrency.acquire()
+        except TimeoutError as e:
+            raise AdmissionTimeoutError("Deadline passed waiting for a concurrency slot") from e
+        succeeded = False
+        try:
+            try:
+                async with asyncio.timeout_at(_loop_time(deadline)):
+                    await self.requests.acquire()
+                    await self.tokens.acquire(estimated_tokens)
+            except TimeoutError as e:
+                raise AdmissionTimeoutError("Deadline passed waiting for rate-limit budget") from e
+            async with asyncio.timeout(min(self.attempt_timeout, deadline - time.monotonic())):
+                result = await call()
+            succeeded = True
+        finally:
+            await self.concurrency.release(succeeded)
+
+        actual = used_tokens(result) if used_tokens is not None else None
+        if actual is not None:
+            self.tokens.charge(actual - estimated_tokens)
+        return result
+
+    async def _on_error(self, error: Exception) -> float | None:
+        """Record a failed attempt; returns the minimum wait before a retry, None if final"""
+        if isinstance(error, AdmissionTimeoutError):
+            # Local queueing says nothing about the provider
+            return None
+        if isinstance(error, openai.RateLimitError):
+            # The provider is up, just saturated
+            self.breaker.record_success()
+            self.stats.rate_limited += 1
+            retry_after = _retry_after(error.response) or DEFAULT_RETRY_AFTER_SECONDS
+            await self.concurrency.on_rate_limited(retry_after)
+            return retry_after
+        if isinstance(error, TimeoutError | openai.APITimeoutError):
+            self.stats.timeouts += 1
+            self.breaker.record_failure()
+            return 0.0
+        if isinstance(error, openai.APIConnectionError | openai.InternalServerError):
+            self.stats.failures += 1
+            self.breaker.record_failure()
+            response = getattr(error, "response", None)
+            return _retry_after(response) or 0.0
+        if isinstance(error, _CLIENT_ERRORS):
+            self.breaker.record_success()
+        else:
+            self.stats.failures += 1
+            self.breaker.record_failure()
+        return None
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            **asdict(self.stats),
+            "concurrency_limit": round(self.concurrency.limit, 2),
+            "in_flight": self.concurrency.in_flight,
+            "queue_depth": self.concurrency.waiting,
+            "requests_available": round(self.requests.available, 1),
+            "tokens_available": round(self.tokens.available),
+            "circuit": self.breaker.state,
+        }
+
+
+def _loop_time(monotonic_deadline: float) -> float:
+    """Convert a time.monotonic() deadline to the event loop's clock"""
+    return asyncio.get_running_loop().time() + (monotonic_deadline - time.monotonic())
+
+
+def _retry_after(response: Any) -> float | None:
+    """Seconds from retry-after-ms / retry-after headers, if present"""
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if value := headers.get("retry-after-ms"):
+            return float(value) / 1000
+        if value := headers.get("retry-after"):
+            return float(value)
+    except ValueError:
+        return None
+    return None
+
+
+@lru_cache
+def get_llm_call_controller() -> LLMCallController:
+    """Process-wide controller shared by every LLMService, so limits apply to the whole process"""
+    return LLMCallController(
+        concurrency=AdaptiveConcurrency(
+            initial=settings.llm_max_concurrency,
+            minimum=settings.llm_min_concurrency,
+            maximum=settings.llm_max_concurrency,
+        ),
+        requests=TokenBucket(
+            settings.llm_requests_per_minute / 60,
+            max(1, settings.llm_requests_per_minute * BURST_WINDOW_SECONDS // 60),
+        ),
+        tokens=TokenBucket(
+            settings.llm_tokens_per_minute / 60,
+            max(1, settings.llm_tokens_per_minute * BURST_WINDOW_SECONDS // 60),
+        ),
+        breaker=CircuitBreaker(
+            failure_threshold=settings.llm_breaker_failure_threshold,
+            reset_seconds=settings.llm_breaker_reset_seconds,
+        ),
+        max_retries=settings.llm_max_retries,
+        deadline_seconds=settings.llm_call_deadline_seconds,
+        attempt_timeout=settings.llm_request_timeout_seconds,
+    )
@@ -1,10 +1,15 @@
+from src.config.settings import settings
 from src.infrastructure.llm.base import LLMService
+from src.infrastructure.llm.cache import CachedLLMService
+from src.infrastructure.llm.fast_path import FastPathLLMService
+from src.infrastructure.llm.openai_batch_service import OpenAIBatchService
 from src.infrastructure.llm.openai_service import OpenAIService
 
 
 class LLMServiceFactory:
     _services: dict[str, type[LLMService]] = {
         "openai": OpenAIService,
+        "openai_batch": OpenAIBatchService,
     }
 
     @classmethod
@@ -12,7 +17,14 @@ class LLMServiceFactory:
         service_class = cls._services.get(service_type)
         if not service_class:
             raise ValueError(f"Unknown LLM service type: {service_type}")
-        return service_class()
+
+        service: LLMService = service_class()
+        if settings.llm_cache_enabled:
+            service = CachedLLMService(service)
+        if settings.fast_path_enabled:
+            # Confident local calls never reach the cache or the model
+            service = FastPathLLMService(service)
+        return service
 
     @classmethod
     def register(cls, name: str, service_class: type[LLMService]) -> None:
@@ -0,0 +1,252 @@
+"""
+Offline stand-in for the OpenAI endpoints this service uses
+
+Serves chat completions, files and batches with deterministic answers from the
+local lexicon classifier, so the real-time and Batch API flows can be exercised
+without network access or an API key:
+
+    python -m src.infrastructure.llm.fake_openai_server --port 8100
+    OPENAI_BASE_URL=http://localhost:8100/v1 python -m src.presentation.cli backfill
+"""
+
+import argparse
+import json
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import Response
+
+from src.infrastructure.llm.local_sentiment import LexiconSentimentClassifier
+from src.infrastructure.text_processing import tokenize
+
+# The batch prompt embeds its reviews as a single-line JSON array
+_REVIEWS_RE = re.compile(r"^\[\{.*\}\]$", re.MULTILINE)
+
+
+@dataclass
+class _FakeBatch:
+    id: str
+    input_file_id: str
+    endpoint: str
+    created_at: int
+    ready_at: float
+    metadata: dict[str, str] | None
+    status: str = "validating"
+    output_file_id: str | None = None
+    request_counts: dict[str, int] = field(
+        default_factory=lambda: {"total": 0, "completed": 0, "failed": 0}
+    )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "object": "batch",
+            "endpoint": self.endpoint,
+            "input_file_id": self.input_file_id,
+            "completion_window": "24h",
+            "status": self.status,
+            "created_at": self.created_at,
+            "output_file_id": self.output_file_id,
+            "error_file_id": None,
+            "errors": None,
+            "request_counts": self.request_counts,
+            "metadata": self.metadata,
+        }
+
+
+class FakeOpenAI:
+    """
+    In-memory file store, batch queue and answer generator
+
+    Batch requests whose custom_id is in ``failing_custom_ids`` come back as
+    server errors, to exercise partial batch results.
+    """
+
+    def __init__(self, batch_delay: float = 1.0, failing_custom_ids: frozenset[str] = frozenset()):
+        self.batch_delay = batch_delay
+        self.failing_custom_ids = failing_custom_ids
+        self.classifier = LexiconSentimentClassifier()
+        self.files: dict[str, tuple[dict[str, Any], bytes]] = {}
+        self.batches: dict[str, _FakeBatch] = {}
+
+    def analyze(self, text: str, rating: int) -> dict[str, Any]:
+        sentiment = self.classifier.classify(text, rating).sentiment
+        if sentiment != "negative":
+            return {"sentiment": sentiment, "keywords": [], "insights": []}
+        terms = sorted(set(tokenize(text)), key=lambda t: (-len(t), t))[:3]
+        return {
+            "sentiment": sentiment,
+            "keywords": terms,
+            "insights": [f"Investigate complaints about {term}" for term in terms[:1]],
+        }
+
+    def complete(self, body: dict[str, Any]) -> dict[str, Any]:
+        """A chat completion whose content matches the requested JSON schema"""
+        prompt = body["messages"][-1]["content"]
+        schema_name = (body.get("response_format") or {}).get("json_schema", {}).get("name")
+
+        if schema_name == "batch_analysis" and (match := _REVIEWS_RE.search(prompt)):
+            reviews = json.loads(match.group())
+            content: dict[str, Any] = {
+                "results": [
+                    {"id": r["id"], **self.analyze(r["text"], r["rating"])} for r in reviews
+                ]
+            }
+        else:
+            # Single-review prompts: classify the whole prompt without a rating prior
+            analysis = self.analyze(prompt, 3)
+            content = {
+                "sentiment": {"sentiment": analysis["sentiment"]},
+                "keywords": {"keywords": analysis["keywords"]},
+                "insights": {"insights": analysis["insights"]},
+            }.get(schema_name or "", analysis)
+
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": json.dumps(content)},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    def add_file(self, filename: str, purpose: str, data: bytes) -> dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex}"
+        meta = {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+        self.files[file_id] = (meta, data)
+        return meta
+
+    def get_batch(self, batch_id: str) -> _FakeBatch:
+        batch = self.batches.get(batch_id)
+        if batch is None:
+            raise HTTPException(status_code=404, detail="No such batch")
+        if batch.status in ("validating", "in_progress") and time.monotonic() >= batch.ready_at:
+            self._run(batch)
+        elif batch.status == "validating":
+            batch.status = "in_progress"
+        return batch
+
+    def _run(self, batch: _FakeBatch) -> None:
+        lines = []
+        failed = 0
+        for raw in self.files[batch.input_file_id][1].decode().splitlines():
+            if not raw.strip():
+                continue
+            request = json.loads(raw)
+            if request["custom_id"] in self.failing_custom_ids:
+                failed += 1
+                response = {
+                    "status_code": 500,
+                    "body": {"error": {"message": "Fake server error", "type": "server_error"}},
+                }
+            else:
+                response = {"status_code": 200, "body": self.complete(request["body"])}
+            lines.append(
+                json.dumps(
+                    {
+                        "id": f"batch_req_{uuid.uuid4().hex}",
+                        "custom_id": request["custom_id"],
+                        "response": response,
+                        "error": None,
+                    }
+                )
+            )
+        output = self.add_file("batch_output.jsonl", "batch_output", "\n".join(lines).encode())
+        batch.output_file_id = output["id"]
+        batch.request_counts = {
+            "total": len(lines),
+            "completed": len(lines) - failed,
+            "failed": failed,
+        }
+        batch.status = "completed"
+
+
+def create_app(
+    batch_delay: float = 1.0, failing_custom_ids: frozenset[str] = frozenset()
+) -> FastAPI:
+    fake = FakeOpenAI(batch_delay, failing_custom_ids)
+    app = FastAPI(title="Fake OpenAI")
+    app.state.fake = fake
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(body: dict[str, Any]):
+        return fake.complete(body)
+
+    @app.post("/v1/files")
+    async def upload_file(file: UploadFile = File(...), purpose: str = Form(...)):
+        return fake.add_file(file.filename or "upload.jsonl", purpose, await file.read())
+
+    @app.get("/v1/files/{file_id}/content")
+    async def file_content(file_id: str):
+        if file_id not in fake.files:
+            raise HTTPException(status_code=404, detail="No such file")
+        return Response(fake.files[file_id][1], media_type="application/octet-stream")
+
+    @app.delete("/v1/files/{file_id}")
+    async def delete_file(file_id: str):
+        if fake.files.pop(file_id, None) is None:
+            raise HTTPException(status_code=404, detail="No such file")
+        return {"id": file_id, "object": "file", "deleted": True}
+
+    @app.post("/v1/batches")
+    async def create_batch(body: dict[str, Any]):
+        if body.get("input_file_id") not in fake.files:
+            raise HTTPException(status_code=400, detail="Unknown input_file_id")
+        batch = _FakeBatch(
+            id=f"batch_{uuid.uuid4().hex}",
+            input_file_id=body["input_file_id"],
+            endpoint=body.get("endpoint", "/v1/chat/completions"),
+            created_at=int(time.time()),
+            ready_at=time.monotonic() + fake.batch_delay,
+            metadata=body.get("metadata"),
+        )
+        fake.batches[batch.id] = batch
+        return batch.as_dict()
+
+    @app.get("/v1/batches/{batch_id}")
+    async def retrieve_batch(batch_id: str):
+        return fake.get_batch(batch_id).as_dict()
+
+    @app.post("/v1/batches/{batch_id}/cancel")
+    async def cancel_batch(batch_id: str):
+        batch = fake.get_batch(batch_id)
+        if batch.status not in ("completed", "failed", "expired"):
+            batch.status = "cancelled"
+        return batch.as_dict()
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(prog="python -m src.infrastructure.llm.fake_openai_server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument(
+        "--batch-delay", type=float, default=1.0, help="Seconds before a batch completes"
+    )
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.batch_delay), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any
+
+from src.config.settings import settings
+from src.infrastructure.llm.base import (
+    ANALYSIS_SOURCE_FAST_PATH,
+    LLMService,
+    ReviewAnalysisResult,
+    ReviewInput,
+)
+from src.infrastructure.llm.local_sentiment import LexiconSentimentClassifier
+
+
+@dataclass
+class FastPathStats:
+    """Process-local counters of locally settled vs forwarded reviews"""
+
+    settled: int = 0
+    forwarded: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        total = self.settled + self.forwarded
+        return {**asdict(self), "settled_rate": round(self.settled / total, 4) if total else 0.0}
+
+
+@lru_cache
+def get_fast_path_stats() -> FastPathStats:
+    return FastPathStats()
+
+
+def evaluation_sample_filter(review_id: Any, percent: int | None = None) -> Any:
+    """
+    Whether a review id falls in the evaluation sample
+
+    Works on ints and on SQL column expressions alike, so the fast path and
+    the label query agree on the sample.
+    """
+    if percent is None:
+        percent = settings.fast_path_sample_percent
+    return review_id % 100 < percent
+
+
+class FastPathLLMService(LLMService):
+    """
+    Settles confident sentiment calls locally and forwards the rest
+
+    Full analyses are settled only for non-negative reviews: the model extracts
+    keywords and insights for negative reviews alone, so for the others a local
+    sentiment is the whole answer. Batches always forward the reviews in the
+    evaluation sample, so their LLM labels cover confident reviews too.
+    """
+
+    def __init__(
+        self,
+        inner: LLMService,
+        classifier: LexiconSentimentClassifier | None = None,
+        threshold: float | None = None,
+        sample_percent: int | None = None,
+    ):
+        self.inner = inner
+        self.classifier = classifier or LexiconSentimentClassifier()
+        self.threshold = threshold if threshold is not None else settings.fast_path_threshold
+        self.sample_percent = (
+            sample_percent if sample_percent is not None else settings.fast_path_sample_percent
+        )
+        self.stats = get_fast_path_stats()
+
+    def cache_namespace(self, operation: str) -> str:
+        return self.inner.cache_namespace(operation)
+
+    def _settle(self, text: str, rating: int, allow_negative: bool) -> str | None:
+        prediction = self.classifier.classify(text, rating)
+        if prediction.confidence < self.threshold:
+            return None
+        if prediction.sentiment == "negative" and not allow_negative:
+            return None
+        return prediction.sentiment
+
+    async def analyze_sentiment(self, text: str, rating: int) -> str:
+        sentiment = self._settle(text, rating, allow_negative=True)
+        if sentiment is not None:
+            self.stats.settled += 1
+            return sentiment
+        self.stats.forwarded += 1
+        return await self.inner.analyze_sentiment(text, rating)
+
+    async def extract_keywords(self, text: str) -> list[str]:
+        return await self.inner.extract_keywords(text)
+
+    async def generate_insights(self, text: str, rating: int) -> list[str]:
+        return await self.inner.generate_insights(text, rating)
+
+    async def analyze_review(self, text: str, rating: int) -> ReviewAnalysisResult:
+        sentiment = self._settle(text, rating, allow_negative=False)
+        if sentiment is not None:
+            self.stats.settled += 1
+            return ReviewAnalysisResult(sentiment=sentiment, source=ANALYSIS_SOURCE_FAST_PATH)
+        self.stats.forwarded += 1
+        return await self.inner.analyze_review(text, rating)
+
+    async def analyze_batch(self, reviews: list[ReviewInput]) -> dict[int, ReviewAnalysisResult]:
+        results: dict[int, ReviewAnalysisResult] = {}
+        pending: list[ReviewInput] = []
+        for review in reviews:
+            if evaluation_sample_filter(review.review_id, self.sample_percent):
+                pending.append(review)
+                continue
+            sentiment = self._settle(review.text, review.rating, allow_negative=False)
+            if sentiment is None:
+                pending.append(review)
+            else:
+                results[review.review_id] = ReviewAnalysisResult(
+                    sentiment=sentiment, source=ANALYSIS_SOURCE_FAST_PATH
+                )
+
+        self.stats.settled += len(results)
+        self.stats.forwarded += len(pending)
+        if pending:
+            results.update(await self.inner.analyze_batch(pending))
+        return results
@@ -0,0 +1,111 @@
+import math
+import re
+from dataclasses import dataclass
+
+from src.infrastructure.text_processing import TextProcessor
+
+_TOKEN_RE = re.compile(r"[a-z]+(?:'[a-z]+)?|[\U0001F300-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF]")
+
+_POSITIVE = {
+    "love": 2.0, "loved": 2.0, "loving": 1.5, "amazing": 2.0, "awesome": 2.0, "excellent": 2.0,
+    "great": 1.5, "perfect": 2.0, "fantastic": 2.0, "wonderful": 2.0, "best": 1.5,
+    "brilliant": 2.0, "outstanding": 2.0, "superb": 2.0, "incredible": 1.5, "good": 1.0,
+    "nice": 1.0, "helpful": 1.0, "useful": 1.0, "easy": 1.0, "intuitive": 1.0, "smooth": 1.0,
+    "fast": 0.8, "reliable": 1.0, "recommend": 1.5, "recommended": 1.5, "enjoy": 1.2,
+    "enjoying": 1.2, "fun": 1.0, "beautiful": 1.2, "favorite": 1.5, "favourite": 1.5,
+    "thanks": 0.8, "thank": 0.8, "satisfied": 1.2, "happy": 1.2, "glad": 1.0, "solid": 0.8,
+    "works": 0.5, "worth": 1.0, "pleased": 1.2, "impressive": 1.5, "lifesaver": 2.0,
+    "❤": 2.0, "😍": 2.0, "👍": 1.5, "😊": 1.5, "🔥": 1.0, "⭐": 1.0, "🙌": 1.5, "💯": 1.5,
+}  # fmt: skip
+
+_NEGATIVE = {
+    "hate": 2.0, "terrible": 2.0, "awful": 2.0, "horrible": 2.0, "worst": 2.0, "useless": 2.0,
+    "garbage": 2.0, "trash": 2.0, "scam": 2.0, "broken": 1.8, "bad": 1.2, "poor": 1.2,
+    "crash": 1.8, "crashes": 1.8, "crashing": 1.8, "crashed": 1.8, "bug": 1.2, "bugs": 1.2,
+    "buggy": 1.5, "glitch": 1.2, "glitches": 1.2, "freeze": 1.5, "freezes": 1.5,
+    "frozen": 1.5, "slow": 1.0, "laggy": 1.2, "lag": 1.0, "error": 1.2, "errors": 1.2,
+    "fail": 1.5, "fails": 1.5, "failed": 1.5, "failing": 1.5, "annoying": 1.2,
+    "disappointed": 1.5, "disappointing": 1.5, "frustrating": 1.5, "waste": 1.8,
+    "refund": 1.5, "unusable": 2.0, "expensive": 1.0, "overpriced": 1.2, "ads": 0.8,
+    "spam": 1.5, "problem": 1.0, "problems": 1.0, "issue": 0.8, "issues": 0.8, "fix": 0.8,
+    "uninstall": 1.5, "uninstalled": 1.5, "deleted": 1.0, "cancel": 1.0, "ripoff": 2.0,
+    "worse": 1.5, "stopped": 1.0, "doesn't": 0.8, "can't": 0.8, "cannot": 0.8, "won't": 0.8,
+    "😡": 2.0, "😠": 2.0, "👎": 1.5, "😞": 1.5, "😢": 1.2, "🤬": 2.0, "💩": 2.0,
+}  # fmt: skip
+
+_NEGATIONS = frozenset(
+    "not no never don't didn't isn't wasn't aren't hardly without nothing".split()
+)
+_INTENSIFIERS = frozenset("very really so extremely super absolutely totally too".split())
+_CONTRAST = frozenset("but however although though".split())
+
+# Ratings map to a prior in [-1, 1]
+_RATING_PRIOR = {1: -1.0, 2: -0.6, 3: 0.0, 4: 0.6, 5: 1.0}
+_RATING_WEIGHT = 0.6
+_POLAR_CUTOFF = 0.3
+# The lexicon is English; "und" covers short texts without stopwords ("Great!!")
+LEXICON_LANGUAGES = frozenset({"en", "und"})
+# Neutral is the hardest class to call locally; cap its confidence below typical thresholds
+_NEUTRAL_MAX_CONFIDENCE = 0.7
+
+
+@dataclass
+class SentimentPrediction:
+    sentiment: str
+    confidence: float
+    score: float
+
+
+class LexiconSentimentClassifier:
+    """
+    CPU-only sentiment pre-classifier
+
+    Blends a rating prior with a lexicon score that handles negation ("not
+    good"), intensifiers and contrast ("..., but it crashes" weighs the clause
+    after "but" more). Confidence grows with the distance of the blended score
+    from the neutral band. Texts in other languages get zero confidence, so they
+    are never settled locally.
+    """
+
+    def lexicon_score(self, text: str) -> float:
+        """Lexicon polarity squashed to (-1, 1)"""
+        total = 0.0
+        negate_window = 0
+        boost = 1.0
+        clause_weight = 1.0
+        for token in _TOKEN_RE.findall(text.lower()):
+            if token in _CONTRAST:
+                # Down-weight what came before the contrast, emphasise what follows
+                total *= 0.5
+                clause_weight = 1.5
+                continue
+            if token in _NEGATIONS:
+                negate_window = 3
+                continue
+            if token in _INTENSIFIERS:
+                boost = 1.5
+                continue
+
+            weight = _POSITIVE.get(token, 0.0) - _NEGATIVE.get(token, 0.0)
+            if weight:
+                if negate_window:
+                    weight = -weight * 0.8
+                total += weight * boost * clause_weight
+            boost = 1.0
+            negate_window = max(0, negate_window - 1)
+        return math.tanh(total / 3)
+
+    def classify(self, text: str, rating: int) -> SentimentPrediction:
+        prior = _RATING_PRIOR.get(rating, 0.0)
+        score = _RATING_WEIGHT * prior + (1 - _RATING_WEIGHT) * self.lexicon_score(text)
+
+        distance = abs(score)
+        if distance >= _POLAR_CUTOFF:
+            sentiment = "positive" if score > 0 else "negative"
+            confidence = 0.5 + 0.5 * min(1.0, (distance - _POLAR_CUTOFF) / (1 - _POLAR_CUTOFF))
+        else:
+            sentiment = "neutral"
+            confidence = _NEUTRAL_MAX_CONFIDENCE * (1 - distance / _POLAR_CUTOFF)
+        if TextProcessor.detect_language(text) not in LEXICON_LANGUAGES:
+            confidence = 0.0
+        return SentimentPrediction(sentiment, round(confidence, 4), round(score, 4))
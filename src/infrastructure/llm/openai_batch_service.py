@@ -0,0 +1,142 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Any
+
+from openai import OpenAIError
+
+from src.config.settings import settings
+from src.infrastructure.llm.base import ReviewAnalysisResult, ReviewInput
+from src.infrastructure.llm.openai_service import OpenAIService
+from src.infrastructure.llm.response_schemas import BATCH_ANALYSIS_SCHEMA, json_schema_format
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+# Batches in these states produce no further output
+TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class BatchJobError(RuntimeError):
+    """A Batch API job failed without producing output"""
+
+
+class OpenAIBatchService(OpenAIService):
+    """
+    OpenAI Batch API variant of ``analyze_batch`` for large backfills
+
+    Reviews are grouped into batch-analysis prompts (``llm_batch_size`` per
+    request), written to a JSONL file, uploaded and submitted as one Batch API
+    job; the call returns once the job finishes. Results are cached under the
+    same namespace as real-time calls. Single-review methods stay real-time.
+    """
+
+    def __init__(
+        self,
+        group_size: int | None = None,
+        poll_interval: float | None = None,
+        timeout_seconds: int | None = None,
+    ):
+        super().__init__()
+        self.group_size = max(1, group_size or settings.llm_batch_size)
+        self.poll_interval = poll_interval or settings.openai_batch_poll_interval
+        self.timeout_seconds = timeout_seconds or settings.openai_batch_timeout_seconds
+
+    async def analyze_batch(self, reviews: list[ReviewInput]) -> dict[int, ReviewAnalysisResult]:
+        if not reviews:
+            return {}
+
+        groups = {
+            f"g{i}": reviews[start : start + self.group_size]
+            for i, start in enumerate(range(0, len(reviews), self.group_size))
+        }
+        input_file = await self.client.files.create(
+            file=("reviews.jsonl", self._build_input(groups)), purpose="batch"
+        )
+        output_file_ids: list[str] = []
+        try:
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window="24h",
+                metadata={"reviews": str(len(reviews))},
+            )
+            batch = await self._wait(batch.id)
+            output_file_ids = [f for f in (batch.output_file_id, batch.error_file_id) if f]
+            if batch.status == "failed" or not batch.output_file_id:
+                raise BatchJobError(f"Batch {batch.id} ended as {batch.status}: {batch.errors}")
+
+            content = await self.client.files.content(batch.output_file_id)
+            results = self._parse_output(content.text, groups)
+        finally:
+            await self._delete_files([input_file.id, *output_file_ids])
+
+        if len(results) < len(reviews):
+            # Left unanalyzed; the next run picks them up again
+            logger.warning(
+                "Batch %s returned results for %d of %d reviews",
+                batch.id,
+                len(results),
+                len(reviews),
+            )
+        return results
+
+    def _build_input(self, groups: dict[str, list[ReviewInput]]) -> bytes:
+        response_format = json_schema_format("batch_analysis", BATCH_ANALYSIS_SCHEMA)
+        lines = (
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": self._completion_body(
+                        self.review_analyst_system,
+                        self._format_batch_prompt(group),
+                        response_format,
+                    ),
+                },
+                ensure_ascii=False,
+            )
+            for custom_id, group in groups.items()
+        )
+        return "\n".join(lines).encode()
+
+    async def _wait(self, batch_id: str) -> Any:
+        deadline = time.monotonic() + self.timeout_seconds
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+            if time.monotonic() >= deadline:
+                await self.client.batches.cancel(batch_id)
+                raise TimeoutError(f"Batch {batch_id} did not finish in {self.timeout_seconds}s")
+            await asyncio.sleep(self.poll_interval)
+
+    def _parse_output(
+        self, content: str, groups: dict[str, list[ReviewInput]]
+    ) -> dict[int, ReviewAnalysisResult]:
+        results: dict[int, ReviewAnalysisResult] = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            group = groups.get(item.get("custom_id"))
+            response = item.get("response") or {}
+            if group is None or response.get("status_code") != 200:
+                continue
+            try:
+                message = response["body"]["choices"][0]["message"]["content"] or ""
+                data = json.loads(message)
+            except (KeyError, IndexError, TypeError, json.JSONDecodeError):
+                continue
+            if isinstance(data, dict):
+                results.update(self._parse_batch_result(data, {r.review_id for r in group}))
+        return results
+
+    async def _delete_files(self, file_ids: list[str]) -> None:
+        for file_id in file_ids:
+            try:
+                await self.client.files.delete(file_id)
+            except OpenAIError as e:
+                logger.warning("Could not delete batch file %s: %s", file_id, e)
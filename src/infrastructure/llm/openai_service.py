@@ -1,76 +1,242 @@
 import asyncio
+import hashlib
 import json
+import logging
+from typing import Any
 
 from openai import AsyncOpenAI
 
 from src.config.settings import settings
-from src.infrastructure.llm.base import LLMService
+from src.infrastructure.llm.base import (
+    InvalidLLMResponseError,
+    LLMService,
+    ReviewAnalysisResult,
+    ReviewInput,
+)
+from src.infrastructure.llm.call_controller import LLMCallController, get_llm_call_controller
 from src.infrastructure.llm.prompts import load_prompt
+from src.infrastructure.llm.response_schemas import (
+    BATCH_ANALYSIS_SCHEMA,
+    INSIGHTS_SCHEMA,
+    KEYWORDS_SCHEMA,
+    REVIEW_ANALYSIS_SCHEMA,
+    SENTIMENT_SCHEMA,
+    SENTIMENTS,
+    json_schema_format,
+)
 from src.infrastructure.llm.system_messages import load_system_message
+from src.infrastructure.text_processing import TextProcessor
+
+logger = logging.getLogger(__name__)
+
+
+# Completion budget assumed when reserving tokens; corrected from the reported usage
+OUTPUT_TOKENS_ESTIMATE = 256
 
 
 class OpenAIService(LLMService):
-    def __init__(self, max_concurrent: int = 50):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+    def __init__(self, controller: LLMCallController | None = None):
+        # Retries and timeouts are owned by the controller, not the SDK
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key, base_url=settings.openai_base_url, max_retries=0
+        )
         self.model = settings.openai_model
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.controller = controller or get_llm_call_controller()
+        self.max_review_tokens = settings.llm_max_review_tokens
 
         self.sentiment_prompt = load_prompt("sentiment_analysis")
         self.keywords_prompt = load_prompt("keywords_extraction")
         self.insights_prompt = load_prompt("insights_generation")
+        self.review_prompt = load_prompt("review_analysis")
+        self.batch_prompt = load_prompt("batch_analysis")
 
         self.review_analyst_system = load_system_message("review_analyst")
         self.insights_generator_system = load_system_message("insights_generator")
 
-    async def _call_openai(self, system_message: str, prompt: str) -> str:
-        async with self.semaphore:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-            )
-            return (response.choices[0].message.content or "").strip()
+        self._templates: dict[str, tuple[str, str]] = {
+            "analyze_sentiment": (self.sentiment_prompt, self.review_analyst_system),
+            "extract_keywords": (self.keywords_prompt, self.review_analyst_system),
+            "generate_insights": (self.insights_prompt, self.insights_generator_system),
+            "analyze_review": (self.review_prompt, self.review_analyst_system),
+            "analyze_batch": (self.batch_prompt, self.review_analyst_system),
+        }
 
-    async def analyze_sentiment(self, text: str, rating: int) -> str:
-        prompt = self.sentiment_prompt.format(text=text, rating=rating)
-        result = await self._call_openai(self.review_analyst_system, prompt)
-        result_lower = result.lower()
-        if "positive" in result_lower:
-            return "positive"
-        elif "negative" in result_lower:
-            return "negative"
-        else:
-            return "neutral"
+    def cache_namespace(self, operation: str) -> str:
+        prompt, system_message = self._templates[operation]
+        prompt_version = hashlib.sha256(prompt.encode()).hexdigest()[:12]
+        system_version = hashlib.sha256(system_message.encode()).hexdigest()[:12]
+        return (
+            f"openai:{self.model}:{operation}:{prompt_version}:{system_version}"
+            f":t{self.max_review_tokens}"
+        )
 
-    async def extract_keywords(self, text: str) -> list[str]:
-        prompt = self.keywords_prompt.format(text=text)
-        result = await self._call_openai(self.review_analyst_system, prompt)
+    def _fit(self, text: str) -> str:
+        """Cap review text at the token budget so long reviews don't inflate prompts"""
+        return TextProcessor.truncate(text, self.max_review_tokens)
+
+    def _completion_body(
+        self, system_message: str, prompt: str, response_format: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Chat completion parameters, shared by real-time calls and Batch API requests"""
+        body: dict[str, Any] = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.3,
+        }
+        if response_format is not None:
+            body["response_format"] = response_format
+        return body
+
+    async def _call_openai(
+        self, system_message: str, prompt: str, response_format: dict[str, Any] | None = None
+    ) -> str:
+        body = self._completion_body(system_message, prompt, response_format)
+        estimated_tokens = (
+            TextProcessor.estimate_tokens(system_message)
+            + TextProcessor.estimate_tokens(prompt)
+            + OUTPUT_TOKENS_ESTIMATE
+        )
+        response = await self.controller.run(
+            lambda: self.client.chat.completions.create(**body),
+            estimated_tokens,
+            lambda r: r.usage.total_tokens if r.usage else None,
+        )
+        return (response.choices[0].message.content or "").strip()
+
+    async def _call_openai_json(
+        self, system_message: str, prompt: str, schema_name: str, schema: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Call OpenAI with a strict JSON schema; returns {} on refusal or invalid output"""
+        result = await self._call_openai(
+            system_message, prompt, response_format=json_schema_format(schema_name, schema)
+        )
         try:
-            cleaned = result.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned.replace("```json", "").replace("```", "").strip()
-            elif cleaned.startswith("```"):
-                cleaned = cleaned.replace("```", "").strip()
-
-            keywords = json.loads(cleaned)
-            return keywords if isinstance(keywords, list) else []
+            data = json.loads(result)
         except json.JSONDecodeError:
-            return []
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    async def analyze_sentiment(self, text: str, rating: int) -> str:
+        prompt = self.sentiment_prompt.format(text=self._fit(text), rating=rating)
+        data = await self._call_openai_json(
+            self.review_analyst_system, prompt, "sentiment", SENTIMENT_SCHEMA
+        )
+        sentiment = data.get("sentiment")
+        return sentiment if sentiment in SENTIMENTS else "neutral"
+
+    async def extract_keywords(self, text: str) -> list[str]:
+        prompt = self.keywords_prompt.format(text=self._fit(text))
+        data = await self._call_openai_json(
+            self.review_analyst_system, prompt, "keywords", KEYWORDS_SCHEMA
+        )
+        keywords = data.get("keywords")
+        return [str(k) for k in keywords] if isinstance(keywords, list) else []
 
     async def generate_insights(self, text: str, rating: int) -> list[str]:
-        prompt = self.insights_prompt.format(text=text, rating=rating)
-        result = await self._call_openai(self.insights_generator_system, prompt)
-        try:
-            cleaned = result.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned.replace("```json", "").replace("```", "").strip()
-            elif cleaned.startswith("```"):
-                cleaned = cleaned.replace("```", "").strip()
-
-            insights = json.loads(cleaned)
-            return insights if isinstance(insights, list) else []
-        except json.JSONDecodeError:
-            return []
+        prompt = self.insights_prompt.format(text=self._fit(text), rating=rating)
+        data = await self._call_openai_json(
+            self.insights_generator_system, prompt, "insights", INSIGHTS_SCHEMA
+        )
+        insights = data.get("insights")
+        return [str(i) for i in insights] if isinstance(insights, list) else []
+
+    async def analyze_review(self, text: str, rating: int) -> ReviewAnalysisResult:
+        result = await self._analyze_one(text, rating)
+        if result is None:
+            # Never substitute a made-up result: it would be stored and cached for good
+            raise InvalidLLMResponseError("No usable review analysis in the model's response")
+        return result
+
+    async def _analyze_one(self, text: str, rating: int) -> ReviewAnalysisResult | None:
+        prompt = self.review_prompt.format(text=self._fit(text), rating=rating)
+        data = await self._call_openai_json(
+            self.review_analyst_system, prompt, "review_analysis", REVIEW_ANALYSIS_SCHEMA
+        )
+        return self._parse_result(data)
+
+    async def analyze_batch(self, reviews: list[ReviewInput]) -> dict[int, ReviewAnalysisResult]:
+        if not reviews:
+            return {}
+        if len(reviews) == 1:
+            review = reviews[0]
+            result = await self._analyze_one(review.text, review.rating)
+            # Left out on invalid output, so the review stays unanalyzed
+            return {review.review_id: result} if result is not None else {}
+
+        data = await self._call_openai_json(
+            self.review_analyst_system,
+            self._format_batch_prompt(reviews),
+            "batch_analysis",
+            BATCH_ANALYSIS_SCHEMA,
+        )
+
+        results = self._parse_batch_result(data, {r.review_id for r in reviews})
+        failed = [r for r in reviews if r.review_id not in results]
+        if not failed:
+            return results
+
+        # Split the malformed part of the batch and retry each half independently
+        middle = len(failed) // 2
+        retried = await asyncio.gather(
+            self.analyze_batch(failed[:middle]),
+            self.analyze_batch(failed[middle:]),
+            return_exceptions=True,
+        )
+        for partial in retried:
+            if isinstance(partial, BaseException):
+                # Keep what succeeded; the rest stays unanalyzed for the next run
+                logger.warning("Retry of a partial batch failed: %s", partial)
+                continue
+            results.update(partial)
+        return results
+
+    def _format_batch_prompt(self, reviews: list[ReviewInput]) -> str:
+        payload = json.dumps(
+            [{"id": r.review_id, "rating": r.rating, "text": self._fit(r.text)} for r in reviews],
+            ensure_ascii=False,
+        )
+        return self.batch_prompt.format(reviews=payload)
+
+    @staticmethod
+    def _parse_result(item: dict[str, Any]) -> ReviewAnalysisResult | None:
+        """Build a result from a schema-shaped dict, or None if it is malformed"""
+        sentiment = item.get("sentiment")
+        keywords = item.get("keywords", [])
+        insights = item.get("insights", [])
+        if sentiment not in SENTIMENTS:
+            return None
+        if not isinstance(keywords, list) or not isinstance(insights, list):
+            return None
+
+        if sentiment != "negative":
+            return ReviewAnalysisResult(sentiment=sentiment)
+        return ReviewAnalysisResult(
+            sentiment=sentiment,
+            keywords=[str(k) for k in keywords],
+            insights=[str(i) for i in insights],
+        )
+
+    @classmethod
+    def _parse_batch_result(
+        cls, data: dict[str, Any], expected_ids: set[int]
+    ) -> dict[int, ReviewAnalysisResult]:
+        """Keep only well-formed entries for expected ids"""
+        items = data.get("results")
+        if not isinstance(items, list):
+            return {}
+
+        results: dict[int, ReviewAnalysisResult] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            review_id = item.get("id")
+            if not isinstance(review_id, int) or review_id not in expected_ids:
+                continue
+            result = cls._parse_result(item)
+            if result is not None:
+                results[review_id] = result
+
+        return results
@@ -0,0 +1,62 @@
+from typing import Any
+
+SENTIMENTS = ("positive", "neutral", "negative")
+
+_STRING_LIST: dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+
+SENTIMENT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"sentiment": {"type": "string", "enum": list(SENTIMENTS)}},
+    "required": ["sentiment"],
+    "additionalProperties": False,
+}
+
+KEYWORDS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"keywords": _STRING_LIST},
+    "required": ["keywords"],
+    "additionalProperties": False,
+}
+
+INSIGHTS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"insights": _STRING_LIST},
+    "required": ["insights"],
+    "additionalProperties": False,
+}
+
+REVIEW_ANALYSIS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "sentiment": {"type": "string", "enum": list(SENTIMENTS)},
+        "keywords": _STRING_LIST,
+        "insights": _STRING_LIST,
+    },
+    "required": ["sentiment", "keywords", "insights"],
+    "additionalProperties": False,
+}
+
+BATCH_ANALYSIS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, **REVIEW_ANALYSIS_SCHEMA["properties"]},
+                "required": ["id", *REVIEW_ANALYSIS_SCHEMA["required"]],
+                "additionalProperties": False,
+            },
+        }
+    },
+    "required": ["results"],
+    "additionalProperties": False,
+}
+
+
+def json_schema_format(name: str, schema: dict[str, Any]) -> dict[str, Any]:
+    """Build a strict structured-output response_format for chat completions"""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": schema, "strict": True},
+    }
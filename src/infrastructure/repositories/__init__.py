@@ -1,4 +1,18 @@
 from .analysis_repository import AnalysisRepository
+from .cursor_repository import CursorRepository
+from .daily_stats_repository import DailyStatsRepository
+from .insight_cluster_repository import InsightClusterRepository
+from .job_repository import JobRepository
+from .metrics_repository import MetricsDelta, MetricsRepository
 from .review_repository import ReviewRepository
 
-__all__ = ["ReviewRepository", "AnalysisRepository"]
+__all__ = [
+    "ReviewRepository",
+    "AnalysisRepository",
+    "JobRepository",
+    "CursorRepository",
+    "MetricsRepository",
+    "MetricsDelta",
+    "DailyStatsRepository",
+    "InsightClusterRepository",
+]
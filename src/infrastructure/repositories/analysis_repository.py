@@ -1,64 +1,148 @@
-from sqlalchemy import func, select
+from sqlalchemy import ARRAY, Integer, any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.models import Insight, Review, ReviewAnalysis
+from src.infrastructure.llm.base import ANALYSIS_SOURCE_LLM, ReviewAnalysisResult
+from src.infrastructure.llm.fast_path import evaluation_sample_filter
 
-TOP_KEYWORDS_LIMIT = 10
-TOP_INSIGHTS_LIMIT = 10
+# Rows per multi-row INSERT, keeping bind parameters well under asyncpg's 32767 limit
+BULK_INSERT_ROWS = 5000
 
 
 class AnalysisRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def save_review_analysis(
-        self, review_id: int, sentiment: str, keywords: list[str]
-    ) -> None:
-        analysis = ReviewAnalysis(review_id=review_id, sentiment=sentiment, keywords=keywords)
-        self.session.add(analysis)
+    async def save_results_bulk(
+        self, app_id: str, results: dict[int, ReviewAnalysisResult]
+    ) -> set[int]:
+        """
+        Persist a batch of analysis results with set-based statements
 
-    async def save_insights_batch(self, app_id: str, review_id: int, insights: list[str]) -> None:
-        if not insights:
-            return
-        insight_objects = [
-            Insight(app_id=app_id, review_id=review_id, content=content) for content in insights
+        Inserts analyses with one multi-row INSERT ... ON CONFLICT DO NOTHING, inserts
+        insights only for analyses that were actually new, and flips is_analyzed (releasing
+        any claims) for the whole id set with a single UPDATE. The caller owns the transaction.
+
+        Returns:
+            Review ids whose analysis was inserted by this call
+        """
+        if not results:
+            return set()
+
+        analysis_rows = [
+            {
+                "review_id": review_id,
+                "sentiment": result.sentiment,
+                "keywords": result.keywords,
+                "source": result.source,
+            }
+            for review_id, result in results.items()
         ]
-        self.session.add_all(insight_objects)
+        inserted: set[int] = set()
+        for i in range(0, len(analysis_rows), BULK_INSERT_ROWS):
+            stmt = (
+                insert(ReviewAnalysis)
+                .values(analysis_rows[i : i + BULK_INSERT_ROWS])
+                .on_conflict_do_nothing(index_elements=["review_id"])
+                .returning(ReviewAnalysis.review_id)
+            )
+            result = await self.session.execute(stmt)
+            inserted.update(result.scalars().all())
 
-    async def get_sentiments_summary(self, app_id: str) -> dict[str, int]:
-        stmt = (
-            select(ReviewAnalysis.sentiment, func.count(ReviewAnalysis.id))
-            .join(Review, ReviewAnalysis.review_id == Review.id)
-            .where(Review.app_id == app_id)
-            .group_by(ReviewAnalysis.sentiment)
+        insight_rows = [
+            {"app_id": app_id, "review_id": review_id, "content": content}
+            for review_id in inserted
+            for content in results[review_id].insights
+        ]
+        for i in range(0, len(insight_rows), BULK_INSERT_ROWS):
+            await self.session.execute(
+                insert(Insight).values(insight_rows[i : i + BULK_INSERT_ROWS])
+            )
+
+        ids = bindparam("ids", value=list(results), type_=ARRAY(Integer))
+        await self.session.execute(
+            update(Review)
+            .where(Review.id == any_(ids))
+            .values(is_analyzed=True, claimed_by=None, claim_expires_at=None)
         )
-        result = await self.session.execute(stmt)
-        return {sentiment: count for sentiment, count in result.all()}
 
-    async def get_top_keywords(self, app_id: str, limit: int = TOP_KEYWORDS_LIMIT) -> list[str]:
-        from collections import Counter
+        return inserted
 
+    async def get_results(self, review_ids: list[int]) -> dict[int, ReviewAnalysisResult]:
+        """Stored analyses, with their insights, for the given reviews"""
+        if not review_ids:
+            return {}
+        ids = bindparam("ids", value=review_ids, type_=ARRAY(Integer))
+        analyses = await self.session.execute(
+            select(
+                ReviewAnalysis.review_id,
+                ReviewAnalysis.sentiment,
+                ReviewAnalysis.keywords,
+                ReviewAnalysis.source,
+            ).where(ReviewAnalysis.review_id == any_(ids))
+        )
+        results = {
+            review_id: ReviewAnalysisResult(
+                sentiment=sentiment, keywords=list(keywords), source=source
+            )
+            for review_id, sentiment, keywords, source in analyses.all()
+        }
+        insights = await self.session.execute(
+            select(Insight.review_id, Insight.content)
+            .where(Insight.review_id == any_(ids))
+            .order_by(Insight.id)
+        )
+        for review_id, content in insights.all():
+            if review_id in results:
+                results[review_id].insights.append(content)
+        return results
+
+    async def get_labeled_reviews(
+        self, app_id: str | None = None, limit: int | None = None
+    ) -> list[tuple[str, int, str]]:
+        """
+        (text, rating, sentiment) of LLM-labeled reviews in the evaluation sample, newest first
+
+        The fast path always forwards the sample, so it holds confident reviews
+        too; the other LLM labels are only those the fast path couldn't settle.
+        Fast-path labels, analyses of unknown provenance and duplicates' copies
+        of their representative's analysis are left out.
+        """
         stmt = (
-            select(ReviewAnalysis.keywords)
-            .join(Review, ReviewAnalysis.review_id == Review.id)
-            .where(Review.app_id == app_id)
-            .where(ReviewAnalysis.sentiment == "negative")
-            .where(ReviewAnalysis.keywords != [])
+            select(Review.text, Review.rating, ReviewAnalysis.sentiment)
+            .join(ReviewAnalysis, ReviewAnalysis.review_id == Review.id)
+            .where(ReviewAnalysis.source == ANALYSIS_SOURCE_LLM)
+            .where(Review.duplicate_of.is_(None))
+            .where(evaluation_sample_filter(Review.id))
+            .order_by(Review.id.desc())
         )
+        if app_id is not None:
+            stmt = stmt.where(Review.app_id == app_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
         result = await self.session.execute(stmt)
-        all_keywords = []
-        for (keywords,) in result.all():
-            all_keywords.extend(keywords)
-
-        return [kw for kw, _ in Counter(all_keywords).most_common(limit)]
+        return [(text, rating, sentiment) for text, rating, sentiment in result.all()]
 
-    async def get_top_insights(self, app_id: str, limit: int = TOP_INSIGHTS_LIMIT) -> list[str]:
+    async def get_reviews_by_keyword(
+        self,
+        app_id: str,
+        keyword: str,
+        limit: int,
+        after_id: int = 0,
+        sentiment: str | None = None,
+    ) -> list[tuple[Review, ReviewAnalysis]]:
+        """Reviews whose analysis contains ``keyword``, in id order (keyset on review id)"""
         stmt = (
-            select(Insight.content, func.count(Insight.content).label("count"))
-            .where(Insight.app_id == app_id)
-            .group_by(Insight.content)
-            .order_by(func.count(Insight.content).desc())
+            select(Review, ReviewAnalysis)
+            .join(ReviewAnalysis, ReviewAnalysis.review_id == Review.id)
+            .where(Review.app_id == app_id)
+            .where(ReviewAnalysis.keywords.contains([keyword]))
+            .where(Review.id > after_id)
+            .order_by(Review.id)
             .limit(limit)
         )
+        if sentiment is not None:
+            stmt = stmt.where(ReviewAnalysis.sentiment == sentiment)
         result = await self.session.execute(stmt)
-        return [content for content, _ in result.all()]
+        return [(review, analysis) for review, analysis in result.all()]
@@ -0,0 +1,65 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.collectors.base import CollectedReview
+from src.infrastructure.database.models import CollectionCursor
+
+
+class CursorRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_high_water_mark(self, source: str, app_id: str, country: str) -> datetime | None:
+        stmt = select(CollectionCursor.last_review_date).where(
+            CollectionCursor.source == source,
+            CollectionCursor.app_id == app_id,
+            CollectionCursor.country == country,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def advance(
+        self,
+        source: str,
+        app_id: str,
+        country: str,
+        reviews: list[CollectedReview],
+        exhausted: bool = True,
+    ) -> None:
+        """
+        Move the cursor to the newest of the given reviews; never moves it backwards
+
+        A run cut short by its limit (``exhausted=False``) only moves the cursor if it
+        reached back to the current mark; otherwise the reviews between the mark and
+        the oldest one fetched would be skipped by the next incremental run.
+        """
+        if not reviews:
+            return
+
+        newest = max(reviews, key=lambda r: r.date)
+        oldest = min(reviews, key=lambda r: r.date)
+        stmt = insert(CollectionCursor).values(
+            source=source,
+            app_id=app_id,
+            country=country,
+            last_review_date=newest.date,
+            last_external_id=newest.external_id,
+            updated_at=datetime.now(UTC),
+        )
+        condition = [stmt.excluded.last_review_date > CollectionCursor.last_review_date]
+        if not exhausted:
+            condition.append(CollectionCursor.last_review_date >= oldest.date)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["source", "app_id", "country"],
+            set_={
+                "last_review_date": stmt.excluded.last_review_date,
+                "last_external_id": stmt.excluded.last_external_id,
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=and_(*condition),
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
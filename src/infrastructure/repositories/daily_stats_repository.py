@@ -0,0 +1,124 @@
+from collections import Counter
+from datetime import UTC, date, datetime
+
+from sqlalchemy import (
+    ARRAY,
+    Date,
+    Integer,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import (
+    UNANALYZED_SENTIMENT,
+    Review,
+    ReviewAnalysis,
+    ReviewDailyStats,
+)
+
+# (app_id, bucket, rating, sentiment)
+StatsKey = tuple[str, date, int, str]
+STATS_COLUMNS = ["app_id", "bucket", "rating", "sentiment", "count"]
+
+
+def utc_bucket(value: datetime) -> date:
+    return value.astimezone(UTC).date()
+
+
+def _review_bucket():
+    return cast(func.timezone("UTC", Review.date), Date)
+
+
+class DailyStatsRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _add_counts(self, stmt: Insert) -> None:
+        """Run an INSERT of count rows, adding to rows that already exist"""
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["app_id", "bucket", "rating", "sentiment"],
+            set_={"count": ReviewDailyStats.count + stmt.excluded.count},
+        )
+        await self.session.execute(stmt)
+
+    async def add_reviews(self, counts: Counter[StatsKey]) -> None:
+        """Count newly ingested reviews; the caller owns the transaction"""
+        if not counts:
+            return
+        rows = [
+            dict(zip(STATS_COLUMNS, (*key, count), strict=True)) for key, count in counts.items()
+        ]
+        await self._add_counts(insert(ReviewDailyStats).values(rows))
+
+    async def move_analyzed(self, review_ids: set[int]) -> None:
+        """
+        Move newly analyzed reviews from the unanalyzed bucket to their sentiment
+
+        Run in the transaction that inserted their analyses.
+        """
+        if not review_ids:
+            return
+
+        ids = bindparam("ids", value=list(review_ids), type_=ARRAY(Integer))
+        bucket = _review_bucket().label("bucket")
+        analyzed = (
+            select(Review.app_id, bucket, Review.rating, ReviewAnalysis.sentiment)
+            .join(ReviewAnalysis, ReviewAnalysis.review_id == Review.id)
+            .where(Review.id == any_(ids))
+            .subquery()
+        )
+        group = (analyzed.c.app_id, analyzed.c.bucket, analyzed.c.rating)
+        added = select(*group, analyzed.c.sentiment, func.count()).group_by(
+            *group, analyzed.c.sentiment
+        )
+        removed = select(*group, literal(UNANALYZED_SENTIMENT), -func.count()).group_by(*group)
+        await self._add_counts(
+            insert(ReviewDailyStats).from_select(STATS_COLUMNS, union_all(added, removed))
+        )
+
+    async def rebuild(self, app_id: str) -> None:
+        """Recompute an app's rows from the base tables; does not commit"""
+        await self.session.execute(
+            delete(ReviewDailyStats).where(ReviewDailyStats.app_id == app_id)
+        )
+        bucket = _review_bucket()
+        sentiment = func.coalesce(ReviewAnalysis.sentiment, UNANALYZED_SENTIMENT)
+        source = (
+            select(Review.app_id, bucket, Review.rating, sentiment, func.count())
+            .outerjoin(ReviewAnalysis, ReviewAnalysis.review_id == Review.id)
+            .where(Review.app_id == app_id)
+            .group_by(Review.app_id, bucket, Review.rating, sentiment)
+        )
+        await self._add_counts(insert(ReviewDailyStats).from_select(STATS_COLUMNS, source))
+
+    async def get_series(
+        self, app_id: str, start: date, end: date, granularity: str = "day"
+    ) -> list[tuple[date, int, str, int]]:
+        """(bucket, rating, sentiment, count) rows between start and end inclusive"""
+        bucket = ReviewDailyStats.bucket
+        if granularity == "week":
+            bucket = cast(func.date_trunc("week", ReviewDailyStats.bucket), Date)
+        bucket = bucket.label("bucket")
+
+        stmt = (
+            select(
+                bucket,
+                ReviewDailyStats.rating,
+                ReviewDailyStats.sentiment,
+                func.sum(ReviewDailyStats.count).label("count"),
+            )
+            .where(ReviewDailyStats.app_id == app_id)
+            .where(ReviewDailyStats.bucket.between(start, end))
+            .group_by(bucket, ReviewDailyStats.rating, ReviewDailyStats.sentiment)
+            .order_by(bucket)
+        )
+        result = await self.session.execute(stmt)
+        return [(row.bucket, row.rating, row.sentiment, int(row.count)) for row in result.all()]
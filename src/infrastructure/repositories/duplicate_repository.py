@@ -0,0 +1,166 @@
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from src.infrastructure.database.models import Review, ReviewLshBand
+from src.infrastructure.text_processing.minhash import MinHasher
+
+# (band, band_hash) pairs per IN lookup, two bind parameters each
+BAND_LOOKUP_CHUNK = 5000
+BULK_INSERT_ROWS = 5000
+
+
+@dataclass
+class IndexedReview:
+    """A review to place in the near-duplicate index"""
+
+    id: int
+    app_id: str
+    rating: int
+    text: str
+
+
+@dataclass
+class _Representative:
+    id: int
+    rating: int
+    signature: list[int]
+
+
+def get_min_hasher() -> MinHasher:
+    return MinHasher(num_perm=settings.dedup_num_perm, bands=settings.dedup_bands)
+
+
+class DuplicateRepository:
+    """
+    MinHash/LSH near-duplicate index over review text
+
+    A review whose estimated Jaccard similarity to an existing representative of
+    the same app and rating reaches the threshold gets ``duplicate_of`` set to
+    that representative; otherwise it becomes a representative itself. Only
+    representatives are compared, so a bucket of reposted spam costs one check,
+    and only representatives get band rows.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        hasher: MinHasher | None = None,
+        threshold: float | None = None,
+    ):
+        self.session = session
+        self.hasher = hasher or get_min_hasher()
+        self.threshold = threshold or settings.dedup_threshold
+
+    async def index_reviews(self, reviews: list[IndexedReview]) -> int:
+        """
+        Sign, match and index newly inserted reviews; the caller owns the transaction
+
+        Returns the number of reviews marked as duplicates.
+        """
+        by_app: dict[str, list[IndexedReview]] = defaultdict(list)
+        for review in reviews:
+            by_app[review.app_id].append(review)
+
+        duplicates = 0
+        for app_id, app_reviews in by_app.items():
+            duplicates += await self._index_app(app_id, sorted(app_reviews, key=lambda r: r.id))
+        return duplicates
+
+    def _sign(self, texts: list[str]) -> list[tuple[list[int], list[int]]]:
+        result = []
+        for text in texts:
+            signature = self.hasher.signature(text)
+            result.append((signature, self.hasher.band_hashes(signature)))
+        return result
+
+    async def _index_app(self, app_id: str, reviews: list[IndexedReview]) -> int:
+        # Signing is CPU-bound; keep it off the event loop
+        signed = await asyncio.to_thread(self._sign, [r.text for r in reviews])
+
+        keys = {(band, h) for _, hashes in signed for band, h in enumerate(hashes)}
+        buckets = await self._find_representatives(app_id, keys)
+
+        updates = []
+        band_rows = []
+        duplicates = 0
+        for review, (signature, hashes) in zip(reviews, signed, strict=True):
+            candidates = {
+                candidate.id: candidate
+                for band, h in enumerate(hashes)
+                for candidate in buckets.get((band, h), ())
+                if candidate.rating == review.rating
+            }
+            best: _Representative | None = None
+            best_score = self.threshold
+            for candidate in candidates.values():
+                score = MinHasher.similarity(signature, candidate.signature)
+                if score >= best_score:
+                    best, best_score = candidate, score
+
+            if best is not None:
+                duplicates += 1
+            else:
+                # New representative: later reviews in this batch can match it too
+                representative = _Representative(review.id, review.rating, signature)
+                for band, h in enumerate(hashes):
+                    buckets.setdefault((band, h), []).append(representative)
+                band_rows.extend(
+                    {"app_id": app_id, "band": band, "band_hash": h, "review_id": review.id}
+                    for band, h in enumerate(hashes)
+                )
+
+            updates.append(
+                {
+                    "id": review.id,
+                    "minhash": signature,
+                    "duplicate_of": best.id if best is not None else None,
+                }
+            )
+
+        await self.session.execute(update(Review), updates)
+        for i in range(0, len(band_rows), BULK_INSERT_ROWS):
+            await self.session.execute(
+                insert(ReviewLshBand)
+                .values(band_rows[i : i + BULK_INSERT_ROWS])
+                .on_conflict_do_nothing()
+            )
+        return duplicates
+
+    async def _find_representatives(
+        self, app_id: str, keys: set[tuple[int, int]]
+    ) -> dict[tuple[int, int], list[_Representative]]:
+        buckets: dict[tuple[int, int], list[_Representative]] = defaultdict(list)
+        seen: dict[int, _Representative] = {}
+        key_list = list(keys)
+        for i in range(0, len(key_list), BAND_LOOKUP_CHUNK):
+            stmt = (
+                select(
+                    ReviewLshBand.band,
+                    ReviewLshBand.band_hash,
+                    Review.id,
+                    Review.rating,
+                    Review.minhash,
+                )
+                .join(Review, Review.id == ReviewLshBand.review_id)
+                .where(ReviewLshBand.app_id == app_id)
+                .where(
+                    tuple_(ReviewLshBand.band, ReviewLshBand.band_hash).in_(
+                        key_list[i : i + BAND_LOOKUP_CHUNK]
+                    )
+                )
+                .where(Review.duplicate_of.is_(None))
+                .where(Review.minhash.is_not(None))
+            )
+            result = await self.session.execute(stmt)
+            for band, band_hash, review_id, rating, minhash in result.all():
+                representative = seen.setdefault(
+                    review_id, _Representative(review_id, rating, list(minhash))
+                )
+                buckets[(band, band_hash)].append(representative)
+        return buckets
@@ -0,0 +1,138 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import ARRAY, Integer, bindparam, delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import Insight, InsightCluster
+from src.infrastructure.text_processing.insight_clustering import Cluster
+
+TOP_CLUSTERS_LIMIT = 10
+
+
+class InsightClusterRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_clusters(self, app_id: str) -> list[Cluster]:
+        stmt = select(InsightCluster).where(InsightCluster.app_id == app_id)
+        result = await self.session.execute(stmt)
+        return [
+            Cluster(id=row.id, label=row.label, size=row.size, centroid=row.centroid)
+            for row in result.scalars().all()
+        ]
+
+    async def get_top_labels(self, app_id: str, limit: int = TOP_CLUSTERS_LIMIT) -> list[str]:
+        """Representative texts of the largest clusters (index scan on app_id, size)"""
+        stmt = (
+            select(InsightCluster.label)
+            .where(InsightCluster.app_id == app_id)
+            .order_by(InsightCluster.size.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_top_labels_many(
+        self, app_ids: list[str], limit: int = TOP_CLUSTERS_LIMIT
+    ) -> dict[str, list[str]]:
+        """Top cluster labels of several apps in one ranked query"""
+        if not app_ids:
+            return {}
+        rank = (
+            func.row_number()
+            .over(
+                partition_by=InsightCluster.app_id,
+                order_by=(InsightCluster.size.desc(), InsightCluster.id),
+            )
+            .label("rank")
+        )
+        ranked = (
+            select(InsightCluster.app_id, InsightCluster.label, rank)
+            .where(InsightCluster.app_id.in_(app_ids))
+            .subquery()
+        )
+        stmt = (
+            select(ranked.c.app_id, ranked.c.label)
+            .where(ranked.c.rank <= limit)
+            .order_by(ranked.c.app_id, ranked.c.rank)
+        )
+        result = await self.session.execute(stmt)
+        labels: dict[str, list[str]] = {}
+        for app_id, label in result.all():
+            labels.setdefault(app_id, []).append(label)
+        return labels
+
+    async def get_unclustered_chunk(
+        self, app_id: str, after_id: int, limit: int
+    ) -> list[tuple[int, str]]:
+        stmt = (
+            select(Insight.id, Insight.content)
+            .where(Insight.app_id == app_id)
+            .where(Insight.cluster_id.is_(None))
+            .where(Insight.id > after_id)
+            .order_by(Insight.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [(insight_id, content) for insight_id, content in result.all()]
+
+    async def has_unclustered(self, app_id: str) -> bool:
+        stmt = select(exists().where(Insight.app_id == app_id).where(Insight.cluster_id.is_(None)))
+        return bool(await self.session.scalar(stmt))
+
+    async def save(self, app_id: str, clusters: list[Cluster], assignments: dict[int, int]) -> None:
+        """
+        Persist changed clusters and point insights at them
+
+        ``assignments`` maps insight id to a position in ``clusters``. New clusters
+        get their ids here; the caller owns the transaction.
+        """
+        now = datetime.now(UTC)
+        new = [c for c in clusters if c.dirty and c.id is None]
+        changed = [c for c in clusters if c.dirty and c.id is not None]
+
+        if new:
+            result = await self.session.execute(
+                insert(InsightCluster).returning(InsightCluster.id, sort_by_parameter_order=True),
+                [
+                    {"app_id": app_id, "label": c.label, "size": c.size, "centroid": c.centroid}
+                    for c in new
+                ],
+            )
+            for cluster, cluster_id in zip(new, result.scalars().all(), strict=True):
+                cluster.id = cluster_id
+        if changed:
+            await self.session.execute(
+                update(InsightCluster),
+                [
+                    {"id": c.id, "size": c.size, "centroid": c.centroid, "updated_at": now}
+                    for c in changed
+                ],
+            )
+        for cluster in (*new, *changed):
+            cluster.dirty = False
+
+        if not assignments:
+            return
+        pairs = select(
+            func.unnest(
+                bindparam("insight_ids", value=list(assignments), type_=ARRAY(Integer))
+            ).label("insight_id"),
+            func.unnest(
+                bindparam(
+                    "cluster_ids",
+                    value=[clusters[position].id for position in assignments.values()],
+                    type_=ARRAY(Integer),
+                )
+            ).label("cluster_id"),
+        ).subquery()
+        await self.session.execute(
+            update(Insight)
+            .where(Insight.id == pairs.c.insight_id)
+            .values(cluster_id=pairs.c.cluster_id)
+        )
+
+    async def reset(self, app_id: str) -> None:
+        """Drop an app's clusters; its insights become unclustered"""
+        await self.session.execute(delete(InsightCluster).where(InsightCluster.app_id == app_id))
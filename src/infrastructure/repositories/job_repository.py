@@ -0,0 +1,121 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import AnalysisJob
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class JobRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, app_id: str, total_reviews: int) -> AnalysisJob:
+        """
+        Queue a job for the app, or return the one already queued or running
+
+        The partial unique index on active jobs makes this safe under concurrent
+        requests: the losing insert does nothing and reads the winner's job.
+        """
+        stmt = (
+            insert(AnalysisJob)
+            .values(app_id=app_id, status="queued", total_reviews=total_reviews)
+            .on_conflict_do_nothing(
+                index_elements=[AnalysisJob.app_id],
+                index_where=AnalysisJob.status.in_(ACTIVE_STATUSES),
+            )
+            .returning(AnalysisJob)
+        )
+        while True:
+            job = (await self.session.execute(stmt)).scalar_one_or_none()
+            if job is None:
+                # The conflicting job may finish before it's read; then insert again
+                job = await self.get_active_for_app(app_id)
+            if job is not None:
+                await self.session.commit()
+                return job
+
+    async def get(self, job_id: int) -> AnalysisJob | None:
+        return await self.session.get(AnalysisJob, job_id)
+
+    async def get_active_for_app(self, app_id: str) -> AnalysisJob | None:
+        stmt = (
+            select(AnalysisJob)
+            .where(AnalysisJob.app_id == app_id)
+            .where(AnalysisJob.status.in_(ACTIVE_STATUSES))
+            .order_by(AnalysisJob.id)
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def claim_next(self, stale_after: timedelta) -> AnalysisJob | None:
+        """
+        Claim the oldest queued job, or a running one whose worker stopped heartbeating
+
+        Uses FOR UPDATE SKIP LOCKED so concurrent workers never claim the same job.
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            select(AnalysisJob)
+            .where(
+                or_(
+                    AnalysisJob.status == "queued",
+                    (AnalysisJob.status == "running")
+                    & (AnalysisJob.heartbeat_at < now - stale_after),
+                )
+            )
+            .order_by(AnalysisJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        job = result.scalar_one_or_none()
+        if job is None:
+            await self.session.rollback()
+            return None
+
+        job.status = "running"
+        job.started_at = job.started_at or now
+        job.heartbeat_at = now
+        await self.session.commit()
+        return job
+
+    async def get_running(self, stale_after: timedelta) -> list[AnalysisJob]:
+        """Running jobs whose workers are still heartbeating, oldest first"""
+        stmt = (
+            select(AnalysisJob)
+            .where(AnalysisJob.status == "running")
+            .where(AnalysisJob.heartbeat_at >= datetime.now(UTC) - stale_after)
+            .order_by(AnalysisJob.id)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def add_progress(self, job_id: int, processed: int) -> None:
+        stmt = (
+            update(AnalysisJob)
+            .where(AnalysisJob.id == job_id)
+            .values(
+                processed_reviews=AnalysisJob.processed_reviews + processed,
+                heartbeat_at=datetime.now(UTC),
+            )
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def finish(self, job_id: int, status: str, error: str | None = None) -> bool:
+        """Close a running job; False if a worker sharing it already did"""
+        now = datetime.now(UTC)
+        stmt = (
+            update(AnalysisJob)
+            .where(AnalysisJob.id == job_id)
+            .where(AnalysisJob.status == "running")
+            .values(status=status, error=error, heartbeat_at=now, finished_at=now)
+        )
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.rowcount == 1
@@ -0,0 +1,278 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import (
+    TERM_INSIGHT,
+    TERM_KEYWORD,
+    AppMetrics,
+    AppTermCount,
+    Insight,
+    Review,
+    ReviewAnalysis,
+)
+from src.infrastructure.llm.base import ReviewAnalysisResult
+
+TOP_KEYWORDS_LIMIT = 10
+TOP_INSIGHTS_LIMIT = 10
+
+# Small, bounded maps; unbounded per-term counts live in app_term_counts
+COUNTER_COLUMNS = ("rating_histogram", "sentiment_counts")
+TERM_UPSERT_ROWS = 1_000
+
+# Adds two {key: count} JSONB objects key by key inside the upsert, so concurrent
+# writers serialize on the row lock instead of overwriting each other's counts
+_MERGE_COUNTERS = """CASE WHEN excluded.{column} = '{{}}'::jsonb THEN app_metrics.{column} ELSE (
+    SELECT coalesce(jsonb_object_agg(key, total), '{{}}'::jsonb)
+    FROM (
+        SELECT key, sum(value::bigint) AS total
+        FROM (
+            SELECT * FROM jsonb_each_text(app_metrics.{column})
+            UNION ALL
+            SELECT * FROM jsonb_each_text(excluded.{column})
+        ) AS counts
+        GROUP BY key
+    ) AS merged
+) END"""
+
+
+@dataclass
+class MetricsDelta:
+    """Increments to apply to one app's rollup row"""
+
+    review_count: int = 0
+    rating_sum: int = 0
+    rating_histogram: Counter[str] = field(default_factory=Counter)
+    analyzed_count: int = 0
+    sentiment_counts: Counter[str] = field(default_factory=Counter)
+    keyword_counts: Counter[str] = field(default_factory=Counter)
+    insight_counts: Counter[str] = field(default_factory=Counter)
+
+    def add_review(self, rating: int) -> None:
+        self.review_count += 1
+        self.rating_sum += rating
+        self.rating_histogram[str(rating)] += 1
+
+    def add_analysis(self, result: ReviewAnalysisResult) -> None:
+        self.analyzed_count += 1
+        self.sentiment_counts[result.sentiment] += 1
+        if result.sentiment == "negative":
+            self.keyword_counts.update(result.keywords)
+        self.insight_counts.update(result.insights)
+
+    @classmethod
+    def for_analysis(
+        cls, results: dict[int, ReviewAnalysisResult], inserted: set[int]
+    ) -> "MetricsDelta":
+        """Delta for the results whose analysis rows were actually inserted"""
+        delta = cls()
+        for review_id in inserted:
+            delta.add_analysis(results[review_id])
+        return delta
+
+    def is_empty(self) -> bool:
+        return not self.review_count and not self.analyzed_count
+
+
+class MetricsRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, app_id: str) -> AppMetrics | None:
+        return await self.session.get(AppMetrics, app_id)
+
+    async def get_many(
+        self,
+        app_ids: list[str] | None = None,
+        after_app_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[AppMetrics]:
+        """
+        Rollup rows of the given apps, or of every app with analyzed reviews, by app id
+
+        ``after_app_id`` and ``limit`` page through the apps (keyset on app id).
+        """
+        stmt = select(AppMetrics).order_by(AppMetrics.app_id)
+        if app_ids is None:
+            stmt = stmt.where(AppMetrics.analyzed_count > 0)
+        else:
+            stmt = stmt.where(AppMetrics.app_id.in_(app_ids))
+        if after_app_id is not None:
+            stmt = stmt.where(AppMetrics.app_id > after_app_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def apply(self, app_id: str, delta: MetricsDelta) -> None:
+        """Add a delta to the app's rollup row; the caller owns the transaction"""
+        if delta.is_empty():
+            return
+
+        stmt = insert(AppMetrics).values(
+            app_id=app_id,
+            review_count=delta.review_count,
+            rating_sum=delta.rating_sum,
+            rating_histogram=dict(delta.rating_histogram),
+            analyzed_count=delta.analyzed_count,
+            sentiment_counts=dict(delta.sentiment_counts),
+            updated_at=func.now(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["app_id"],
+            set_={
+                "review_count": AppMetrics.review_count + stmt.excluded.review_count,
+                "rating_sum": AppMetrics.rating_sum + stmt.excluded.rating_sum,
+                "analyzed_count": AppMetrics.analyzed_count + stmt.excluded.analyzed_count,
+                "updated_at": func.now(),
+                **{
+                    column: literal_column(_MERGE_COUNTERS.format(column=column))
+                    for column in COUNTER_COLUMNS
+                },
+            },
+        )
+        await self.session.execute(stmt)
+        await self._add_terms(app_id, delta)
+
+    async def _add_terms(self, app_id: str, delta: MetricsDelta) -> None:
+        """
+        Upsert the delta's keyword and insight counts
+
+        Runs after the app_metrics upsert, whose row lock already serializes writers
+        of the same app; rows are sorted so their lock order is stable too.
+        """
+        rows = sorted(
+            [
+                {"app_id": app_id, "kind": kind, "term": term, "count": count}
+                for kind, counts in (
+                    (TERM_KEYWORD, delta.keyword_counts),
+                    (TERM_INSIGHT, delta.insight_counts),
+                )
+                for term, count in counts.items()
+                if count
+            ],
+            key=lambda row: (row["kind"], row["term"]),
+        )
+        for i in range(0, len(rows), TERM_UPSERT_ROWS):
+            stmt = insert(AppTermCount).values(rows[i : i + TERM_UPSERT_ROWS])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["app_id", "kind", "term"],
+                set_={"count": AppTermCount.count + stmt.excluded.count},
+            )
+            await self.session.execute(stmt)
+
+    async def get_top_terms(self, app_id: str, kind: str, limit: int) -> list[str]:
+        """Most frequent keywords or insights of an app (index scan on app_id, kind, count)"""
+        stmt = (
+            select(AppTermCount.term)
+            .where(AppTermCount.app_id == app_id)
+            .where(AppTermCount.kind == kind)
+            .order_by(AppTermCount.count.desc(), AppTermCount.term)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_top_terms_many(
+        self, app_ids: list[str], kind: str, limit: int
+    ) -> dict[str, list[str]]:
+        """Most frequent keywords or insights of several apps in one ranked query"""
+        if not app_ids:
+            return {}
+        rank = (
+            func.row_number()
+            .over(
+                partition_by=AppTermCount.app_id,
+                order_by=(AppTermCount.count.desc(), AppTermCount.term),
+            )
+            .label("rank")
+        )
+        ranked = (
+            select(AppTermCount.app_id, AppTermCount.term, rank)
+            .where(AppTermCount.app_id.in_(app_ids))
+            .where(AppTermCount.kind == kind)
+            .subquery()
+        )
+        stmt = (
+            select(ranked.c.app_id, ranked.c.term)
+            .where(ranked.c.rank <= limit)
+            .order_by(ranked.c.app_id, ranked.c.rank)
+        )
+        result = await self.session.execute(stmt)
+        terms: dict[str, list[str]] = {}
+        for app_id, term in result.all():
+            terms.setdefault(app_id, []).append(term)
+        return terms
+
+    async def rebuild(self, app_id: str) -> AppMetrics | None:
+        """
+        Recompute an app's rollup from the base tables and replace the stored row
+
+        Meant for backfills; does not commit.
+        """
+        delta = MetricsDelta()
+
+        ratings = await self.session.execute(
+            select(Review.rating, func.count(Review.id))
+            .where(Review.app_id == app_id)
+            .group_by(Review.rating)
+        )
+        for rating, count in ratings.all():
+            delta.review_count += count
+            delta.rating_sum += rating * count
+            delta.rating_histogram[str(rating)] = count
+
+        sentiments = await self.session.execute(
+            select(ReviewAnalysis.sentiment, func.count(ReviewAnalysis.id))
+            .join(Review, ReviewAnalysis.review_id == Review.id)
+            .where(Review.app_id == app_id)
+            .group_by(ReviewAnalysis.sentiment)
+        )
+        for sentiment, count in sentiments.all():
+            delta.analyzed_count += count
+            delta.sentiment_counts[sentiment] = count
+
+        keyword = func.unnest(ReviewAnalysis.keywords).label("keyword")
+        keyword_rows = (
+            select(keyword)
+            .join(Review, ReviewAnalysis.review_id == Review.id)
+            .where(Review.app_id == app_id)
+            .where(ReviewAnalysis.sentiment == "negative")
+            .subquery()
+        )
+        keywords = await self.session.execute(
+            select(keyword_rows.c.keyword, func.count()).group_by(keyword_rows.c.keyword)
+        )
+        delta.keyword_counts.update(dict(keywords.all()))
+
+        insights = await self.session.execute(
+            select(Insight.content, func.count(Insight.id))
+            .where(Insight.app_id == app_id)
+            .group_by(Insight.content)
+        )
+        delta.insight_counts.update(dict(insights.all()))
+
+        await self.session.execute(delete(AppMetrics).where(AppMetrics.app_id == app_id))
+        await self.session.execute(delete(AppTermCount).where(AppTermCount.app_id == app_id))
+        await self.apply(app_id, delta)
+        return await self.session.get(AppMetrics, app_id, populate_existing=True)
+
+    @staticmethod
+    def to_metrics(
+        row: AppMetrics, top_keywords: list[str], top_insights: list[str]
+    ) -> dict[str, Any]:
+        """Shape a rollup row and its top terms like the /metrics response"""
+        return {
+            "total_reviews": row.analyzed_count,
+            "average_rating": round(row.rating_sum / row.review_count, 2)
+            if row.review_count
+            else 0.0,
+            "ratings_summary": dict(sorted(row.rating_histogram.items())),
+            "sentiments_summary": row.sentiment_counts,
+            "top_keywords": top_keywords,
+            "top_insights": top_insights,
+        }
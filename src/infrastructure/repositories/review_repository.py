@@ -1,9 +1,75 @@
-from sqlalchemy import func, select
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Select,
+    any_,
+    bindparam,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from src.config.settings import settings
+from src.infrastructure.cache import get_metrics_cache
 from src.infrastructure.collectors.base import CollectedReview
-from src.infrastructure.database.models import Review
+from src.infrastructure.database.models import (
+    SEARCH_CONFIG,
+    UNANALYZED_SENTIMENT,
+    Review,
+    ReviewAnalysis,
+)
+from src.infrastructure.repositories.daily_stats_repository import (
+    DailyStatsRepository,
+    StatsKey,
+    utc_bucket,
+)
+from src.infrastructure.repositories.duplicate_repository import (
+    DuplicateRepository,
+    IndexedReview,
+)
+from src.infrastructure.repositories.metrics_repository import MetricsDelta, MetricsRepository
+
+EXPORT_COLUMNS = {
+    "id": Review.id,
+    "external_id": Review.external_id,
+    "title": Review.title,
+    "text": Review.text,
+    "rating": Review.rating,
+    "author": Review.author,
+    "date": Review.date,
+    "source": Review.source,
+    "country": Review.country,
+    "language": Review.language,
+}
+ANALYSIS_EXPORT_COLUMNS = {
+    "sentiment": ReviewAnalysis.sentiment,
+    "keywords": ReviewAnalysis.keywords,
+}
+EXPORT_BATCH_SIZE = 1000
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=8"
+
+
+@dataclass
+class ReviewFilters:
+    """Optional filters for review listings; empty fields don't filter"""
+
+    ratings: list[int] | None = None
+    sentiment: str | None = None
+    is_analyzed: bool | None = None
+    date_from: datetime | None = None
+    date_to: datetime | None = None
 
 
 class ReviewRepository:
@@ -19,22 +85,44 @@ class ReviewRepository:
                 "external_id": review.external_id,
                 "app_id": review.app_id,
                 "source": source,
+                "country": review.country,
                 "title": review.title,
                 "text": review.text,
                 "rating": review.rating,
                 "author": review.author,
                 "date": review.date,
+                "language": review.language,
             }
             for review in reviews
         ]
 
         stmt = insert(Review).values(values)
         stmt = stmt.on_conflict_do_nothing(index_elements=["external_id"])
+        stmt = stmt.returning(Review.id, Review.app_id, Review.rating, Review.date, Review.text)
 
         result = await self.session.execute(stmt)
+        inserted = result.all()
+
+        # Only newly inserted rows count towards the aggregates, in the same transaction
+        deltas: dict[str, MetricsDelta] = defaultdict(MetricsDelta)
+        daily: Counter[StatsKey] = Counter()
+        for row in inserted:
+            deltas[row.app_id].add_review(row.rating)
+            daily[(row.app_id, utc_bucket(row.date), row.rating, UNANALYZED_SENTIMENT)] += 1
+        metrics_repo = MetricsRepository(self.session)
+        for app_id, delta in deltas.items():
+            await metrics_repo.apply(app_id, delta)
+        await DailyStatsRepository(self.session).add_reviews(daily)
+
+        if settings.dedup_enabled and inserted:
+            await DuplicateRepository(self.session).index_reviews(
+                [IndexedReview(row.id, row.app_id, row.rating, row.text) for row in inserted]
+            )
+
         await self.session.commit()
+        await get_metrics_cache().bump(*deltas)
 
-        return result.rowcount or 0  # type: ignore[attr-defined]
+        return len(inserted)
 
     async def get_by_app_id(
         self, app_id: str, limit: int | None = None, is_analyzed: bool | None = None
@@ -47,25 +135,251 @@ class ReviewRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    async def get_average_rating(self, app_id: str) -> float:
-        stmt = select(func.avg(Review.rating)).where(Review.app_id == app_id)
+    async def get_page(
+        self,
+        app_id: str,
+        fields: list[str],
+        limit: int,
+        filters: ReviewFilters | None = None,
+        before: tuple[datetime, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        One page of projected reviews, newest first (keyset on date, id)
+
+        ``before`` is the (date, id) of the previous page's last row. The row-value
+        comparison walks the (app_id, date, id) indexes, so deep pages cost the
+        same as the first. Rows always carry ``date`` and ``id`` for the next cursor.
+        """
+        filters = filters or ReviewFilters()
+        columns = {**EXPORT_COLUMNS, **ANALYSIS_EXPORT_COLUMNS}
+        selected = list(dict.fromkeys([*fields, "date", "id"]))
+        stmt = (
+            select(*[columns[name].label(name) for name in selected])
+            .select_from(Review)
+            .where(Review.app_id == app_id)
+            .order_by(Review.date.desc(), Review.id.desc())
+            .limit(limit)
+        )
+        stmt = self._filtered(
+            stmt, filters, any(name in ANALYSIS_EXPORT_COLUMNS for name in selected)
+        )
+        if before is not None:
+            stmt = stmt.where(tuple_(Review.date, Review.id) < tuple_(*before))
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def search(
+        self,
+        query: str,
+        limit: int,
+        app_id: str | None = None,
+        filters: ReviewFilters | None = None,
+        before: tuple[float, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Full-text search over title and text, best matches first (keyset on rank, id)
+
+        Matching uses the GIN-indexed ``search_vector`` with ``websearch_to_tsquery``
+        syntax ("quoted phrases", OR, -exclusions). Highlights are built only for the
+        returned page, since ts_headline re-parses the document.
+        """
+        filters = filters or ReviewFilters()
+        config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+        tsquery = func.websearch_to_tsquery(config, bindparam("query", query))
+        rank = func.ts_rank_cd(Review.search_vector, tsquery)
+
+        page = (
+            select(
+                Review.id,
+                Review.app_id,
+                Review.external_id,
+                Review.title,
+                Review.text,
+                Review.rating,
+                Review.date,
+                Review.country,
+                ReviewAnalysis.sentiment,
+                rank.label("rank"),
+            )
+            .select_from(Review)
+            .where(Review.search_vector.bool_op("@@")(tsquery))
+            .order_by(rank.desc(), Review.id.desc())
+            .limit(limit)
+        )
+        page = self._filtered(page, filters, analysis_columns=True)
+        if app_id is not None:
+            page = page.where(Review.app_id == app_id)
+        if before is not None:
+            page = page.where(tuple_(rank, Review.id) < tuple_(*before))
+        page = page.subquery()
+
+        stmt = select(
+            *page.c,
+            func.ts_headline(config, page.c.text, tsquery, HEADLINE_OPTIONS).label("headline"),
+        ).order_by(page.c.rank.desc(), page.c.id.desc())
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+
+    @staticmethod
+    def _filtered(stmt: Select, filters: ReviewFilters, analysis_columns: bool) -> Select:
+        """Apply listing filters; joins review_analysis as the filters and columns require"""
+        if filters.sentiment is not None:
+            stmt = stmt.join(ReviewAnalysis, ReviewAnalysis.review_id == Review.id).where(
+                ReviewAnalysis.sentiment == filters.sentiment
+            )
+        elif analysis_columns:
+            stmt = stmt.outerjoin(ReviewAnalysis, ReviewAnalysis.review_id == Review.id)
+
+        if filters.ratings:
+            stmt = stmt.where(Review.rating.in_(filters.ratings))
+        if filters.is_analyzed is not None:
+            stmt = stmt.where(Review.is_analyzed.is_(filters.is_analyzed))
+        if filters.date_from is not None:
+            stmt = stmt.where(Review.date >= filters.date_from)
+        if filters.date_to is not None:
+            stmt = stmt.where(Review.date < filters.date_to)
+        return stmt
+
+    async def claim_unanalyzed(
+        self, app_id: str, owner: str, lease: timedelta, after_id: int, limit: int
+    ) -> list[Review]:
+        """
+        Claim the next unanalyzed representatives in id order (keyset) for ``owner``
+
+        Rows locked by a concurrent claim are skipped (FOR UPDATE SKIP LOCKED) and rows
+        under someone else's unexpired lease are not eligible, so concurrent pipelines
+        split the backlog instead of analyzing it twice. Near-duplicates are never
+        claimed; they inherit their representative's analysis. The caller commits.
+        """
+        now = func.now()
+        candidates = (
+            select(Review.id)
+            .where(Review.app_id == app_id)
+            .where(Review.is_analyzed.is_(False))
+            .where(Review.duplicate_of.is_(None))
+            .where(Review.id > after_id)
+            .where(or_(Review.claim_expires_at.is_(None), Review.claim_expires_at < now))
+            .order_by(Review.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Review)
+            .where(Review.id.in_(candidates))
+            .values(claimed_by=owner, claim_expires_at=now + lease)
+            .returning(Review)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda review: review.id)
+
+    async def release_claims(self, review_ids: list[int], owner: str) -> None:
+        """Drop ``owner``'s unexpired claims so other pipelines can take the reviews now"""
+        if not review_ids:
+            return
+        ids = bindparam("ids", value=review_ids, type_=ARRAY(Integer))
+        await self.session.execute(
+            update(Review)
+            .where(Review.id == any_(ids))
+            .where(Review.claimed_by == owner)
+            .values(claimed_by=None, claim_expires_at=None)
+        )
+
+    async def renew_claims(self, owner: str, lease: timedelta) -> int:
+        """Extend every open claim of ``owner`` to a full lease; returns how many"""
+        result = await self.session.execute(
+            update(Review)
+            .where(Review.claimed_by == owner)
+            .where(Review.is_analyzed.is_(False))
+            .values(claim_expires_at=func.now() + lease)
+        )
+        return result.rowcount
+
+    async def has_claimable(self, app_id: str) -> bool:
+        """Whether the app has unanalyzed representatives that nobody holds a lease on"""
+        stmt = (
+            select(Review.id)
+            .where(Review.app_id == app_id)
+            .where(Review.is_analyzed.is_(False))
+            .where(Review.duplicate_of.is_(None))
+            .where(or_(Review.claim_expires_at.is_(None), Review.claim_expires_at < func.now()))
+        )
+        return bool(await self.session.scalar(select(stmt.exists())))
+
+    async def has_live_claims(self, app_id: str, exclude_owner: str | None = None) -> bool:
+        """Whether another pipeline still holds an unexpired lease on the app's reviews"""
+        stmt = (
+            select(Review.id)
+            .where(Review.app_id == app_id)
+            .where(Review.is_analyzed.is_(False))
+            .where(Review.claim_expires_at >= func.now())
+        )
+        if exclude_owner is not None:
+            stmt = stmt.where(Review.claimed_by != exclude_owner)
+        return bool(await self.session.scalar(select(stmt.exists())))
+
+    async def get_unanalyzed_duplicates(self, representative_ids: list[int]) -> dict[int, int]:
+        """Unanalyzed duplicates of these representatives: {review_id: representative_id}"""
+        if not representative_ids:
+            return {}
+        ids = bindparam("ids", value=representative_ids, type_=ARRAY(Integer))
+        stmt = (
+            select(Review.id, Review.duplicate_of)
+            .where(Review.duplicate_of == any_(ids))
+            .where(Review.is_analyzed.is_(False))
+        )
         result = await self.session.execute(stmt)
-        avg = result.scalar()
-        return round(float(avg), 2) if avg else 0.0
+        return {review_id: duplicate_of for review_id, duplicate_of in result.all()}
+
+    async def get_pending_duplicates(
+        self, app_id: str, after_id: int, limit: int
+    ) -> dict[int, int]:
+        """
+        Unanalyzed near-duplicates whose representative is already analyzed
 
-    async def get_ratings_summary(self, app_id: str) -> dict[str, int]:
+        Returned as {review_id: representative_id} in review id order (keyset).
+        """
+        representative = aliased(Review)
         stmt = (
-            select(Review.rating, func.count(Review.id))
+            select(Review.id, Review.duplicate_of)
+            .join(representative, representative.id == Review.duplicate_of)
             .where(Review.app_id == app_id)
-            .group_by(Review.rating)
+            .where(Review.is_analyzed.is_(False))
+            .where(representative.is_analyzed.is_(True))
+            .where(Review.id > after_id)
+            .order_by(Review.id)
+            .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return {str(rating): count for rating, count in result.all()}
+        return {review_id: duplicate_of for review_id, duplicate_of in result.all()}
 
-    async def mark_as_analyzed(self, review: Review) -> None:
-        review.is_analyzed = True
+    async def stream_export_rows(
+        self, app_id: str, fields: list[str], batch_size: int = EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream projected review rows through a server-side cursor
 
-    async def count_by_app_id(self, app_id: str) -> int:
+        Analysis fields (see ANALYSIS_EXPORT_COLUMNS) add an outer join to
+        review_analysis; unanalyzed reviews yield None for them.
+        """
+        columns = {**EXPORT_COLUMNS, **ANALYSIS_EXPORT_COLUMNS}
+        stmt = (
+            select(*[columns[name].label(name) for name in fields])
+            .select_from(Review)
+            .where(Review.app_id == app_id)
+            .order_by(Review.id)
+        )
+        if any(name in ANALYSIS_EXPORT_COLUMNS for name in fields):
+            stmt = stmt.outerjoin(ReviewAnalysis, ReviewAnalysis.review_id == Review.id)
+
+        result = await self.session.stream(stmt.execution_options(yield_per=batch_size))
+        async for row in result.mappings():
+            yield dict(row)
+
+    async def count_by_app_id(self, app_id: str, is_analyzed: bool | None = None) -> int:
         stmt = select(func.count(Review.id)).where(Review.app_id == app_id)
+        if is_analyzed is not None:
+            stmt = stmt.where(Review.is_analyzed == is_analyzed)
         result = await self.session.execute(stmt)
         return result.scalar() or 0
@@ -1,3 +1,4 @@
+from .insight_clustering import Cluster, LeaderClusterer, tokenize
 from .text_processor import TextProcessor
 
-__all__ = ["TextProcessor"]
+__all__ = ["TextProcessor", "Cluster", "LeaderClusterer", "tokenize"]
@@ -0,0 +1,76 @@
+"""
+Micro-benchmark of the TextProcessor stages on synthetic App Store pages
+
+Usage: python -m src.infrastructure.text_processing.benchmark [--pages N]
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from .text_processor import TextProcessor
+
+_SAMPLES = [
+    "Love this app!!!!!! 😍😍😍😍😍 Works great on my iPhone.",
+    "The latest update   broke login.\n\n\n\nPlease fix ASAP – I can't access my account.",
+    "Muy buena aplicación, pero la sincronización no funciona con el reloj.",
+    "Die App stürzt ständig ab, seit dem letzten Update ist sie nicht mehr nutzbar.",
+    "Приложение постоянно вылетает после обновления.",
+    "アップデート後にアプリが起動しません。",
+    "Ｆｕｌｌ－ｗｉｄｔｈ text\u200bwith zero\u200cwidth characters and \ufb01 ligatures.",
+]
+REVIEWS_PER_PAGE = 50
+
+
+def _page(rng: random.Random) -> list[str]:
+    page = []
+    for _ in range(REVIEWS_PER_PAGE):
+        sample = rng.choice(_SAMPLES)
+        # Mix short reviews with long ones that hit the token budget
+        page.append(" ".join([sample] * rng.choice([1, 1, 2, 5, 40])))
+    return page
+
+
+def _measure(name: str, pages: list[list[str]], stage: Callable[[list[str]], object]) -> None:
+    started = time.perf_counter()
+    for page in pages:
+        stage(page)
+    elapsed = time.perf_counter() - started
+    per_page_ms = elapsed / len(pages) * 1000
+    per_review_us = per_page_ms / REVIEWS_PER_PAGE * 1000
+    print(f"{name:<16} {per_page_ms:8.3f} ms/page  {per_review_us:8.1f} µs/review")
+
+
+def _collector_page(page: list[str]) -> None:
+    """What the Apple collector runs per page: prepare, then detect the language"""
+    for text in TextProcessor.prepare_batch(page):
+        TextProcessor.detect_language(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--max-tokens", type=int, default=512)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pages = [_page(rng) for _ in range(args.pages)]
+
+    _measure("prepare_batch", pages, TextProcessor.prepare_batch)
+    _measure(
+        "detect_language", pages, lambda page: [TextProcessor.detect_language(t) for t in page]
+    )
+    _measure(
+        "truncate",
+        pages,
+        lambda page: [TextProcessor.truncate(t, args.max_tokens) for t in page],
+    )
+    _measure(
+        "normalized_hash", pages, lambda page: [TextProcessor.normalized_hash(t) for t in page]
+    )
+    _measure("collector page", pages, _collector_page)
+
+
+if __name__ == "__main__":
+    main()
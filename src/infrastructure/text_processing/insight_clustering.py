@@ -0,0 +1,130 @@
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+
+Vector = dict[str, float]
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOPWORDS = frozenset(
+    """
+    a about after all also an and any app are as at be because been but by can could did
+    do does doing for from get gets getting had has have having he her his how i if in into
+    is it its it's just make makes more most much my no not of on one or other our out over
+    should so some still such than that the their them then there these they this those to
+    too up very was way we were what when where which while who why will with would you
+    your users user
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased content words with a light plural strip"""
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS or len(token) < 2:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def _normalize(vector: Vector) -> Vector:
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    if not norm:
+        return {}
+    return {term: w / norm for term, w in vector.items()}
+
+
+def cosine(a: Vector, b: Vector) -> float:
+    """Cosine similarity of two L2-normalized sparse vectors"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(term, 0.0) for term, w in a.items())
+
+
+@dataclass
+class Cluster:
+    """A cluster being built; ``id`` is None until it is persisted"""
+
+    label: str
+    size: int
+    centroid: Vector
+    id: int | None = None
+    dirty: bool = field(default=False, compare=False)
+
+
+class LeaderClusterer:
+    """
+    Incremental leader clustering over TF-IDF vectors
+
+    Each text joins the most similar existing cluster if the cosine similarity
+    reaches ``threshold``, otherwise it founds a new cluster and becomes its
+    label. Candidates come from an inverted index on centroid terms, so a text
+    is only compared with clusters it shares a term with.
+    """
+
+    def __init__(self, clusters: list[Cluster], threshold: float = 0.5, max_terms: int = 50):
+        self.clusters = clusters
+        self.threshold = threshold
+        self.max_terms = max_terms
+        self._index: dict[str, set[int]] = {}
+        for position, cluster in enumerate(clusters):
+            self._index_terms(position, cluster.centroid)
+
+    def _index_terms(self, position: int, centroid: Vector) -> None:
+        for term in centroid:
+            self._index.setdefault(term, set()).add(position)
+
+    def _vectorize(self, docs: list[list[str]]) -> list[Vector]:
+        # Document frequencies over the batch, with each centroid counted as a document
+        doc_freq: Counter[str] = Counter()
+        for tokens in docs:
+            doc_freq.update(set(tokens))
+        for term, positions in self._index.items():
+            doc_freq[term] += len(positions)
+        n_docs = len(docs) + len(self.clusters)
+        idf = {term: math.log((1 + n_docs) / (1 + df)) + 1 for term, df in doc_freq.items()}
+
+        vectors = []
+        for tokens in docs:
+            counts = Counter(tokens)
+            vectors.append(
+                _normalize({term: (1 + math.log(tf)) * idf[term] for term, tf in counts.items()})
+            )
+        return vectors
+
+    def _merge(self, position: int, vector: Vector) -> None:
+        cluster = self.clusters[position]
+        merged = Counter({term: w * cluster.size for term, w in cluster.centroid.items()})
+        merged.update(vector)
+        top = heapq.nlargest(self.max_terms, merged.items(), key=lambda kv: kv[1])
+        for term in cluster.centroid:
+            self._index[term].discard(position)
+        cluster.centroid = _normalize(dict(top))
+        cluster.size += 1
+        cluster.dirty = True
+        self._index_terms(position, cluster.centroid)
+
+    def assign(self, texts: list[str]) -> list[int]:
+        """Cluster texts in order; returns each text's position in ``self.clusters``"""
+        assignments = []
+        for text, vector in zip(texts, self._vectorize([tokenize(t) for t in texts]), strict=True):
+            candidates = set().union(*(self._index.get(term, ()) for term in vector))
+            best, best_score = -1, 0.0
+            for position in candidates:
+                score = cosine(vector, self.clusters[position].centroid)
+                if score > best_score:
+                    best, best_score = position, score
+
+            if best >= 0 and best_score >= self.threshold:
+                self._merge(best, vector)
+            else:
+                best = len(self.clusters)
+                self.clusters.append(Cluster(label=text, size=1, centroid=vector, dirty=True))
+                self._index_terms(best, vector)
+            assignments.append(best)
+        return assignments
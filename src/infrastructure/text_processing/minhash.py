@@ -0,0 +1,60 @@
+import hashlib
+import random
+import zlib
+
+from .text_processor import TextProcessor
+
+# Mersenne prime for the universal hash family; signatures are kept to 32 bits
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def shingles(text: str, size: int = 2) -> set[bytes]:
+    """Word n-grams of the matching form; short texts fall back to their whole word list"""
+    words = TextProcessor.normalize_for_matching(text).split()
+    if len(words) <= size:
+        return {" ".join(words).encode()} if words else set()
+    return {" ".join(words[i : i + size]).encode() for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """
+    MinHash signatures with LSH banding
+
+    Two texts whose shingle sets have Jaccard similarity ``s`` share at least one
+    band with probability ``1 - (1 - s**rows)**bands``. Hashes are seeded and
+    process-independent, so signatures and band hashes can be stored.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> list[int]:
+        hashes = [zlib.crc32(shingle) for shingle in shingles(text)]
+        if not hashes:
+            return [_MAX_HASH] * self.num_perm
+        return [min((a * h + b) % _PRIME for h in hashes) & _MAX_HASH for a, b in self._perms]
+
+    def band_hashes(self, signature: list[int]) -> list[int]:
+        """One signed 64-bit hash per band"""
+        result = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows : (band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                b"".join(v.to_bytes(4, "big") for v in rows), digest_size=8
+            ).digest()
+            result.append(int.from_bytes(digest, "big", signed=True))
+        return result
+
+    @staticmethod
+    def similarity(a: list[int], b: list[int]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(x == y for x, y in zip(a, b, strict=True)) / len(a)
@@ -1,7 +1,130 @@
+import hashlib
+import re
+import unicodedata
+
+# Zero-width and bidi control characters; U+200D (ZWJ) is kept for emoji sequences
+_INVISIBLE_RE = re.compile("[\u00ad\u200b\u200c\u200e\u200f\u202a-\u202e\u2060-\u2064\ufeff]")
+_CONTROL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+_HORIZONTAL_SPACE_RE = re.compile(r"[^\S\n]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*(?:\n\s*)+")
+_LINE_EDGE_SPACE_RE = re.compile(r" *\n *")
+# The same punctuation mark or emoji repeated more than three times
+_REPEAT_RE = re.compile(r"([^\w\s])\1{3,}")
+_WORD_RE = re.compile(r"\w+")
+_TOKEN_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+_SCRIPT_RANGES: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("ja", re.compile("[\u3040-\u30ff]")),
+    ("ko", re.compile("[\uac00-\ud7af\u1100-\u11ff]")),
+    ("zh", re.compile("[\u4e00-\u9fff]")),
+    ("ar", re.compile("[\u0600-\u06ff]")),
+    ("he", re.compile("[\u0590-\u05ff]")),
+    ("el", re.compile("[\u0370-\u03ff]")),
+    ("th", re.compile("[\u0e00-\u0e7f]")),
+    ("hi", re.compile("[\u0900-\u097f]")),
+    ("cyrillic", re.compile("[\u0400-\u04ff]")),
+)
+_UKRAINIAN_RE = re.compile("[\u0456\u0457\u0454\u0491]", re.IGNORECASE)
+
+_STOPWORDS: dict[str, frozenset[str]] = {
+    "en": frozenset("the and is it to this of you that for not with but was are have app".split()),
+    "es": frozenset("el la de que y en es no los por una para con muy pero las".split()),
+    "fr": frozenset("le la les de et est pas une des pour que très mais avec je".split()),
+    "de": frozenset("der die das und ist nicht ich es zu sehr aber mit ein eine auf".split()),
+    "it": frozenset("il di che è non la per una sono molto ma con questo gli".split()),
+    "pt": frozenset("o de que não é um uma para com muito mas os do da por".split()),
+    "nl": frozenset("de het een en is niet van ik dat je met maar zeer op".split()),
+}
+
+# Leading characters inspected; enough to call a language, cheap on long reviews
+_LANGUAGE_SAMPLE_CHARS = 1_000
+# Rough tokenizer ratio: one token per word piece plus one per extra 6 characters
+_CHARS_PER_EXTRA_TOKEN = 6
+TRUNCATION_MARK = "…"
+
+
 class TextProcessor:
-    """Text preprocessing"""
+    """
+    Text preprocessing
+
+    Every stage is a static method over precompiled patterns. Collectors run
+    ``prepare_batch`` and ``detect_language`` over each page, the LLM services
+    ``truncate`` prompts, and the LLM cache keys on ``normalized_hash``.
+    """
 
     @staticmethod
     def prepare(text: str) -> str:
-        """TODO: Add preprocessing"""
+        """NFKC-normalize, drop invisible characters and collapse whitespace and repeats"""
+        if not text:
+            return ""
+        text = unicodedata.normalize("NFKC", text)
+        text = _INVISIBLE_RE.sub("", text)
+        text = _CONTROL_RE.sub("", text)
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        text = _HORIZONTAL_SPACE_RE.sub(" ", text)
+        text = _LINE_EDGE_SPACE_RE.sub("\n", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
+        text = _REPEAT_RE.sub(r"\1\1\1", text)
+        return text.strip()
+
+    @staticmethod
+    def prepare_batch(texts: list[str]) -> list[str]:
+        prepare = TextProcessor.prepare
+        return [prepare(text) for text in texts]
+
+    @staticmethod
+    def normalize_for_matching(text: str) -> str:
+        """Casefolded, punctuation-free, single-spaced form used for hashing and dedup"""
+        text = unicodedata.normalize("NFKC", text).casefold()
+        return " ".join(_PUNCTUATION_RE.sub(" ", text).split())
+
+    @staticmethod
+    def normalized_hash(text: str) -> str:
+        """Stable hash of the matching form; equal for texts that differ only cosmetically"""
+        normalized = TextProcessor.normalize_for_matching(text)
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def detect_language(text: str) -> str:
+        """
+        Cheap language guess: writing system first, then stopword hits for Latin text
+
+        Returns an ISO 639-1 code, or "und" when undetermined.
+        """
+        text = text[:_LANGUAGE_SAMPLE_CHARS]
+        for language, pattern in _SCRIPT_RANGES:
+            if pattern.search(text):
+                if language == "cyrillic":
+                    return "uk" if _UKRAINIAN_RE.search(text) else "ru"
+                return language
+
+        words = _WORD_RE.findall(text.casefold())
+        if not words:
+            return "und"
+        best, best_hits = "und", 0
+        for language, stopwords in _STOPWORDS.items():
+            hits = sum(word in stopwords for word in words)
+            if hits > best_hits:
+                best, best_hits = language, hits
+        return best
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return sum(
+            1 + len(piece) // _CHARS_PER_EXTRA_TOKEN for piece in _TOKEN_PIECE_RE.findall(text)
+        )
+
+    @staticmethod
+    def truncate(text: str, max_tokens: int) -> str:
+        """Cut text to roughly ``max_tokens`` LLM tokens at a word boundary"""
+        if max_tokens <= 0 or len(text) <= max_tokens:
+            # A token is at least one character, so short texts always fit
+            return text
+
+        used = 0
+        for match in _TOKEN_PIECE_RE.finditer(text):
+            used += 1 + len(match.group()) // _CHARS_PER_EXTRA_TOKEN
+            if used > max_tokens:
+                return text[: match.start()].rstrip() + TRUNCATION_MARK
         return text
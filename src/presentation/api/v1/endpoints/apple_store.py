@@ -1,26 +1,72 @@
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+import base64
+import binascii
+import hashlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Annotated, Any, Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import Field
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.services import ReviewAnalysisService
+from src.application.services import (
+    CollectionOrchestrator,
+    CollectionTarget,
+    MetricsTrendService,
+)
+from src.application.services.metrics_trend_service import DEFAULT_SERIES_DAYS
 from src.config.settings import settings
+from src.infrastructure.cache import APPS_SCOPE, get_metrics_cache
 from src.infrastructure.collectors.factory import CollectorFactory
-from src.infrastructure.database import get_session
-from src.infrastructure.database.models import Review
-from src.infrastructure.llm.factory import LLMServiceFactory
-from src.infrastructure.repositories import AnalysisRepository, ReviewRepository
+from src.infrastructure.database import get_read_session, get_session
+from src.infrastructure.database.base import read_session_maker
+from src.infrastructure.database.models import TERM_INSIGHT, TERM_KEYWORD, Review
+from src.infrastructure.repositories import (
+    AnalysisRepository,
+    CursorRepository,
+    DailyStatsRepository,
+    InsightClusterRepository,
+    JobRepository,
+    MetricsRepository,
+    ReviewRepository,
+)
+from src.infrastructure.repositories.metrics_repository import (
+    TOP_INSIGHTS_LIMIT,
+    TOP_KEYWORDS_LIMIT,
+)
+from src.infrastructure.repositories.review_repository import (
+    ANALYSIS_EXPORT_COLUMNS,
+    EXPORT_COLUMNS,
+    ReviewFilters,
+)
+from src.presentation.api.v1.exporters import csv_stream, gzip_stream, json_stream, ndjson_stream
 from src.presentation.api.v1.schemas import (
+    AnalysisJobResponse,
     AppleStoreAnalyzeRequest,
     AppleStoreAnalyzeResponse,
+    AppleStoreBulkCollectRequest,
+    AppleStoreBulkCollectResponse,
+    AppleStoreBulkMetricsResponse,
     AppleStoreCollectRequest,
     AppleStoreMetricsResponse,
+    AppleStoreTimeseriesResponse,
+    CollectionTargetSummary,
+    KeywordReview,
+    KeywordReviewsResponse,
+    ReviewListResponse,
+    ReviewSearchHit,
+    ReviewSearchResponse,
 )
 
 router = APIRouter(prefix="/reviews/apple-store", tags=["Apple App Store"])
 
+MAX_BULK_APPS = 200
+# Bounds apply per repeated ?rating= value
+Rating = Annotated[int, Field(ge=1, le=5)]
+
 
 @router.post("/collect")
 async def collect_apple_store_reviews(
@@ -43,17 +89,38 @@ async def collect_apple_store_reviews(
         Collected reviews with metadata
     """
     try:
+        cursor_repo = CursorRepository(session)
+        since = None
+        if request.incremental:
+            since = await cursor_repo.get_high_water_mark(
+                "apple_store", request.app_id, request.country
+            )
+
         collector = CollectorFactory.create(settings.apple_collector_type)
-        reviews = await collector.collect(request.app_id, request.limit)
+        result = await collector.collect_with_stats(
+            request.app_id, request.limit, request.country, since
+        )
+        reviews = result.reviews
 
         repository = ReviewRepository(session)
         saved_count = await repository.bulk_upsert(reviews, source="apple_store")
+        # A failed page may hide reviews older than the newest one seen
+        if not result.stats.errors:
+            await cursor_repo.advance(
+                "apple_store",
+                request.app_id,
+                request.country,
+                reviews,
+                exhausted=result.exhausted,
+            )
 
         return {
             "source": "apple_store",
             "app_id": request.app_id,
+            "country": request.country,
             "total_collected": len(reviews),
             "total_saved": saved_count,
+            "stats": result.stats.as_dict(),
             "reviews": [
                 {
                     "id": r.external_id,
@@ -77,12 +144,52 @@ async def collect_apple_store_reviews(
         )
 
 
+@router.post("/collect/bulk", response_model=AppleStoreBulkCollectResponse)
+async def collect_apple_store_reviews_bulk(request: AppleStoreBulkCollectRequest):
+    """
+    Collect reviews for every app x country combination
+
+    Example:
+        {
+            "app_ids": ["544007664", "1459969523"],
+            "countries": ["us", "gb", "de"],
+            "limit": 100
+        }
+
+    Returns:
+        Per-target summary (reviews are saved, not returned)
+    """
+    try:
+        targets = [
+            CollectionTarget(app_id=app_id, country=country)
+            for app_id in dict.fromkeys(request.app_ids)
+            for country in dict.fromkeys(request.countries)
+        ]
+        collector = CollectorFactory.create(settings.apple_collector_type)
+        orchestrator = CollectionOrchestrator(collector, source="apple_store")
+        summaries = await orchestrator.run(targets, request.limit, request.incremental)
+
+        return AppleStoreBulkCollectResponse(
+            source="apple_store",
+            total_collected=sum(s.collected for s in summaries),
+            total_saved=sum(s.saved for s in summaries),
+            targets=[CollectionTargetSummary(**s.as_dict()) for s in summaries],
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to collect reviews. Please try again later.",
+        )
+
+
 @router.post("/analyze", response_model=AppleStoreAnalyzeResponse)
 async def analyze_apple_store_reviews(
     request: AppleStoreAnalyzeRequest,
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
-    """Run LLM analysis on collected reviews"""
+    """Queue LLM analysis of collected reviews; poll /jobs/{job_id} for progress"""
     try:
         review_repo = ReviewRepository(session)
         total_reviews = await review_repo.count_by_app_id(request.app_id)
@@ -93,9 +200,9 @@ async def analyze_apple_store_reviews(
                 detail=f"No reviews found for app_id: {request.app_id}.",
             )
 
-        reviews = await review_repo.get_by_app_id(request.app_id, is_analyzed=False)
+        new_reviews = await review_repo.count_by_app_id(request.app_id, is_analyzed=False)
 
-        if not reviews:
+        if not new_reviews:
             return AppleStoreAnalyzeResponse(
                 app_id=request.app_id,
                 total_reviews=total_reviews,
@@ -103,17 +210,14 @@ async def analyze_apple_store_reviews(
                 status="completed",
             )
 
-        llm_service = LLMServiceFactory.create("openai")
-        analysis_repo = AnalysisRepository(session)
-        analysis_service = ReviewAnalysisService(llm_service, analysis_repo, review_repo)
-
-        await analysis_service.analyze_reviews(request.app_id, reviews)
+        job = await JobRepository(session).enqueue(request.app_id, total_reviews=new_reviews)
 
         return AppleStoreAnalyzeResponse(
             app_id=request.app_id,
             total_reviews=total_reviews,
-            new=len(reviews),
-            status="processing",
+            new=new_reviews,
+            status=job.status,
+            job_id=job.id,
         )
     except HTTPException:
         raise
@@ -124,123 +228,506 @@ async def analyze_apple_store_reviews(
         )
 
 
+@router.get("/jobs/{job_id}", response_model=AnalysisJobResponse)
+async def get_analysis_job(
+    job_id: int,
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Get analysis job progress"""
+    job = await JobRepository(session).get(job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}.")
+
+    progress = job.processed_reviews / job.total_reviews if job.total_reviews else 1.0
+
+    return AnalysisJobResponse(
+        job_id=job.id,
+        app_id=job.app_id,
+        status=job.status,
+        total_reviews=job.total_reviews,
+        processed_reviews=job.processed_reviews,
+        progress=round(min(progress, 1.0), 4),
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
 @router.get("/metrics", response_model=AppleStoreMetricsResponse)
 async def get_apple_store_metrics(
     app_id: str,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
-    """Get metrics and insights"""
-    try:
-        review_repo = ReviewRepository(session)
-        reviews = await review_repo.get_by_app_id(app_id, is_analyzed=True)
+    """
+    Get metrics and insights
+
+    Served from the per-app rollup row, which ingest and analysis keep current,
+    and the largest insight clusters, through the versioned metrics cache
+    (supports ETag / If-None-Match).
+    """
+
+    async def compute() -> dict[str, Any]:
+        try:
+            metrics_repo = MetricsRepository(session)
+            metrics = await metrics_repo.get(app_id)
+            top_keywords = await metrics_repo.get_top_terms(
+                app_id, TERM_KEYWORD, TOP_KEYWORDS_LIMIT
+            )
+            top_insights = await metrics_repo.get_top_terms(
+                app_id, TERM_INSIGHT, TOP_INSIGHTS_LIMIT
+            )
+            top_clusters = await InsightClusterRepository(session).get_top_labels(app_id)
+        except Exception:
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to retrieve metrics. Please try again later.",
+            )
 
-        if not reviews:
+        if metrics is None or not metrics.analyzed_count:
             raise HTTPException(
                 status_code=404,
                 detail=f"No reviews found for app_id: {app_id}.",
             )
 
-        analysis_repo = AnalysisRepository(session)
-        llm_service = LLMServiceFactory.create("openai")
-        service = ReviewAnalysisService(llm_service, analysis_repo, review_repo)
+        values = MetricsRepository.to_metrics(metrics, top_keywords, top_insights)
+        # Until the first clustering run, fall back to exact-text insight counts
+        if top_clusters:
+            values["top_insights"] = top_clusters
+        response = AppleStoreMetricsResponse(app_id=app_id, **values)
+        return response.model_dump(mode="json")
+
+    return await _cached_response(app_id, if_none_match, compute)
+
+
+@router.get("/metrics/bulk", response_model=AppleStoreBulkMetricsResponse)
+async def get_apple_store_metrics_bulk(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    app_ids: Annotated[
+        list[str] | None,
+        Query(description="App ids, repeated or comma-separated (default: all analyzed apps)"),
+    ] = None,
+    after_app_id: Annotated[
+        str | None, Query(description="Page through all analyzed apps after this app id")
+    ] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    """
+    Get metrics of several apps in one request
 
-        metrics = await service.get_app_metrics(app_id)
+    Reads all requested rollup rows in one query and their top insight clusters
+    in one ranked query. Apps without analyzed reviews are listed in ``missing``.
+    Without ``app_ids``, all analyzed apps are returned in pages of MAX_BULK_APPS.
+    """
+    requested = None
+    if app_ids:
+        requested = sorted({a.strip() for value in app_ids for a in value.split(",") if a.strip()})
+        if len(requested) > MAX_BULK_APPS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_BULK_APPS} app ids per request.",
+            )
 
-        return AppleStoreMetricsResponse(
-            app_id=app_id,
-            total_reviews=len(reviews),
-            **metrics,
+    async def compute() -> dict[str, Any]:
+        try:
+            metrics_repo = MetricsRepository(session)
+            next_after_app_id = None
+            if requested is None:
+                rows = await metrics_repo.get_many(
+                    after_app_id=after_app_id, limit=MAX_BULK_APPS + 1
+                )
+                if len(rows) > MAX_BULK_APPS:
+                    rows = rows[:MAX_BULK_APPS]
+                    next_after_app_id = rows[-1].app_id
+            else:
+                rows = await metrics_repo.get_many(requested)
+            rows = [row for row in rows if row.analyzed_count]
+            found_ids = [row.app_id for row in rows]
+            top_keywords = await metrics_repo.get_top_terms_many(
+                found_ids, TERM_KEYWORD, TOP_KEYWORDS_LIMIT
+            )
+            top_insights = await metrics_repo.get_top_terms_many(
+                found_ids, TERM_INSIGHT, TOP_INSIGHTS_LIMIT
+            )
+            top_clusters = await InsightClusterRepository(session).get_top_labels_many(found_ids)
+        except Exception:
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to retrieve metrics. Please try again later.",
+            )
+
+        apps = []
+        for row in rows:
+            values = MetricsRepository.to_metrics(
+                row, top_keywords.get(row.app_id, []), top_insights.get(row.app_id, [])
+            )
+            if top_clusters.get(row.app_id):
+                values["top_insights"] = top_clusters[row.app_id]
+            apps.append(AppleStoreMetricsResponse(app_id=row.app_id, **values))
+        found = {app.app_id for app in apps}
+        response = AppleStoreBulkMetricsResponse(
+            apps=apps,
+            missing=[a for a in requested or [] if a not in found],
+            next_after_app_id=next_after_app_id,
         )
-    except HTTPException:
-        raise
+        return response.model_dump(mode="json")
+
+    # Every write bumps the app-list scope, so it versions any set of apps
+    variant = ",".join(requested) if requested is not None else f"all:{after_app_id or ''}"
+    return await _cached_response(APPS_SCOPE, if_none_match, compute, variant=variant)
+
+
+@router.get("/metrics/timeseries", response_model=AppleStoreTimeseriesResponse)
+async def get_apple_store_metrics_timeseries(
+    app_id: str,
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    granularity: Literal["day", "week"] = "day",
+    start: date | None = None,
+    end: date | None = None,
+    compare_days: Annotated[int, Query(ge=1, le=365)] = 30,
+):
+    """
+    Rating and sentiment trends per day or week, plus the last ``compare_days``
+    days against the period before
+
+    Defaults to the last 90 days (UTC). Served from pre-aggregated daily counts.
+    """
+    end = end or datetime.now(UTC).date()
+    start = start or end - timedelta(days=DEFAULT_SERIES_DAYS - 1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end.")
+
+    service = MetricsTrendService(DailyStatsRepository(session))
+    try:
+        points = await service.get_timeseries(app_id, granularity, start, end)
+        comparison = await service.compare_windows(app_id, compare_days, end)
     except Exception:
         raise HTTPException(
             status_code=500,
             detail="Failed to retrieve metrics. Please try again later.",
         )
 
+    return AppleStoreTimeseriesResponse(
+        app_id=app_id,
+        granularity=granularity,
+        start=start,
+        end=end,
+        points=points,
+        comparison=comparison,
+    )
 
-@router.get("/export")
-async def export_apple_store_reviews(
+
+@router.get("/keywords/reviews", response_model=KeywordReviewsResponse)
+async def get_apple_store_keyword_reviews(
     app_id: str,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    keyword: Annotated[str, Query(min_length=1, max_length=255)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    sentiment: Literal["positive", "neutral", "negative"] | None = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    after_id: Annotated[int, Query(ge=0)] = 0,
 ):
-    """Export raw JSON data with proper UTF-8 encoding (emoji support)"""
+    """List analyzed reviews whose keywords contain ``keyword`` (keyset-paginated by id)"""
     try:
-        review_repo = ReviewRepository(session)
-        reviews = await review_repo.get_by_app_id(app_id)
+        rows = await AnalysisRepository(session).get_reviews_by_keyword(
+            app_id, keyword, limit=limit, after_id=after_id, sentiment=sentiment
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to retrieve reviews. Please try again later.",
+        )
 
-        if not reviews:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No reviews found for app_id: {app_id}.",
-            )
+    reviews = [
+        KeywordReview(
+            id=review.id,
+            external_id=review.external_id,
+            title=review.title,
+            text=review.text,
+            rating=review.rating,
+            author=review.author,
+            date=review.date,
+            country=review.country,
+            sentiment=analysis.sentiment,
+            keywords=analysis.keywords,
+        )
+        for review, analysis in rows
+    ]
 
-        reviews_data = [
-            {
-                "id": r.id,
-                "external_id": r.external_id,
-                "title": r.title,
-                "text": r.text,
-                "rating": r.rating,
-                "author": r.author,
-                "date": r.date.isoformat(),
-                "source": r.source,
-            }
-            for r in reviews
-        ]
+    return KeywordReviewsResponse(
+        app_id=app_id,
+        keyword=keyword,
+        reviews=reviews,
+        next_after_id=reviews[-1].id if len(reviews) == limit else None,
+    )
 
-        response_data = {
-            "app_id": app_id,
-            "total_reviews": len(reviews),
-            "reviews": reviews_data,
-        }
 
-        return JSONResponse(content=response_data, media_type="application/json; charset=utf-8")
-    except HTTPException:
-        raise
+@router.get("", response_model=ReviewListResponse)
+async def list_apple_store_reviews(
+    app_id: str,
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    rating: Annotated[list[Rating] | None, Query()] = None,
+    sentiment: Literal["positive", "neutral", "negative"] | None = None,
+    analyzed: bool | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    fields: Annotated[
+        str | None, Query(description="Comma-separated columns, e.g. id,rating,text,sentiment")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: Annotated[str | None, Query(description="next_cursor of the previous page")] = None,
+):
+    """
+    Browse reviews newest first with filters and sparse fields
+
+    Keyset-paginated on (date, id): follow ``next_cursor`` until it is null.
+    Every page costs the same regardless of depth.
+    """
+    selected = list(dict.fromkeys(f.strip() for f in (fields or "").split(",") if f.strip()))
+    if not selected:
+        selected = list(EXPORT_COLUMNS)
+    unknown = [f for f in selected if f not in EXPORT_COLUMNS and f not in ANALYSIS_EXPORT_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    before = (
+        _decode_cursor(cursor, lambda v: (datetime.fromisoformat(v[0]), int(v[1])))
+        if cursor
+        else None
+    )
+    filters = ReviewFilters(
+        ratings=rating,
+        sentiment=sentiment,
+        is_analyzed=analyzed,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    try:
+        rows = await ReviewRepository(session).get_page(
+            app_id, selected, limit + 1, filters=filters, before=before
+        )
     except Exception:
         raise HTTPException(
             status_code=500,
-            detail="Failed to export reviews. Please try again later.",
+            detail="Failed to retrieve reviews. Please try again later.",
         )
 
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]["date"].isoformat(), rows[-1]["id"])
 
-@router.get("/apps")
-async def list_analyzed_apps(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    return ReviewListResponse(
+        app_id=app_id,
+        reviews=[{name: row[name] for name in selected} for row in rows],
+        next_cursor=next_cursor,
+    )
+
+
+def _encode_cursor(*values: str | int | float) -> str:
+    """Opaque page cursor holding the sort key of the last row"""
+    payload = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode_cursor[T](cursor: str, parse: Callable[[list[Any]], T]) -> T:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return parse(json.loads(base64.urlsafe_b64decode(padded)))
+    except (binascii.Error, ValueError, TypeError, KeyError, IndexError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+@router.get("/search", response_model=ReviewSearchResponse)
+async def search_apple_store_reviews(
+    q: Annotated[str, Query(min_length=1, max_length=500, description="Web-search syntax")],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    app_id: str | None = None,
+    rating: Annotated[list[Rating] | None, Query()] = None,
+    sentiment: Literal["positive", "neutral", "negative"] | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query(description="next_cursor of the previous page")] = None,
 ):
     """
-    Get list of all apps
+    Full-text search over review titles and texts
+
+    ``q`` accepts web-search syntax: words, "quoted phrases", ``OR`` and ``-word``.
+    Words are stemmed, so ``crash`` also finds "crashes" and "crashing". Results
+    are ranked by cover density (title matches weigh more) and carry a highlighted
+    ``headline`` with matches wrapped in ``<mark>``.
     """
+    before = _decode_cursor(cursor, lambda v: (float(v[0]), int(v[1]))) if cursor else None
     try:
-        stmt = (
-            select(
-                Review.app_id,
-                func.count(Review.id).label("total_reviews"),
-                func.count(Review.id)
-                .filter(Review.is_analyzed.is_(True))
-                .label("analyzed_reviews"),
-            )
-            .where(Review.is_analyzed.is_(True))
-            .group_by(Review.app_id)
+        rows = await ReviewRepository(session).search(
+            q,
+            limit + 1,
+            app_id=app_id,
+            filters=ReviewFilters(ratings=rating, sentiment=sentiment),
+            before=before,
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to search reviews. Please try again later.",
         )
 
-        result = await session.execute(stmt)
-        apps = result.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]["rank"], rows[-1]["id"])
 
-        apps_list = [
-            {
-                "app_id": app.app_id,
-                "total_reviews": app.total_reviews,
-                "analyzed_reviews": app.analyzed_reviews,
-            }
-            for app in apps
-        ]
+    return ReviewSearchResponse(
+        query=q,
+        reviews=[ReviewSearchHit(**row) for row in rows],
+        next_cursor=next_cursor,
+    )
 
-        return {"apps": apps_list}
+
+@router.get("/export")
+async def export_apple_store_reviews(
+    app_id: str,
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    format: Literal["json", "ndjson", "csv"] = "json",
+    fields: Annotated[
+        str | None, Query(description="Comma-separated columns, e.g. id,rating,text")
+    ] = None,
+    include_analysis: bool = False,
+    gzip: bool = False,
+):
+    """
+    Stream reviews as JSON, NDJSON or CSV with proper UTF-8 encoding (emoji support)
+
+    Rows are read through a server-side cursor, so memory stays constant
+    regardless of the number of reviews. ``include_analysis`` adds sentiment
+    and keywords; ``gzip`` compresses the stream (Content-Encoding: gzip).
+    """
+    selected = list(dict.fromkeys(f.strip() for f in (fields or "").split(",") if f.strip()))
+    if not selected:
+        selected = list(EXPORT_COLUMNS)
+        if include_analysis:
+            selected += list(ANALYSIS_EXPORT_COLUMNS)
+
+    unknown = [f for f in selected if f not in EXPORT_COLUMNS and f not in ANALYSIS_EXPORT_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown export fields: {', '.join(unknown)}")
+
+    try:
+        total_reviews = await ReviewRepository(session).count_by_app_id(app_id)
     except Exception:
         raise HTTPException(
             status_code=500,
-            detail="Failed to fetch apps list. Please try again later.",
+            detail="Failed to export reviews. Please try again later.",
+        )
+
+    if not total_reviews:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No reviews found for app_id: {app_id}.",
         )
+
+    async def rows() -> AsyncIterator[dict[str, Any]]:
+        # Own session: the stream outlives the request handler
+        async with read_session_maker() as export_session:
+            async for row in ReviewRepository(export_session).stream_export_rows(app_id, selected):
+                yield row
+
+    headers: dict[str, str] = {}
+    if format == "ndjson":
+        body = ndjson_stream(rows())
+        media_type = "application/x-ndjson; charset=utf-8"
+    elif format == "csv":
+        body = csv_stream(rows(), selected)
+        media_type = "text/csv; charset=utf-8"
+    else:
+        body = json_stream(rows(), app_id, total_reviews)
+        media_type = "application/json; charset=utf-8"
+
+    if format != "json":
+        headers["Content-Disposition"] = f'attachment; filename="reviews_{app_id}.{format}"'
+    if gzip:
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@router.get("/apps")
+async def list_analyzed_apps(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    """
+    Get list of all apps
+    """
+
+    async def compute() -> dict[str, Any]:
+        try:
+            stmt = (
+                select(
+                    Review.app_id,
+                    func.count(Review.id).label("total_reviews"),
+                    func.count(Review.id)
+                    .filter(Review.is_analyzed.is_(True))
+                    .label("analyzed_reviews"),
+                )
+                .where(Review.is_analyzed.is_(True))
+                .group_by(Review.app_id)
+            )
+
+            result = await session.execute(stmt)
+            apps = result.all()
+
+            apps_list = [
+                {
+                    "app_id": app.app_id,
+                    "total_reviews": app.total_reviews,
+                    "analyzed_reviews": app.analyzed_reviews,
+                }
+                for app in apps
+            ]
+
+            return {"apps": apps_list}
+        except Exception:
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to fetch apps list. Please try again later.",
+            )
+
+    return await _cached_response(APPS_SCOPE, if_none_match, compute)
+
+
+async def _cached_response(
+    scope: str,
+    if_none_match: str | None,
+    compute: Callable[[], Awaitable[dict[str, Any]]],
+    variant: str | None = None,
+) -> Response:
+    """
+    Serve a metrics payload through the versioned cache
+
+    The version is read before computing, so a write that lands mid-computation
+    bumps past the stored entry instead of being masked by it. ``variant`` keeps
+    payloads that share a scope's version (e.g. different app sets) apart.
+    """
+    cache = get_metrics_cache()
+    version = await cache.get_version(scope)
+    if version is None:
+        return JSONResponse(await compute())
+
+    if variant is not None:
+        digest = hashlib.blake2b(variant.encode(), digest_size=8).hexdigest()
+        scope = f"{scope}:{digest}"
+    etag = cache.etag(scope, version)
+    if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(",")):
+        cache.stats.not_modified += 1
+        return Response(status_code=304, headers={"ETag": etag})
+
+    payload = await cache.get(scope, version)
+    if payload is None:
+        payload = await compute()
+        ttl = settings.metrics_cache_replica_ttl_seconds if settings.database_read_url else None
+        await cache.set(scope, version, payload, ttl)
+
+    return JSONResponse(payload, headers={"ETag": etag, "Cache-Control": "no-cache"})
@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+
+from src.infrastructure.cache import get_metrics_cache
+from src.infrastructure.database import get_pool_stats
+from src.infrastructure.llm.cache import get_llm_result_cache
+from src.infrastructure.llm.call_controller import get_llm_call_controller
+from src.infrastructure.llm.fast_path import get_fast_path_stats
+
+router = APIRouter(prefix="/system", tags=["System"])
+
+
+@router.get("/stats")
+async def get_system_stats():
+    """Process-local performance counters"""
+    return {
+        "llm_cache": get_llm_result_cache().stats.as_dict(),
+        "llm_fast_path": get_fast_path_stats().as_dict(),
+        "llm_calls": get_llm_call_controller().snapshot(),
+        "metrics_cache": get_metrics_cache().stats.as_dict(),
+        "db_pools": get_pool_stats(),
+    }
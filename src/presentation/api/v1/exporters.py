@@ -0,0 +1,97 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+# Flush serialized rows in chunks of roughly this many bytes
+CHUNK_SIZE = 64 * 1024
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _to_csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return "; ".join(value)
+    return value
+
+
+def _dump_row(row: dict[str, Any]) -> str:
+    return json.dumps({k: _to_json_value(v) for k, v in row.items()}, ensure_ascii=False)
+
+
+async def _buffered(parts: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    buffer: list[str] = []
+    size = 0
+    async for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+async def ndjson_stream(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    async def parts() -> AsyncIterator[str]:
+        async for row in rows:
+            yield _dump_row(row) + "\n"
+
+    async for chunk in _buffered(parts()):
+        yield chunk
+
+
+async def csv_stream(
+    rows: AsyncIterator[dict[str, Any]], fields: list[str]
+) -> AsyncIterator[bytes]:
+    async def parts() -> AsyncIterator[str]:
+        line = io.StringIO()
+        writer = csv.writer(line)
+
+        writer.writerow(fields)
+        async for row in rows:
+            writer.writerow([_to_csv_value(row[name]) for name in fields])
+            yield line.getvalue()
+            line.seek(0)
+            line.truncate()
+        yield line.getvalue()
+
+    async for chunk in _buffered(parts()):
+        yield chunk
+
+
+async def json_stream(
+    rows: AsyncIterator[dict[str, Any]], app_id: str, total_reviews: int
+) -> AsyncIterator[bytes]:
+    """Stream the {"app_id", "total_reviews", "reviews": [...]} document incrementally"""
+
+    async def parts() -> AsyncIterator[str]:
+        header = json.dumps({"app_id": app_id, "total_reviews": total_reviews})
+        yield header[:-1] + ', "reviews": ['
+        separator = ""
+        async for row in rows:
+            yield separator + _dump_row(row)
+            separator = ", "
+        yield "]}"
+
+    async for chunk in _buffered(parts()):
+        yield chunk
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
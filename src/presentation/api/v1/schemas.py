@@ -1,5 +1,11 @@
+from datetime import date, datetime
+from typing import Annotated, Any
+
 from pydantic import BaseModel, Field
 
+AppId = Annotated[str, Field(pattern=r"^\d+$", examples=["544007664"])]
+CountryCode = Annotated[str, Field(pattern=r"^[a-z]{2}$", examples=["us"])]
+
 
 class AppleStoreCollectRequest(BaseModel):
     app_id: str = Field(
@@ -11,6 +17,42 @@ class AppleStoreCollectRequest(BaseModel):
     limit: int = Field(
         default=100, ge=1, description="Number of reviews to collect", examples=[100]
     )
+    country: CountryCode = Field(default="us", description="App Store storefront")
+    incremental: bool = Field(
+        default=True, description="Stop paging at reviews collected by a previous run"
+    )
+
+
+class AppleStoreBulkCollectRequest(BaseModel):
+    app_ids: list[AppId] = Field(..., min_length=1, max_length=100, description="App Store IDs")
+    countries: list[CountryCode] = Field(
+        default=["us"], min_length=1, max_length=60, description="App Store storefronts"
+    )
+    limit: int = Field(
+        default=100, ge=1, description="Number of reviews to collect per target", examples=[100]
+    )
+    incremental: bool = Field(
+        default=True, description="Stop paging at reviews collected by a previous run"
+    )
+
+
+class CollectionTargetSummary(BaseModel):
+    app_id: str
+    country: str
+    collected: int
+    duplicates: int
+    saved: int
+    pages: int
+    page_errors: int
+    elapsed: float
+    error: str | None
+
+
+class AppleStoreBulkCollectResponse(BaseModel):
+    source: str
+    total_collected: int
+    total_saved: int
+    targets: list[CollectionTargetSummary]
 
 
 class AppleStoreAnalyzeRequest(BaseModel):
@@ -27,6 +69,20 @@ class AppleStoreAnalyzeResponse(BaseModel):
     total_reviews: int
     new: int
     status: str
+    job_id: int | None = None
+
+
+class AnalysisJobResponse(BaseModel):
+    job_id: int
+    app_id: str
+    status: str
+    total_reviews: int
+    processed_reviews: int
+    progress: float
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
 
 
 class AppleStoreMetricsResponse(BaseModel):
@@ -39,6 +95,101 @@ class AppleStoreMetricsResponse(BaseModel):
     top_insights: list[str]
 
 
+class AppleStoreBulkMetricsResponse(BaseModel):
+    apps: list[AppleStoreMetricsResponse]
+    missing: list[str] = Field(default_factory=list)
+    next_after_app_id: str | None = Field(
+        default=None, description="Pass as after_app_id to fetch the next page of all apps"
+    )
+
+
+class TrendStats(BaseModel):
+    review_count: int
+    average_rating: float | None
+    ratings: dict[str, int]
+    sentiments: dict[str, int]
+    sentiment_shares: dict[str, float]
+    unanalyzed: int = Field(description="Reviews in the bucket not analyzed yet")
+
+
+class TimeseriesPoint(TrendStats):
+    bucket: date
+
+
+class TrendWindow(TrendStats):
+    start: date
+    end: date
+
+
+class TrendComparison(BaseModel):
+    days: int
+    current: TrendWindow
+    previous: TrendWindow
+    review_count_change: int
+    average_rating_change: float | None
+
+
+class AppleStoreTimeseriesResponse(BaseModel):
+    app_id: str
+    granularity: str
+    start: date
+    end: date
+    points: list[TimeseriesPoint]
+    comparison: TrendComparison
+
+
+class KeywordReview(BaseModel):
+    id: int
+    external_id: str
+    title: str
+    text: str
+    rating: int
+    author: str
+    date: datetime
+    country: str
+    sentiment: str
+    keywords: list[str]
+
+
+class KeywordReviewsResponse(BaseModel):
+    app_id: str
+    keyword: str
+    reviews: list[KeywordReview]
+    next_after_id: int | None = Field(
+        default=None, description="Pass as after_id to fetch the next page"
+    )
+
+
+class ReviewListResponse(BaseModel):
+    app_id: str
+    reviews: list[dict[str, Any]]
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to fetch the next page"
+    )
+
+
+class ReviewSearchHit(BaseModel):
+    id: int
+    app_id: str
+    external_id: str
+    title: str
+    text: str
+    rating: int
+    date: datetime
+    country: str
+    sentiment: str | None
+    rank: float
+    headline: str
+
+
+class ReviewSearchResponse(BaseModel):
+    query: str
+    reviews: list[ReviewSearchHit]
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to fetch the next page"
+    )
+
+
 class AppleStoreExportResponse(BaseModel):
     app_id: str
     total_reviews: int
@@ -0,0 +1,174 @@
+import argparse
+import asyncio
+import json
+import logging
+
+from sqlalchemy import select, text
+
+from src.application.services import (
+    AnalysisWorker,
+    InsightClusteringService,
+    ReviewAnalysisService,
+    SentimentEvaluationService,
+)
+from src.application.services.sentiment_evaluation_service import DEFAULT_THRESHOLDS
+from src.config.settings import settings
+from src.infrastructure.cache import get_metrics_cache
+from src.infrastructure.database.base import async_session_maker
+from src.infrastructure.database.models import Insight, Review
+from src.infrastructure.llm.factory import LLMServiceFactory
+from src.infrastructure.repositories import (
+    AnalysisRepository,
+    DailyStatsRepository,
+    MetricsRepository,
+    ReviewRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(args: argparse.Namespace) -> None:
+    worker = AnalysisWorker(LLMServiceFactory.create("openai"))
+    await worker.run_forever()
+
+
+async def rebuild_metrics(args: argparse.Namespace) -> None:
+    app_ids = args.app_ids
+    if not app_ids:
+        async with async_session_maker() as session:
+            result = await session.execute(select(Review.app_id).distinct())
+            app_ids = list(result.scalars().all())
+
+    for app_id in app_ids:
+        # One transaction per app keeps row locks short during a full backfill
+        async with async_session_maker() as session:
+            # Full-table aggregates may outlast the API's statement timeout
+            await session.execute(text("SET LOCAL statement_timeout = 0"))
+            metrics = await MetricsRepository(session).rebuild(app_id)
+            await DailyStatsRepository(session).rebuild(app_id)
+            await session.commit()
+        await get_metrics_cache().bump(app_id)
+        logger.info(
+            "Rebuilt metrics for app %s: %d reviews, %d analyzed",
+            app_id,
+            metrics.review_count if metrics else 0,
+            metrics.analyzed_count if metrics else 0,
+        )
+
+
+async def cluster_insights(args: argparse.Namespace) -> None:
+    app_ids = args.app_ids
+    if not app_ids:
+        async with async_session_maker() as session:
+            result = await session.execute(select(Insight.app_id).distinct())
+            app_ids = list(result.scalars().all())
+
+    service = InsightClusteringService()
+    for app_id in app_ids:
+        clustered = await service.cluster_app(app_id, rebuild=args.rebuild)
+        logger.info("Clustered %d insights of app %s", clustered, app_id)
+
+
+async def backfill(args: argparse.Namespace) -> None:
+    app_ids = args.app_ids
+    if not app_ids:
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(Review.app_id).where(Review.is_analyzed.is_(False)).distinct()
+            )
+            app_ids = list(result.scalars().all())
+
+    # Each pipeline batch becomes one Batch API job; jobs run concurrently
+    llm_service = LLMServiceFactory.create("openai_batch")
+    batch_size = args.batch_size or settings.openai_batch_size
+    for app_id in app_ids:
+        async with async_session_maker() as session:
+            service = ReviewAnalysisService(
+                llm_service,
+                AnalysisRepository(session),
+                ReviewRepository(session),
+                batch_size=batch_size,
+                workers=settings.openai_batch_concurrency,
+                chunk_size=batch_size,
+            )
+            analyzed = await service.analyze_app(app_id)
+        logger.info("Backfilled %d reviews of app %s", analyzed, app_id)
+        await InsightClusteringService().cluster_app(app_id)
+
+
+async def eval_sentiment(args: argparse.Namespace) -> None:
+    async with async_session_maker() as session:
+        samples = await AnalysisRepository(session).get_labeled_reviews(args.app_id, args.limit)
+
+    reports = SentimentEvaluationService().evaluate(samples, tuple(args.thresholds))
+    for report in reports:
+        print(json.dumps(report, ensure_ascii=False))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.presentation.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    worker_parser = subparsers.add_parser("worker", help="Process queued analysis jobs")
+    worker_parser.set_defaults(handler=run_worker)
+
+    rebuild_parser = subparsers.add_parser(
+        "rebuild-metrics", help="Recompute per-app metrics aggregates from the base tables"
+    )
+    rebuild_parser.add_argument(
+        "--app-id", dest="app_ids", action="append", help="App to rebuild (default: all)"
+    )
+    rebuild_parser.set_defaults(handler=rebuild_metrics)
+
+    cluster_parser = subparsers.add_parser(
+        "cluster-insights", help="Group near-duplicate insights into clusters"
+    )
+    cluster_parser.add_argument(
+        "--app-id", dest="app_ids", action="append", help="App to cluster (default: all)"
+    )
+    cluster_parser.add_argument(
+        "--rebuild", action="store_true", help="Drop existing clusters and recluster everything"
+    )
+    cluster_parser.set_defaults(handler=cluster_insights)
+
+    backfill_parser = subparsers.add_parser(
+        "backfill", help="Analyze unanalyzed reviews through the OpenAI Batch API"
+    )
+    backfill_parser.add_argument(
+        "--app-id", dest="app_ids", action="append", help="App to backfill (default: all)"
+    )
+    backfill_parser.add_argument(
+        "--batch-size", type=int, help="Reviews per Batch API job (default: OPENAI_BATCH_SIZE)"
+    )
+    backfill_parser.set_defaults(handler=backfill)
+
+    eval_parser = subparsers.add_parser(
+        "eval-sentiment",
+        help=(
+            "Measure agreement of the local sentiment fast path with the LLM labels of "
+            "the evaluation sample (FAST_PATH_SAMPLE_PERCENT of reviews, always sent "
+            "to the LLM)"
+        ),
+    )
+    eval_parser.add_argument("--app-id", help="Limit to one app (default: all)")
+    eval_parser.add_argument(
+        "--limit", type=int, default=10_000, help="Newest sampled reviews to evaluate"
+    )
+    eval_parser.add_argument(
+        "--thresholds",
+        type=float,
+        nargs="+",
+        default=list(DEFAULT_THRESHOLDS),
+        help="Confidence thresholds to report",
+    )
+    eval_parser.set_defaults(handler=eval_sentiment)
+
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
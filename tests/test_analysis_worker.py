@@ -0,0 +1,52 @@
+import asyncio
+
+from src.application.services import analysis_worker as module
+from src.application.services.analysis_worker import AnalysisWorker
+from src.infrastructure.database.models import AnalysisJob
+
+
+class _Session:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Jobs:
+    def __init__(self, session):
+        pass
+
+    async def claim_next(self, stale_after):
+        return AnalysisJob(id=1, app_id="123", status="running")
+
+
+def _clustered_apps(monkeypatch, closes_job: bool) -> list[str]:
+    clustered = []
+
+    async def cluster_app(self, app_id, rebuild=False):
+        clustered.append(app_id)
+        return 0
+
+    async def process_job(self, job, owner=None):
+        pass
+
+    async def settle(self, job, owner, status, error=None):
+        return closes_job
+
+    monkeypatch.setattr(module, "async_session_maker", _Session)
+    monkeypatch.setattr(module, "JobRepository", _Jobs)
+    monkeypatch.setattr(module.InsightClusteringService, "cluster_app", cluster_app)
+    monkeypatch.setattr(AnalysisWorker, "process_job", process_job)
+    monkeypatch.setattr(AnalysisWorker, "_settle", settle)
+
+    assert asyncio.run(AnalysisWorker(llm_service=None).run_once())
+    return clustered
+
+
+def test_worker_closing_the_job_clusters(monkeypatch):
+    assert _clustered_apps(monkeypatch, closes_job=True) == ["123"]
+
+
+def test_workers_leaving_the_job_to_others_do_not_cluster(monkeypatch):
+    assert _clustered_apps(monkeypatch, closes_job=False) == []
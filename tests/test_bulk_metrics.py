@@ -0,0 +1,76 @@
+import pytest
+
+from src.infrastructure.database.models import AppMetrics
+from src.infrastructure.repositories.insight_cluster_repository import InsightClusterRepository
+from src.infrastructure.repositories.metrics_repository import MetricsRepository
+from src.presentation.api.v1.endpoints import apple_store
+
+URL = "/api/v1/reviews/apple-store/metrics/bulk"
+APP_IDS = ["1", "2", "3", "4", "5"]
+
+
+class _NoCache:
+    async def get_version(self, scope):
+        return None
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """Serves APP_IDS as analyzed rollup rows in pages of two; records get_many calls"""
+    calls = []
+
+    async def get_many(self, app_ids=None, after_app_id=None, limit=None):
+        calls.append({"app_ids": app_ids, "after_app_id": after_app_id, "limit": limit})
+        ids = [a for a in app_ids or APP_IDS if a in APP_IDS and a > (after_app_id or "")]
+        return [
+            AppMetrics(
+                app_id=a,
+                review_count=1,
+                rating_sum=5,
+                rating_histogram={"5": 1},
+                analyzed_count=1,
+                sentiment_counts={"positive": 1},
+            )
+            for a in ids[:limit]
+        ]
+
+    async def no_terms(self, app_ids, kind, limit):
+        return {}
+
+    async def no_labels(self, app_ids):
+        return {}
+
+    monkeypatch.setattr(apple_store, "MAX_BULK_APPS", 2)
+    monkeypatch.setattr(apple_store, "get_metrics_cache", _NoCache)
+    monkeypatch.setattr(MetricsRepository, "get_many", get_many)
+    monkeypatch.setattr(MetricsRepository, "get_top_terms_many", no_terms)
+    monkeypatch.setattr(InsightClusterRepository, "get_top_labels_many", no_labels)
+    return calls
+
+
+def test_all_apps_are_paged_by_app_id(client, pages):
+    seen = []
+    after = None
+    while True:
+        params = {"after_app_id": after} if after else {}
+        body = client.get(URL, params=params).json()
+        assert len(body["apps"]) <= 2
+        seen += [app["app_id"] for app in body["apps"]]
+        after = body["next_after_app_id"]
+        if after is None:
+            break
+
+    assert seen == APP_IDS
+    assert {call["limit"] for call in pages} == {3}
+
+
+def test_requested_apps_are_not_paged(client, pages):
+    body = client.get(URL, params={"app_ids": "4,9"}).json()
+
+    assert [app["app_id"] for app in body["apps"]] == ["4"]
+    assert body["missing"] == ["9"]
+    assert body["next_after_app_id"] is None
+
+
+def test_too_many_requested_apps_are_rejected(client, pages):
+    assert client.get(URL, params={"app_ids": "1,2,3"}).status_code == 400
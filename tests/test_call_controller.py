@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+import httpx
+import openai
+import pytest
+
+from src.infrastructure.collectors.rate_limiter import TokenBucket
+from src.infrastructure.llm import call_controller
+from src.infrastructure.llm.call_controller import (
+    DECREASE_COOLDOWN_SECONDS,
+    AdaptiveConcurrency,
+    CircuitBreaker,
+    CircuitOpenError,
+    LLMCallController,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(call_controller, "time", clock)
+    return clock
+
+
+def test_concurrency_grows_on_success_up_to_the_maximum(clock):
+    concurrency = AdaptiveConcurrency(initial=4, minimum=1, maximum=5)
+
+    async def succeed(times: int) -> None:
+        for _ in range(times):
+            await concurrency.acquire()
+            await concurrency.release(succeeded=True)
+
+    asyncio.run(succeed(1))
+    assert concurrency.limit == pytest.approx(4.25)
+
+    asyncio.run(succeed(50))
+    assert concurrency.limit == 5
+    assert concurrency.in_flight == 0
+
+
+def test_concurrency_halves_on_rate_limit_down_to_the_minimum(clock):
+    concurrency = AdaptiveConcurrency(initial=8, minimum=3, maximum=8)
+
+    asyncio.run(concurrency.on_rate_limited(0))
+    assert concurrency.limit == 4
+
+    # A burst of 429s within the cooldown is one event
+    asyncio.run(concurrency.on_rate_limited(0))
+    assert concurrency.limit == 4
+
+    clock.now += DECREASE_COOLDOWN_SECONDS
+    asyncio.run(concurrency.on_rate_limited(0))
+    assert concurrency.limit == 3
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30)
+
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_breaker_lets_one_probe_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+
+    clock.now += 30
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    # Others are rejected while the probe is out
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_the_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_seconds=30)
+    for _ in range(5):
+        breaker.record_failure()
+
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    clock.now += 29
+    assert breaker.state == "open"
+    clock.now += 1
+    assert breaker.state == "half_open"
+
+
+def _controller(deadline_seconds: float) -> LLMCallController:
+    return LLMCallController(
+        concurrency=AdaptiveConcurrency(initial=4, minimum=1, maximum=4),
+        requests=TokenBucket(1_000, 1_000),
+        tokens=TokenBucket(1_000_000, 1_000_000),
+        breaker=CircuitBreaker(failure_threshold=1_000, reset_seconds=30),
+        max_retries=1_000,
+        deadline_seconds=deadline_seconds,
+        attempt_timeout=1.0,
+        backoff_base=0.01,
+        backoff_max=0.02,
+    )
+
+
+def test_retries_stop_at_the_deadline():
+    controller = _controller(deadline_seconds=0.2)
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        raise TimeoutError
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        asyncio.run(controller.run(flaky, estimated_tokens=1))
+
+    assert time.monotonic() - started < 0.5
+    assert attempts > 1
+    assert controller.stats.retries == attempts - 1
+
+
+def test_retry_after_past_the_deadline_is_not_waited_for():
+    controller = _controller(deadline_seconds=1.0)
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": "10"}, request=request)
+
+    async def rate_limited():
+        raise openai.RateLimitError("Rate limited", response=response, body=None)
+
+    started = time.monotonic()
+    with pytest.raises(openai.RateLimitError):
+        asyncio.run(controller.run(rate_limited, estimated_tokens=1))
+
+    assert time.monotonic() - started < 0.5
+    assert controller.stats.retries == 0
+    assert controller.stats.rate_limited == 1
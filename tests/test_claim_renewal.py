@@ -0,0 +1,43 @@
+import asyncio
+from datetime import timedelta
+
+from src.application.services import review_analysis_service as module
+from src.application.services.review_analysis_service import ReviewAnalysisService
+from src.infrastructure.repositories.review_repository import ReviewRepository
+
+
+class _Session:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+
+def test_claims_are_renewed_while_the_pipeline_runs(monkeypatch):
+    renewals = []
+
+    async def renew_claims(self, owner, lease):
+        renewals.append((owner, lease))
+        return 1
+
+    monkeypatch.setattr(module, "async_session_maker", _Session)
+    monkeypatch.setattr(ReviewRepository, "renew_claims", renew_claims)
+    lease = timedelta(seconds=0.03)
+    service = ReviewAnalysisService(None, None, None, claim_owner="worker-a", claim_lease=lease)
+
+    async def run():
+        async with service._renewing_claims():
+            await asyncio.sleep(0.1)
+        count = len(renewals)
+        await asyncio.sleep(0.05)
+        return count
+
+    count = asyncio.run(run())
+
+    assert count >= 2
+    assert len(renewals) == count
+    assert set(renewals) == {("worker-a", lease)}
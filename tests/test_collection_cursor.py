@@ -0,0 +1,107 @@
+import asyncio
+import re
+from datetime import UTC, datetime, timedelta
+
+import httpx
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.collectors.apple_store_collector import AppleStoreCollector
+from src.infrastructure.collectors.base import CollectedReview
+from src.infrastructure.collectors.rate_limiter import TokenBucket
+from src.infrastructure.repositories.cursor_repository import CursorRepository
+
+NEWEST = datetime(2025, 6, 1, tzinfo=UTC)
+PAGE_SIZE = 50
+
+
+def _entry(index: int) -> dict:
+    """The index-th newest review of the fake feed, one hour apart"""
+    return {
+        "id": {"label": f"r{index}"},
+        "title": {"label": f"Title {index}"},
+        "content": {"label": f"Review text {index}"},
+        "im:rating": {"label": "4"},
+        "author": {"name": {"label": "someone"}},
+        "updated": {"label": (NEWEST - timedelta(hours=index)).isoformat()},
+    }
+
+
+def _collector(total: int) -> AppleStoreCollector:
+    """Collector over a fake feed of ``total`` reviews, newest first"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(re.search(r"/page=(\d+)/", request.url.path).group(1))
+        start = (page - 1) * PAGE_SIZE
+        entries = [_entry(i) for i in range(start, min(start + PAGE_SIZE, total))]
+        return httpx.Response(200, json={"feed": {"entry": entries}})
+
+    collector = AppleStoreCollector(limiter=TokenBucket(1_000, 1_000))
+    collector._create_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return collector
+
+
+def test_run_cut_short_by_limit_is_not_exhausted():
+    # 120 reviews newer than the mark, but only 60 may be collected
+    since = NEWEST - timedelta(hours=120)
+
+    result = asyncio.run(_collector(200).collect_with_stats("1", limit=60, since=since))
+
+    assert len(result.reviews) == 60
+    assert not result.exhausted
+
+
+def test_run_reaching_the_mark_is_exhausted():
+    since = NEWEST - timedelta(hours=30)
+
+    result = asyncio.run(_collector(200).collect_with_stats("1", limit=60, since=since))
+
+    assert len(result.reviews) == 31
+    assert result.exhausted
+
+
+def test_run_reaching_the_feed_end_is_exhausted():
+    result = asyncio.run(_collector(40).collect_with_stats("1", limit=60))
+
+    assert len(result.reviews) == 40
+    assert result.exhausted
+
+
+class _CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+    async def commit(self):
+        pass
+
+
+def _advance_sql(exhausted: bool) -> str:
+    reviews = [
+        CollectedReview(
+            external_id=f"r{i}",
+            app_id="1",
+            title="",
+            text="",
+            rating=4,
+            author="",
+            date=NEWEST - timedelta(hours=i),
+        )
+        for i in range(60)
+    ]
+    session = _CapturingSession()
+    asyncio.run(CursorRepository(session).advance("apple_store", "1", "us", reviews, exhausted))
+    return str(session.statements[0].compile(dialect=postgresql.dialect()))
+
+
+def test_cut_short_run_only_advances_if_it_reached_the_mark():
+    where = _advance_sql(exhausted=False).split("WHERE", 1)[1]
+
+    assert "collection_cursors.last_review_date >= " in where
+
+
+def test_exhausted_run_advances_past_the_mark():
+    where = _advance_sql(exhausted=True).split("WHERE", 1)[1]
+
+    assert ">=" not in where
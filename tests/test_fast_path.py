@@ -0,0 +1,87 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.llm.base import (
+    ANALYSIS_SOURCE_FAST_PATH,
+    ANALYSIS_SOURCE_LLM,
+    LLMService,
+    ReviewAnalysisResult,
+    ReviewInput,
+)
+from src.infrastructure.llm.fast_path import FastPathLLMService
+from src.infrastructure.repositories.analysis_repository import AnalysisRepository
+
+CONFIDENT_TEXT = "I love it, works great and it is the best app"
+
+
+class _Result:
+    def all(self):
+        return []
+
+
+class _CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result()
+
+
+class _ModelStub(LLMService):
+    async def analyze_sentiment(self, text, rating):
+        return "negative"
+
+    async def extract_keywords(self, text):
+        return []
+
+    async def generate_insights(self, text, rating):
+        return []
+
+    async def analyze_review(self, text, rating):
+        return ReviewAnalysisResult(sentiment="negative")
+
+    async def analyze_batch(self, reviews):
+        return {r.review_id: ReviewAnalysisResult(sentiment="negative") for r in reviews}
+
+
+def test_results_record_who_labeled_them():
+    service = FastPathLLMService(_ModelStub(), threshold=0.85, sample_percent=0)
+    reviews = [
+        ReviewInput(review_id=1, text=CONFIDENT_TEXT, rating=5),
+        ReviewInput(review_id=2, text="Crashes every time I open it", rating=1),
+    ]
+
+    results = asyncio.run(service.analyze_batch(reviews))
+
+    assert results[1].source == ANALYSIS_SOURCE_FAST_PATH
+    assert results[2].source == ANALYSIS_SOURCE_LLM
+
+
+def test_reviews_in_the_evaluation_sample_always_go_to_the_model():
+    service = FastPathLLMService(_ModelStub(), threshold=0.85, sample_percent=2)
+    reviews = [
+        ReviewInput(review_id=review_id, text=CONFIDENT_TEXT, rating=5)
+        for review_id in (100, 101, 102, 205)
+    ]
+
+    results = asyncio.run(service.analyze_batch(reviews))
+
+    assert {review_id: r.source for review_id, r in results.items()} == {
+        100: ANALYSIS_SOURCE_LLM,
+        101: ANALYSIS_SOURCE_LLM,
+        102: ANALYSIS_SOURCE_FAST_PATH,
+        205: ANALYSIS_SOURCE_FAST_PATH,
+    }
+
+
+def test_labeled_reviews_are_the_sampled_llm_labeled_representatives():
+    session = _CapturingSession()
+
+    asyncio.run(AnalysisRepository(session).get_labeled_reviews())
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "review_analysis.source = %(source_1)s" in sql
+    assert "reviews.duplicate_of IS NULL" in sql
+    assert "reviews.id %% %(id_1)s::INTEGER < %(param_1)s::INTEGER" in sql
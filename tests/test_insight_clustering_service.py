@@ -0,0 +1,54 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from src.application.services import insight_clustering_service as module
+from src.application.services.insight_clustering_service import InsightClusteringService
+
+
+class _Session:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _patch(monkeypatch, locked: bool, unclustered_after_unlock: list[bool]):
+    runs = []
+
+    @asynccontextmanager
+    async def app_lock(app_id):
+        yield not locked
+
+    async def cluster(self, app_id, rebuild):
+        runs.append(rebuild)
+        return 2
+
+    class _Repo:
+        def __init__(self, session):
+            pass
+
+        async def has_unclustered(self, app_id):
+            return unclustered_after_unlock.pop(0)
+
+    monkeypatch.setattr(module, "_app_lock", app_lock)
+    monkeypatch.setattr(module, "async_session_maker", _Session)
+    monkeypatch.setattr(module, "InsightClusterRepository", _Repo)
+    monkeypatch.setattr(InsightClusteringService, "_cluster", cluster)
+    return runs
+
+
+def test_lock_holder_goes_again_for_insights_left_by_a_skipped_run(monkeypatch):
+    runs = _patch(monkeypatch, locked=False, unclustered_after_unlock=[True, False])
+
+    clustered = asyncio.run(InsightClusteringService().cluster_app("123", rebuild=True))
+
+    assert clustered == 4
+    assert runs == [True, False]
+
+
+def test_run_finding_the_app_locked_is_skipped(monkeypatch):
+    runs = _patch(monkeypatch, locked=True, unclustered_after_unlock=[])
+
+    assert asyncio.run(InsightClusteringService().cluster_app("123")) == 0
+    assert runs == []
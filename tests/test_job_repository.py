@@ -0,0 +1,57 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.database.models import AnalysisJob
+from src.infrastructure.repositories.job_repository import JobRepository
+
+
+class _Result:
+    def __init__(self, job):
+        self.job = job
+
+    def scalar_one_or_none(self):
+        return self.job
+
+
+class _Session:
+    """Answers the n-th statement with the n-th job"""
+
+    def __init__(self, *jobs):
+        self.jobs = list(jobs)
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.jobs.pop(0))
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_enqueue_inserts_only_when_no_job_is_active():
+    job = AnalysisJob(id=1, app_id="123", status="queued")
+    session = _Session(job)
+
+    assert asyncio.run(JobRepository(session).enqueue("123", total_reviews=5)) is job
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (app_id) WHERE status IN" in sql
+    assert "DO NOTHING RETURNING" in sql
+    assert session.commits == 1
+
+
+def test_enqueue_returns_the_active_job_on_conflict():
+    active = AnalysisJob(id=7, app_id="123", status="running")
+    session = _Session(None, active)
+
+    assert asyncio.run(JobRepository(session).enqueue("123", total_reviews=5)) is active
+
+
+def test_enqueue_inserts_again_if_the_active_job_finished_meanwhile():
+    job = AnalysisJob(id=8, app_id="123", status="queued")
+    session = _Session(None, None, job)
+
+    assert asyncio.run(JobRepository(session).enqueue("123", total_reviews=5)) is job
+    assert len(session.statements) == 3
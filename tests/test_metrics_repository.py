@@ -0,0 +1,37 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.llm.base import ReviewAnalysisResult
+from src.infrastructure.repositories.metrics_repository import MetricsDelta, MetricsRepository
+
+
+class _CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+def test_apply_upserts_terms_into_their_own_table():
+    delta = MetricsDelta.for_analysis(
+        {
+            1: ReviewAnalysisResult("negative", keywords=["crash", "login"], insights=["Fix"]),
+            2: ReviewAnalysisResult("negative", keywords=["crash"]),
+        },
+        inserted={1, 2},
+    )
+    session = _CapturingSession()
+
+    asyncio.run(MetricsRepository(session).apply("1", delta))
+
+    metrics_sql, terms_sql = (
+        str(s.compile(dialect=postgresql.dialect())) for s in session.statements
+    )
+    assert "keyword_counts" not in metrics_sql
+    assert "INSERT INTO app_term_counts" in terms_sql
+    assert "count = (app_term_counts.count + excluded.count)" in terms_sql
+    rows = session.statements[1].compile().params
+    assert [rows[f"term_m{i}"] for i in range(3)] == ["Fix", "crash", "login"]
+    assert [rows[f"count_m{i}"] for i in range(3)] == [1, 2, 1]
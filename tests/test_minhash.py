@@ -0,0 +1,66 @@
+import asyncio
+
+from src.infrastructure.repositories.duplicate_repository import (
+    DuplicateRepository,
+    IndexedReview,
+)
+from src.infrastructure.text_processing.minhash import MinHasher
+
+TEXT = "The app crashes every time I try to upload a photo from my gallery"
+NEAR_COPY = "The app crashes every time I try to upload a photo from my gallery!!"
+UNRELATED = "Lovely design and the dark mode is easy on the eyes at night"
+
+
+def test_signatures_are_deterministic_across_instances():
+    first, second = MinHasher(), MinHasher()
+
+    signature = first.signature(TEXT)
+
+    assert signature == second.signature(TEXT)
+    assert first.band_hashes(signature) == second.band_hashes(signature)
+    assert MinHasher(seed=2).signature(TEXT) != signature
+
+
+def test_near_copies_are_similar_and_unrelated_text_is_not():
+    hasher = MinHasher()
+    signature = hasher.signature(TEXT)
+
+    assert MinHasher.similarity(signature, hasher.signature(NEAR_COPY)) == 1.0
+    assert MinHasher.similarity(signature, hasher.signature(UNRELATED)) < 0.2
+
+
+class _CapturingSession:
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, stmt, params=None):
+        self.calls.append((stmt, params))
+
+
+def test_duplicates_attach_only_to_representatives_with_the_same_rating(monkeypatch):
+    async def no_representatives(self, app_id, keys):
+        return {}
+
+    monkeypatch.setattr(DuplicateRepository, "_find_representatives", no_representatives)
+    session = _CapturingSession()
+    reviews = [
+        IndexedReview(id=1, app_id="123", rating=1, text=TEXT),
+        IndexedReview(id=2, app_id="123", rating=5, text=NEAR_COPY),
+        IndexedReview(id=3, app_id="123", rating=1, text=NEAR_COPY),
+    ]
+
+    duplicates = asyncio.run(
+        DuplicateRepository(session, hasher=MinHasher(), threshold=0.8).index_reviews(reviews)
+    )
+
+    assert duplicates == 1
+    (_, updates), *band_inserts = session.calls
+    assert {u["id"]: u["duplicate_of"] for u in updates} == {1: None, 2: None, 3: 1}
+    # Only representatives are indexed; duplicates are never looked up
+    band_review_ids = {
+        value
+        for stmt, _ in band_inserts
+        for key, value in stmt.compile().params.items()
+        if key.startswith("review_id")
+    }
+    assert band_review_ids == {1, 2}
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from src.infrastructure.llm.base import ReviewInput
+from src.infrastructure.llm.fake_openai_server import create_app
+from src.infrastructure.llm.openai_batch_service import OpenAIBatchService
+
+REVIEWS = [
+    ReviewInput(review_id=1, text="Crashes every time I upload a photo", rating=1),
+    ReviewInput(review_id=2, text="I love it, works great and it is the best app", rating=5),
+    ReviewInput(review_id=3, text="Login is broken since the update", rating=1),
+]
+
+
+def _service(app) -> OpenAIBatchService:
+    service = OpenAIBatchService(group_size=2, poll_interval=0.01, timeout_seconds=5)
+    service.client = AsyncOpenAI(
+        api_key="test",
+        base_url="http://fake/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
+    return service
+
+
+def test_batch_flow_against_the_fake_server():
+    app = create_app(batch_delay=0, failing_custom_ids=frozenset({"g1"}))
+    fake = app.state.fake
+    uploads = []
+    add_file = fake.add_file
+
+    def record_upload(filename, purpose, data):
+        uploads.append((purpose, data))
+        return add_file(filename, purpose, data)
+
+    fake.add_file = record_upload
+
+    results = asyncio.run(_service(app).analyze_batch(REVIEWS))
+
+    # One JSONL line per group of two reviews
+    purpose, data = uploads[0]
+    lines = [json.loads(line) for line in data.decode().splitlines()]
+    assert purpose == "batch"
+    assert [line["custom_id"] for line in lines] == ["g0", "g1"]
+    assert {line["url"] for line in lines} == {"/v1/chat/completions"}
+
+    (batch,) = fake.batches.values()
+    assert batch.status == "completed"
+    assert batch.request_counts == {"total": 2, "completed": 1, "failed": 1}
+
+    # The errored group is left unanalyzed for the next run
+    assert set(results) == {1, 2}
+    assert results[1].sentiment == "negative"
+    assert results[1].keywords
+    assert results[2].sentiment == "positive"
+
+    # Input and output files are deleted once the results are read
+    assert fake.files == {}
+
+
+def test_a_batch_that_never_finishes_is_cancelled():
+    app = create_app(batch_delay=60)
+    service = _service(app)
+    service.timeout_seconds = 0.05
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(service.analyze_batch(REVIEWS[:1]))
+
+    fake = app.state.fake
+    (batch,) = fake.batches.values()
+    assert batch.status == "cancelled"
+    assert fake.files == {}
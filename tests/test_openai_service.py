@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.llm import InvalidLLMResponseError, OpenAIService, ReviewInput
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """OpenAIService whose model always refuses (empty JSON)"""
+    service = OpenAIService()
+
+    async def refuse(*args, **kwargs):
+        return {}
+
+    monkeypatch.setattr(service, "_call_openai_json", refuse)
+    return service
+
+
+def test_analyze_review_raises_on_unusable_output(service):
+    with pytest.raises(InvalidLLMResponseError):
+        asyncio.run(service.analyze_review("It crashes on launch", 1))
+
+
+def test_analyze_batch_leaves_out_unusable_reviews(service):
+    reviews = [ReviewInput(review_id=1, text="It crashes on launch", rating=1)]
+
+    assert asyncio.run(service.analyze_batch(reviews)) == {}
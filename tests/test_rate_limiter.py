@@ -0,0 +1,12 @@
+from src.infrastructure.collectors.apple_store_collector import (
+    AppleStoreCollector,
+    AppleStoreConfig,
+)
+
+
+def test_collectors_share_one_limiter_per_host():
+    first, second = AppleStoreCollector(), AppleStoreCollector()
+    other_host = AppleStoreCollector(AppleStoreConfig(base_url="https://example.test"))
+
+    assert first.limiter is second.limiter
+    assert other_host.limiter is not first.limiter
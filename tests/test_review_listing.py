@@ -0,0 +1,75 @@
+import base64
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from src.infrastructure.repositories.review_repository import ReviewRepository
+
+URL = "/api/v1/reviews/apple-store"
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Records the arguments of ReviewRepository.get_page and .search"""
+    calls: dict = {}
+
+    async def get_page(self, app_id, fields, limit, filters=None, before=None):
+        calls["get_page"] = {"filters": filters, "before": before}
+        return [{"id": 1, "rating": 5, "date": datetime(2025, 1, 1, tzinfo=UTC)}]
+
+    async def search(self, query, limit, app_id=None, filters=None, before=None):
+        calls["search"] = {"filters": filters, "before": before}
+        return []
+
+    monkeypatch.setattr(ReviewRepository, "get_page", get_page)
+    monkeypatch.setattr(ReviewRepository, "search", search)
+    return calls
+
+
+def _cursor(values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def test_list_filters_by_several_ratings(client, captured):
+    response = client.get(URL, params={"app_id": "1", "fields": "id,rating", "rating": [5, 1]})
+
+    assert response.status_code == 200
+    assert response.json()["reviews"] == [{"id": 1, "rating": 5}]
+    assert captured["get_page"]["filters"].ratings == [5, 1]
+
+
+def test_list_rejects_out_of_range_rating(client, captured):
+    response = client.get(URL, params={"app_id": "1", "rating": 9})
+
+    assert response.status_code == 422
+    assert "get_page" not in captured
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", _cursor({}), _cursor([]), _cursor(["x", 1])])
+def test_list_rejects_malformed_cursor(client, captured, cursor):
+    response = client.get(URL, params={"app_id": "1", "cursor": cursor})
+
+    assert response.status_code == 400
+
+
+def test_list_accepts_its_own_cursor(client, captured):
+    cursor = _cursor(["2025-01-01T00:00:00+00:00", 7])
+
+    response = client.get(URL, params={"app_id": "1", "fields": "id", "cursor": cursor})
+
+    assert response.status_code == 200
+    assert captured["get_page"]["before"] == (datetime(2025, 1, 1, tzinfo=UTC), 7)
+
+
+def test_search_filters_by_rating(client, captured):
+    response = client.get(f"{URL}/search", params={"q": "crash", "rating": [1, 2]})
+
+    assert response.status_code == 200
+    assert captured["search"]["filters"].ratings == [1, 2]
+
+
+def test_search_rejects_out_of_range_rating(client, captured):
+    response = client.get(f"{URL}/search", params={"q": "crash", "rating": 0})
+
+    assert response.status_code == 422
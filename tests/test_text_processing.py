@@ -0,0 +1,29 @@
+import pytest
+
+from src.infrastructure.llm.local_sentiment import LexiconSentimentClassifier
+from src.infrastructure.text_processing import TextProcessor
+
+
+@pytest.mark.parametrize(
+    ("text", "language"),
+    [
+        ("The latest update broke login and it is not fixed", "en"),
+        ("Muy buena aplicación, pero la sincronización no funciona con el reloj", "es"),
+        ("Die App stürzt ständig ab, seit dem Update ist sie nicht mehr nutzbar", "de"),
+        ("Приложение постоянно вылетает после обновления", "ru"),
+        ("アップデート後にアプリが起動しません", "ja"),
+        ("Great!!", "und"),
+    ],
+)
+def test_detect_language(text, language):
+    assert TextProcessor.detect_language(text) == language
+
+
+def test_lexicon_classifier_never_settles_other_languages():
+    classifier = LexiconSentimentClassifier()
+
+    english = classifier.classify("I love it, works great and it is the best app", 5)
+    spanish = classifier.classify("Me encanta, es la mejor aplicación que tengo", 5)
+
+    assert english.confidence > 0.85
+    assert spanish.confidence == 0.0